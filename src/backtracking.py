@@ -2,7 +2,18 @@ from __future__ import annotations  # Ensures compatibility with type hints for
 import pygame  # Imports Pygame for graphical interface and event handling
 import time  # Imports time for measuring execution time
 import abc  # Imports abc for defining abstract base classes
-from src.utils.tablero import Board, BoardPosition, Piece, SQ_SIZE  # Imports required classes and constants
+from src.utils.tablero import Board, BoardPosition, Piece, tile_size_for  # Imports required classes and constants
+from src.utils.step_stream import DONE, PLACE, StepEvent, iter_backtracking_steps  # Imports the solver step stream
+from array import array  # Imports array for the compact path of square indices
+from collections import deque  # Imports deque for the bounded step history
+from typing import Iterable, Iterator  # Imports Iterable and Iterator for the step stream type hints
+
+FPS = 60  # Frames per second of the drawing loop
+DEFAULT_SPEED = 2.5  # Steps per second at start (one step every 400 ms)
+MIN_SPEED = 0.25  # Slowest speed reachable with the arrow keys
+MAX_SPEED = 60_000.0  # Fastest speed (many steps are applied per drawn frame)
+MAX_STEPS_PER_FRAME = 1000  # Caps the work done between two frames
+HISTORY_LIMIT = 100_000  # Steps that can be undone with step-back
 
 def isSafe(x: int, y: int, board: list[list[int]], size: int) -> bool:
     '''
@@ -22,77 +33,52 @@ def printSolution(n: int, board: list[list[int]]) -> None:
 def solveKT(n: int, bkalg: BacktrackingAlgorithm) -> None:
     '''
         This function solves the Knight Tour problem using 
-        Backtracking. This function mainly uses solveKTUtil() 
-        to solve the problem. It returns false if no complete 
-        tour is possible, otherwise return true and prints the 
-        tour. 
+        Backtracking. The search runs as a lazy stream of steps
+        (see iter_backtracking_steps) that is drawn while it happens,
+        including the backtracking moves.
         Please note that there may be more than one solutions, 
-        this function prints one of the feasible solutions.
+        this function shows one of the feasible solutions.
     '''
     start_time = time.time()  # Records the start time
 
-    board = [[-1 for _ in range(n)] for _ in range(n)]  # Initializes the board with -1 (unvisited)
-    move_x = [2, 1, -1, -2, -2, -1, 1, 2]  # Potential knight moves in x-direction
-    move_y = [1, 2, 2, 1, -1, -2, -2, -1]  # Potential knight moves in y-direction
-
-    x_position, y_position = bkalg._piece.position  # Gets the starting position of the knight
-    board[x_position][y_position] = 0  # Marks the starting position as visited
-
-    bkalg.path.append((x_position, y_position))  # Adds starting position to the path
-    pos = 1  # Initializes the move count
-
-    if not solveKTUtil(n, board, x_position, y_position, move_x, move_y, pos, bkalg):
+    steps = iter_backtracking_steps(n, bkalg._piece.position, bkalg.blocked, bkalg.target)  # Lazy stream of placements and backtracks
+    if not bkalg.play(steps):  # Draws every step as the search produces it
         print("Solution does not exist")  # Prints message if no solution is found
         raise SystemExit
     else:
-        printSolution(n, board)  # Prints the solution
-        
+        printSolution(n, bkalg._board.matrix)  # Prints the solution
         print(f"--- {time.time() - start_time} seconds ---")  # Displays the execution time
 
-        # Starts Pygame display of the solution path
-        for pos, step in enumerate(bkalg.path):
-            bkalg.check_events()  # Checks for any Pygame events
-            bkalg.move_piece(position=step, pos=pos)  # Moves the piece to the next step in the solution
-
-def solveKTUtil(n: int, board: list[list[int]], curr_x: int, curr_y: int, move_x: list[int], move_y: list[int], pos: int, bkalg: BacktrackingAlgorithm) -> bool:
-    '''
-        A recursive utility function to solve Knight Tour problem using 
-        Branch and Bound with Warnsdorff's heuristic.
-    '''
-    if pos == n**2:  # If all squares are visited, the tour is complete
-        return True
-
-    # Tries all possible moves for the knight from the current position
-    for i in range(8):
-        new_x = curr_x + move_x[i]
-        new_y = curr_y + move_y[i]
-        
-        if isSafe(new_x, new_y, board, n):  # Checks if the move is valid
-            board[new_x][new_y] = pos  # Marks the cell as visited
-            bkalg.path.append((new_x, new_y))  # Adds move to path
-
-            if solveKTUtil(n, board, new_x, new_y, move_x, move_y, pos + 1, bkalg):  # Recursive call for next move
-                return True
-
-            # Backtracks if no solution is found
-            board[new_x][new_y] = -1  # Unmarks the cell
-            bkalg.path.pop()  # Removes the move from the path
-
-    return False
+class ResetRequested(Exception):
+    """Raised from the event loop when the user presses 'r' while a search is being drawn."""
 
 class AbstractAlgorithm(abc.ABC):
     _board: Board
     _piece: Piece
+    _size: int
+    path: array  # Current path as square indices (x * size + y)
     _win: pygame.display
     pause: bool = False
     loop: bool = True
+    blocked: tuple[BoardPosition, ...] = ()
+    target: BoardPosition | None = None
+    speed: float = DEFAULT_SPEED  # Steps drawn per second
+    _history: deque[StepEvent] | None = None  # Steps already drawn, for stepping back
+    _redo: list[StepEvent] | None = None  # Steps undone with step-back, replayed before pulling new ones
+    _steps: Iterator[StepEvent] | None = None  # Stream currently being drawn
+    _done: StepEvent | None = None  # DONE event of the finished stream
 
     def run(self) -> None:
-        """Runs the algorithm continuously until the user presses 'r' to reset."""
+        """Runs the algorithm, then sleeps on the event queue until the user resets or quits."""
         while True:
             if self.loop:
-                self._run()
-            if self.check_events():
+                try:
+                    self._run()
+                except ResetRequested:
+                    self._reset()
+                    continue
+            self._update_caption()
+            if self._handle_event(pygame.event.wait()):  # Blocks without using CPU while idle
                 self._reset()
 
     def move_piece(self, position: BoardPosition, pos: int) -> None:
@@ -103,12 +89,98 @@ class AbstractAlgorithm(abc.ABC):
         """
         self._board.piece.move(position)  # Updates the piece's position
         self._board.update(pos=pos)  # Updates the board display
-        pygame.time.wait(400)  # Adds delay for visualization
+
+    def play(self, steps: Iterable[StepEvent]) -> bool:
+        """Draws a stream of solver steps as they are produced, paced by a frame clock.
+
+        Args:
+            steps (Iterable[StepEvent]): Placement, backtrack and done events.
+
+        Returns:
+            bool: True if the stream ended with a complete tour.
+        """
+        self._steps = iter(steps)  # Pulled one step at a time, never buffered
+        self._history = deque(maxlen=HISTORY_LIMIT)  # Bounded, so long searches keep constant memory
+        self._redo = []  # Nothing undone yet
+        self._done = None  # The stream has not finished
+        clock = pygame.time.Clock()  # Limits the loop to FPS frames per second
+        budget = 0.0  # Fraction of a step accumulated between frames
+        while True:
+            if self.check_events():  # Handles keys without blocking
+                raise ResetRequested
+            if self.pause:
+                self._update_caption()  # Shows the paused state
+                if self._handle_event(pygame.event.wait()):  # Sleeps until the next event while paused
+                    raise ResetRequested
+                clock.tick()  # Forgets the time spent paused
+                budget = 0.0
+                continue
+            budget += clock.tick(FPS) * self.speed / 1000  # Sleeps until the next frame
+            for _ in range(min(int(budget), MAX_STEPS_PER_FRAME)):
+                done = self._step_forward(draw=False)  # Applies the steps due in this frame
+                if done is not None:
+                    self._draw()  # Shows the final state
+                    return done.pos >= 0
+            if budget >= 1:
+                budget -= int(budget)  # Drops the steps that did not fit in the frame
+                self._draw()  # Draws once per frame, however many steps were applied
+
+    def _apply(self, step: StepEvent, undo: bool = False) -> None:
+        """Applies a placement or backtrack to the path and the board (or reverts it)."""
+        placing = (step.kind == PLACE) != undo  # Undoing a backtrack places the square again
+        if placing:
+            self.path.append(step.x * self._size + step.y)  # Keeps the current path as flat square indices
+            self._board.place((step.x, step.y), step.pos)  # Marks the square with its move number
+        else:
+            self.path.pop()  # Removes the abandoned square
+            self._board.clear((step.x, step.y))  # Frees the square on the display board
+            self._board.place(divmod(self.path[-1], self._size), len(self.path) - 1)  # Moves the piece back
+
+    def _step_forward(self, draw: bool = True) -> StepEvent | None:
+        """Redoes an undone step, or pulls the next one from the stream.
+
+        Returns:
+            StepEvent | None: The DONE event when the stream has finished.
+        """
+        if self._redo:
+            step = self._redo.pop()  # Replays what step-back undid
+        else:
+            if self._steps is None:
+                return self._done  # The stream is exhausted
+            step = next(self._steps, StepEvent(DONE, -1, -1, -1))
+            if step.kind == DONE:
+                self._steps, self._done = None, step  # Remembers how the stream ended
+                return step
+        self._apply(step)
+        self._history.append(step)  # Remembers the step for step-back
+        if draw:
+            self._draw()
+        return None
+
+    def _step_back(self) -> None:
+        """Reverts the last drawn step (the start square is never removed)."""
+        if not self._history or (self._history[-1].kind == PLACE and len(self.path) <= 1):
+            return
+        step = self._history.pop()
+        self._apply(step, undo=True)
+        self._redo.append(step)  # Step-forward replays it before pulling new steps
+        self._draw()
+
+    def _draw(self) -> None:
+        """Redraws the board and the window caption."""
+        self._board.draw()
+        self._update_caption()
+
+    def _update_caption(self) -> None:
+        state = "paused" if self.pause else ("finished" if self._steps is None and not self._redo else "running")
+        pygame.display.set_caption(f"Chess backtracking TPO - {state} - {self.speed:g} steps/s")
 
     def _reset(self) -> None:
         """Resets the board and the piece to their initial state."""
         self._piece.reset_position()  # Resets piece to starting position
-        self._board = Board(parent=self._win, piece=self._piece, size=self._board._size, with_legend=True)  # Reinitializes board
+        self._board = Board(parent=self._win, piece=self._piece, size=self._board._size, with_legend=True, blocked=self.blocked, target=self.target, tile_size=self._board.tile_size)  # Reinitializes board
+        self._history, self._redo, self._steps, self._done = None, None, None, None  # Forgets the previous stream
+        self.pause = False  # A reset always starts running
         self.loop = True  # Sets loop flag to true
 
     @abc.abstractmethod
@@ -117,35 +189,59 @@ class AbstractAlgorithm(abc.ABC):
         raise NotImplementedError
 
     def check_events(self) -> bool:
-        """Checks for Pygame events (key presses or window close)."""
+        """Handles the pending Pygame events without blocking.
+
+        Returns:
+            bool: True if the user asked for a reset.
+        """
+        reset = False
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                raise SystemExit
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    raise SystemExit
-                if event.key == pygame.K_r:
-                    self._reset()
-                    return True
-                if event.key == pygame.K_p:
-                    self.pause = not self.pause
-                    while self.pause:
-                        self.check_events()
+            reset = self._handle_event(event) or reset
+        return reset
+
+    def _handle_event(self, event: pygame.event.Event) -> bool:
+        """Handles one event: quit, reset, pause, step forward/back and speed.
+
+        Returns:
+            bool: True if the user asked for a reset.
+        """
+        if event.type == pygame.QUIT:
+            raise SystemExit
+        if event.type != pygame.KEYDOWN:
+            return False
+        if event.key == pygame.K_ESCAPE:
+            raise SystemExit
+        if event.key == pygame.K_r:
+            return True
+        if event.key in (pygame.K_p, pygame.K_SPACE):
+            self.pause = not self.pause
+        elif event.key == pygame.K_RIGHT and (self.pause or not self.loop):
+            self._step_forward()  # Single step while paused or after the search finished
+        elif event.key == pygame.K_LEFT and (self.pause or not self.loop):
+            self._step_back()
+        elif event.key in (pygame.K_UP, pygame.K_PLUS, pygame.K_KP_PLUS):
+            self.speed = min(self.speed * 2, MAX_SPEED)
+        elif event.key in (pygame.K_DOWN, pygame.K_MINUS, pygame.K_KP_MINUS):
+            self.speed = max(self.speed / 2, MIN_SPEED)
+        self._update_caption()
         return False
 
 class BacktrackingAlgorithm(AbstractAlgorithm):
 
-    def __init__(self, piece: Piece, size: int = 8) -> None:
+    def __init__(self, piece: Piece, size: int = 8, blocked: tuple[BoardPosition, ...] = (), target: BoardPosition | None = None) -> None:
         self._piece = piece  # Sets the piece for the algorithm
         self._size = size  # Sets the board size
-        self._win = pygame.display.set_mode((size * SQ_SIZE, size * SQ_SIZE))  # Initializes Pygame display
-        self._board = Board(size=self._size, parent=self._win, piece=self._piece, with_legend=True)  # Initializes board with legend
-        self.path = list()  # Initializes path to store move sequence
+        self.blocked = tuple(blocked)  # Sets the squares the knight cannot visit
+        self.target = target  # Sets the square where the tour must end
+        tile = tile_size_for(size)  # Largest tile size that fits the screen
+        self._win = pygame.display.set_mode((size * tile, size * tile))  # Initializes Pygame display
+        self._board = Board(size=self._size, parent=self._win, piece=self._piece, with_legend=True, blocked=self.blocked, target=self.target, tile_size=tile)  # Initializes board with legend
+        self.path = array("I")  # Initializes path to store move sequence (square indices, 4 bytes each)
         
     def _run(self) -> None:
         solveKT(n=self._size, bkalg=self)  # Starts the knight's tour algorithm
         self.loop = False  # Stops loop after solving the problem
 
     def _reset(self) -> None:
-        self.path = list()  # Clears path
+        self.path = array("I")  # Clears path
         super()._reset()  # Calls parent reset method
\ No newline at end of file
@@ -2,8 +2,13 @@ from src.utils.game import Game,GameInput
 from src.utils.tablero import Piece
 from src.backtracking import BacktrackingAlgorithm
 from src.branch_bound import BNBAlgorithm
+from src.sat import SATAlgorithm
+from src.portfolio import PortfolioAlgorithm
+from src.utils.difficulty import DifficultyModel
 from pathlib import Path
 
+GUI_BUDGET = 60  # Segundos de búsqueda aceptables antes de sugerir otro algoritmo
+
 if __name__ == "__main__":
 
     # Inicializar Pygame y mostrar la pantalla de entrada
@@ -11,6 +16,16 @@ if __name__ == "__main__":
     size, x, y, opt = input_screen.run()
 
     piece = Piece(start_pos=(x,y), image_path=Path("src/utils/knight_white.png"))
-    algorithm = BacktrackingAlgorithm(piece=piece, size=size) if opt == 1 else BNBAlgorithm(piece=piece, size=size)
+    algorithms = {1: BacktrackingAlgorithm, 2: BNBAlgorithm, 3: SATAlgorithm, 4: PortfolioAlgorithm}
+    names = {1: "backtracking", 2: "bnb", 3: "sat", 4: "portfolio"}
+
+    # Si el historial de corridas indica que la casilla es muy costosa para el algoritmo elegido, se cambia
+    recommendation = DifficultyModel().recommend(names.get(opt, "bnb"), size, x, y, GUI_BUDGET, choices=names.values())  # Solo algoritmos del menu
+    if recommendation is not None:
+        alternative, estimate = recommendation
+        print(f"Atención: se estiman {estimate:.0f} segundos para ({x}, {y}) con {names[opt]}; se usa {alternative}")
+        opt = {name: key for key, name in names.items()}[alternative]
+
+    algorithm = algorithms.get(opt, BNBAlgorithm)(piece=piece, size=size)
     game = Game(algorithm=algorithm)
     game.run()
\ No newline at end of file
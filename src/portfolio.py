@@ -0,0 +1,47 @@
+from __future__ import annotations  # Ensures compatibility with type hints for future versions of Python
+from array import array  # Imports array for the compact path of square indices
+import pygame  # Imports Pygame for graphical interface and event handling
+from src.backtracking import AbstractAlgorithm, printSolution  # Imports the base algorithm class and helpers
+from src.utils.portfolio import PortfolioStats, solveKT_portfolio  # Imports the strategy race
+from src.utils.tablero import Board, BoardPosition, Piece, tile_size_for  # Imports required classes and constants
+from src.utils.tour_format import board_to_path  # Imports the board to path conversion
+from src.utils.step_stream import iter_path_steps  # Imports the step stream for known paths
+
+PORTFOLIO_TIMEOUT = 300  # Maximum seconds the race may last
+
+def solveKT(n: int, bkalg: PortfolioAlgorithm) -> None:
+    '''
+        Races every strategy (backtracking, Branch and Bound, Warnsdorff and
+        randomised restarts) on the instance and draws the first tour found.
+    '''
+    x_position, y_position = bkalg._piece.position  # Gets the starting position of the knight
+    result = solveKT_portfolio(n, x_position, y_position, PORTFOLIO_TIMEOUT, blocked=bkalg.blocked, target=bkalg.target, stats=PortfolioStats())
+
+    if not result["Solution Found"]:
+        print("No solution found before the timeout")
+        raise SystemExit
+
+    printSolution(n, result["Final Board"])  # Prints the solution
+    print(f"--- {result['Execution Time']} seconds ({result['Strategy']}) ---")  # Displays the time to the first tour and the winner
+
+    bkalg.play(iter_path_steps(board_to_path(result["Final Board"])))  # Draws the tour found by the winning strategy
+
+class PortfolioAlgorithm(AbstractAlgorithm):
+
+    def __init__(self, piece: Piece, size: int = 8, blocked: tuple[BoardPosition, ...] = (), target: BoardPosition | None = None) -> None:
+        self._piece = piece  # Sets the piece for the algorithm
+        self._size = size  # Sets the board size
+        self.blocked = tuple(blocked)  # Sets the squares the knight cannot visit
+        self.target = target  # Sets the square where the tour must end
+        tile = tile_size_for(size)  # Largest tile size that fits the screen
+        self._win = pygame.display.set_mode((size * tile, size * tile))  # Initializes Pygame display
+        self._board = Board(size=self._size, parent=self._win, piece=self._piece, with_legend=True, blocked=self.blocked, target=self.target, tile_size=tile)  # Initializes board with legend
+        self.path = array("I")  # Initializes path to store move sequence
+
+    def _run(self) -> None:
+        solveKT(n=self._size, bkalg=self)  # Starts the strategy race
+        self.loop = False  # Stops loop after solving the problem
+
+    def _reset(self) -> None:
+        self.path = array("I")  # Clears path
+        super()._reset()  # Calls parent reset method
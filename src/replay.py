@@ -0,0 +1,140 @@
+from __future__ import annotations  # Ensures compatibility with type hints for future versions of Python
+import argparse  # Imports argparse for the command line interface
+import pygame  # Imports Pygame for graphical interface and event handling
+import numpy as np  # Imports NumPy to compare board states
+from pathlib import Path  # Imports Path for the piece image
+import src.utils.game  # Initializes Pygame (game must be imported before tablero)
+from src.utils.tablero import Board, Piece, tile_size_for  # Imports the board and piece drawing classes
+from src.utils.board_mask import BLOCKED  # Imports the blocked square marker
+from src.utils.step_stream import iter_backtracking_steps, iter_bnb_steps  # Imports the solver step streams
+from src.utils.trace import Trace, record_trace  # Imports the trace recorder and reader
+
+BAR_HEIGHT = 40  # Height of the scrub bar below the board
+FPS = 60  # Frames per second while auto-playing
+PIECE_IMAGE = Path(__file__).parent / "utils" / "knight_white.png"  # Image used for the knight
+STREAMS = {"backtracking": iter_backtracking_steps, "bnb": iter_bnb_steps}  # Recordable solvers
+
+class TraceViewer:
+    """Replays a recorded search trace, jumping to any step through its keyframes."""
+
+    def __init__(self, trace: Trace) -> None:
+        self._trace = trace  # Memory-mapped trace being viewed
+        n = trace.n  # Board size
+        self._tile = tile_size_for(n, reserved=(0, BAR_HEIGHT))  # Largest tile size that fits the screen with the bar
+        self._win = pygame.display.set_mode((n * self._tile, n * self._tile + BAR_HEIGHT))  # Board plus scrub bar
+        pygame.display.set_caption("Chess backtracking TPO - replay")  # Sets the window title
+        self._font = pygame.font.Font(None, 24)  # Font for the step counter
+        self._current = trace.board_at(0)  # Board state on screen
+        blocked = tuple(divmod(int(square), n) for square in np.flatnonzero(self._current == BLOCKED))  # Blocked squares of the trace
+        start = trace.piece_at(trace.board_at(1)) or (0, 0)  # First placed square
+        self._piece = Piece(image_path=PIECE_IMAGE, start_pos=start)  # Piece drawn on the board
+        self._board = Board(size=n, parent=self._win, piece=self._piece, with_legend=True, blocked=blocked, tile_size=self._tile)  # Board drawn tile by tile
+        self.step = 0  # Current step number
+        self.playing = False  # Auto-play flag
+        self.speed = 10.0  # Steps per second while auto-playing
+        self._board.set_matrix(self._current.tolist())  # Shows the initial state
+        self._board.draw()  # Draws the full board once
+        self._draw_bar()  # Draws the scrub bar
+
+    def seek(self, step: int) -> None:
+        """Jumps to a step and redraws only the squares that changed."""
+        step = min(max(step, 0), len(self._trace))  # Clamps to the trace
+        board = self._trace.board_at(step)  # Keyframe plus deltas
+        changed = {divmod(int(square), self._trace.n) for square in np.flatnonzero(board != self._current)}  # Tiles to redraw
+        old_position = self._piece.position  # Piece square before the jump
+        new_position = self._trace.piece_at(board) or old_position  # Deepest placed square
+        self._board.set_matrix(board.tolist())  # Updates the board state
+        self._piece.move(new_position)  # Moves the piece
+        if old_position != new_position:
+            changed |= {old_position, new_position}  # The piece squares change too
+        self._board.draw_tiles(changed)  # Redraws only the changed tiles
+        self._current = board  # Remembers the state on screen
+        self.step = step  # Updates the current step
+        self._draw_bar()  # Updates the counter and the bar
+
+    def _bar_rect(self) -> pygame.Rect:
+        return pygame.Rect(0, self._trace.n * self._tile, self._trace.n * self._tile, BAR_HEIGHT)  # Area below the board
+
+    def _draw_bar(self) -> None:
+        rect = self._bar_rect()  # Area of the scrub bar
+        self._win.fill((40, 40, 40), rect)  # Background
+        total = max(len(self._trace), 1)  # Avoids dividing by zero on empty traces
+        filled = rect.copy()  # Part of the bar already played
+        filled.width = int(rect.width * self.step / total)  # Proportional to the current step
+        self._win.fill((0, 130, 0), filled)  # Progress colour
+        state = "solved" if self._trace.solved else ("no solution" if self._trace.finished else "partial")  # Trace outcome
+        text = self._font.render(f"{self.step} / {len(self._trace)}  depth {int(np.count_nonzero(self._current >= 0))}  {state}", True, "white")  # Step counter
+        self._win.blit(text, text.get_rect(midleft=(10, rect.centery)))  # Draws the counter
+        pygame.display.update(rect)  # Flips only the bar
+
+    def _step_from_mouse(self, x: int) -> int:
+        return round(len(self._trace) * min(max(x / self._bar_rect().width, 0), 1))  # Bar position to step number
+
+    def run(self) -> None:
+        """Event loop: sleeps on the event queue unless auto-playing."""
+        clock = pygame.time.Clock()  # Paces auto-play
+        budget = 0.0  # Fraction of a step accumulated between frames
+        dragging = False  # True while the mouse drags the bar
+        while True:
+            events = pygame.event.get() if self.playing else [pygame.event.wait()]  # Blocks while idle
+            target = self.step  # Step to show after handling the events
+            for event in events:
+                if event.type == pygame.QUIT:
+                    return
+                if event.type == pygame.MOUSEBUTTONDOWN and self._bar_rect().collidepoint(event.pos):
+                    dragging = True  # Starts scrubbing
+                    target = self._step_from_mouse(event.pos[0])
+                elif event.type == pygame.MOUSEBUTTONUP:
+                    dragging = False  # Stops scrubbing
+                elif event.type == pygame.MOUSEMOTION and dragging:
+                    target = self._step_from_mouse(event.pos[0])  # Only the last motion of the batch is drawn
+                elif event.type == pygame.KEYDOWN:
+                    big = max(len(self._trace) // 100, 1)  # One percent of the trace
+                    if event.key == pygame.K_ESCAPE:
+                        return
+                    if event.key == pygame.K_SPACE:
+                        self.playing = not self.playing  # Toggles auto-play
+                        clock.tick()  # Forgets the time spent idle
+                    elif event.key == pygame.K_RIGHT:
+                        target += 1  # One step forward
+                    elif event.key == pygame.K_LEFT:
+                        target -= 1  # One step back
+                    elif event.key == pygame.K_PAGEUP:
+                        target += big  # One percent forward
+                    elif event.key == pygame.K_PAGEDOWN:
+                        target -= big  # One percent back
+                    elif event.key == pygame.K_HOME:
+                        target = 0  # Start of the trace
+                    elif event.key == pygame.K_END:
+                        target = len(self._trace)  # End of the trace
+                    elif event.key == pygame.K_UP:
+                        self.speed *= 2  # Faster auto-play
+                    elif event.key == pygame.K_DOWN:
+                        self.speed = max(self.speed / 2, 0.5)  # Slower auto-play
+            if self.playing:
+                budget += clock.tick(FPS) * self.speed / 1000  # Sleeps until the next frame
+                target += int(budget)  # Steps due in this frame
+                budget -= int(budget)
+                if target >= len(self._trace):
+                    self.playing = False  # Stops at the end
+            if target != self.step:
+                self.seek(target)  # Draws the new state
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay a recorded knight's tour search")
+    parser.add_argument("trace", help="trace file to view (created with --record if given)")
+    parser.add_argument("--record", nargs=3, type=int, metavar=("N", "X", "Y"), help="record a new search first")
+    parser.add_argument("--algorithm", choices=sorted(STREAMS), default="backtracking")
+    args = parser.parse_args()
+
+    if args.record:
+        n, x, y = args.record  # Board size and start square
+        steps = record_trace(STREAMS[args.algorithm](n, (x, y)), args.trace, n)  # Records the whole search
+        print(f"Traza grabada: {steps} pasos en {args.trace}")
+
+    pygame.init()  # Initializes Pygame
+    with Trace(args.trace) as trace:
+        TraceViewer(trace).run()  # Opens the viewer
+
+if __name__ == "__main__":
+    main()
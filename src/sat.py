@@ -0,0 +1,50 @@
+from __future__ import annotations  # Ensures compatibility with type hints for future versions of Python
+from array import array  # Imports array for the compact path of square indices
+import pygame  # Imports Pygame for graphical interface and event handling
+from src.backtracking import AbstractAlgorithm, printSolution  # Imports the base algorithm class and helpers
+from src.utils.concurrent_sat import solveKT_parallel_sat  # Imports the SAT backend
+from src.utils.tablero import Board, BoardPosition, Piece, tile_size_for  # Imports required classes and constants
+from src.utils.tour_format import board_to_path  # Imports the board to path conversion
+from src.utils.step_stream import iter_path_steps  # Imports the step stream for known paths
+
+SAT_TIMEOUT = 300  # Maximum seconds the SAT backend may spend on one instance
+
+def solveKT(n: int, bkalg: SATAlgorithm) -> None:
+    '''
+        Solves the Knight Tour problem by reduction to SAT. Unlike the
+        backtracking solvers it reports when a tour is proven impossible.
+    '''
+    x_position, y_position = bkalg._piece.position  # Gets the starting position of the knight
+    result = solveKT_parallel_sat(n, x_position, y_position, SAT_TIMEOUT, end=bkalg.target, blocked=bkalg.blocked)
+
+    if not result["Solution Found"]:
+        if result["Proven Impossible"]:
+            print(f"Solution does not exist: {result['Impossibility Reason']}")
+        else:
+            print("No solution found before the timeout")
+        raise SystemExit
+
+    printSolution(n, result["Final Board"])  # Prints the solution
+    print(f"--- {result['Execution Time']} seconds ---")  # Displays the execution time
+
+    bkalg.play(iter_path_steps(board_to_path(result["Final Board"])))  # Draws the tour found by the solver
+
+class SATAlgorithm(AbstractAlgorithm):
+
+    def __init__(self, piece: Piece, size: int = 8, blocked: tuple[BoardPosition, ...] = (), target: BoardPosition | None = None) -> None:
+        self._piece = piece  # Sets the piece for the algorithm
+        self._size = size  # Sets the board size
+        self.blocked = tuple(blocked)  # Sets the squares the knight cannot visit
+        self.target = target  # Sets the square where the tour must end
+        tile = tile_size_for(size)  # Largest tile size that fits the screen
+        self._win = pygame.display.set_mode((size * tile, size * tile))  # Initializes Pygame display
+        self._board = Board(size=self._size, parent=self._win, piece=self._piece, with_legend=True, blocked=self.blocked, target=self.target, tile_size=tile)  # Initializes board with legend
+        self.path = array("I")  # Initializes path to store move sequence
+
+    def _run(self) -> None:
+        solveKT(n=self._size, bkalg=self)  # Starts the SAT based solver
+        self.loop = False  # Stops loop after solving the problem
+
+    def _reset(self) -> None:
+        self.path = array("I")  # Clears path
+        super()._reset()  # Calls parent reset method
@@ -0,0 +1,96 @@
+import random
+
+MOVE_X = [2, 1, -1, -2, -2, -1, 1, 2]
+MOVE_Y = [1, 2, 2, 1, -1, -2, -2, -1]
+
+UNVISITED = -1
+BLOCKED = -3  # -2 ya lo usa Board para marcar visitas repetidas
+
+# Utilidades para tableros con casillas bloqueadas y casilla final obligatoria.
+# Las tablas de vecinos se calculan una sola vez y ya excluyen las casillas
+# fuera del tablero y las bloqueadas, asi los solvers nunca las consideran.
+
+
+def move_order(seed=None):
+    '''
+        Move tables (move_x, move_y) for the solvers. Without a seed it is the
+        usual order; with one, a fixed permutation of it, so ties between equal
+        candidates are broken differently but reproducibly for each seed.
+    '''
+    order = list(range(8))
+    if seed is not None:
+        random.Random(seed).shuffle(order)
+    return [MOVE_X[i] for i in order], [MOVE_Y[i] for i in order]
+
+
+def new_board(n, blocked=(), m=None):
+    '''
+        Creates an n x m board with every square unvisited (-1) except the
+        blocked ones (BLOCKED).
+    '''
+    m = n if m is None else m
+    board = [[UNVISITED for _ in range(m)] for _ in range(n)]
+    for x, y in blocked:
+        board[x][y] = BLOCKED
+    return board
+
+
+def knight_neighbours(n, m=None, blocked=frozenset(), move_x=MOVE_X, move_y=MOVE_Y):
+    '''
+        Adjacency lists of the knight graph without the blocked squares,
+        keeping the move order of move_x / move_y (the usual one by default).
+    '''
+    m = n if m is None else m
+    blocked = frozenset(blocked)
+    neighbours = {}
+    for x in range(n):
+        for y in range(m):
+            if (x, y) in blocked:
+                continue
+            neighbours[(x, y)] = [
+                (x + dx, y + dy) for dx, dy in zip(move_x, move_y)
+                if 0 <= x + dx < n and 0 <= y + dy < m and (x + dx, y + dy) not in blocked
+            ]
+    return neighbours
+
+
+def playable_squares(n, blocked=(), m=None):
+    m = n if m is None else m
+    return n * m - len(set(blocked))
+
+
+def validate_mask(n, start, blocked=(), target=None, m=None):
+    m = n if m is None else m
+    blocked = set(blocked)
+    for x, y in blocked | ({target} if target is not None else set()):
+        if not (0 <= x < n and 0 <= y < m):
+            raise ValueError(f"Square {(x, y)} is outside the board")
+    if tuple(start) in blocked:
+        raise ValueError("The start square is blocked")
+    if target is not None and tuple(target) in blocked:
+        raise ValueError("The target square is blocked")
+    if target is not None and tuple(target) == tuple(start) and playable_squares(n, blocked, m) > 1:
+        raise ValueError("The target square cannot be the start square")
+
+
+def target_allows(square, pos, total, target):
+    '''
+        A square may take move number `pos` only if it respects the target:
+        the target is reserved for the last move and the last move must be it.
+    '''
+    if target is None:
+        return True
+    return (square == target) == (pos == total - 1)
+
+
+def target_reachable(board, neighbours, curr, pos, total, target):
+    '''
+        Pruning: the target must keep at least one unvisited neighbour (or be
+        adjacent to the current square) until the tour can end on it.
+    '''
+    if target is None or pos >= total - 1:
+        return True
+    for x, y in neighbours[target]:
+        if board[x][y] == UNVISITED or (x, y) == curr:
+            return True
+    return False
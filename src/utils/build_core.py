@@ -0,0 +1,71 @@
+import argparse
+import os
+import shutil
+import sys
+
+# Compila src/utils/fast_core.py en el lugar (una extension .so/.pyd junto al
+# .py) con mypyc. Es opcional: sin compilador o sin mypy los solvers usan el
+# mismo codigo interpretado.
+#
+#     pip install mypy  &&  python -m src.utils.build_core
+#     python -m src.utils.build_core --clean    (vuelve a la version interpretada)
+#     python -m src.utils.build_core --check    (corre tests/test_fast_core.py)
+#
+# Cython en modo Python puro tambien compila el modulo, pero con List[int]
+# no genera enteros de C y no mejora la velocidad; por eso no se ofrece.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CORE = os.path.join("src", "utils", "fast_core.py")
+
+
+def build():
+    '''
+        Builds the extension in place with mypyc and setuptools (run from any directory).
+    '''
+    from mypyc.build import mypycify
+    from setuptools import setup
+
+    os.chdir(ROOT)
+    setup(name="knight_tour_fast_core", ext_modules=mypycify([CORE], opt_level="3"), script_args=["build_ext", "--inplace"])
+
+
+def check():
+    '''
+        Runs tests/test_fast_core.py (the interpreted or compiled core against
+        the recursive solvers) on the core loaded by this process. Returns
+        pytest's exit code.
+    '''
+    import pytest
+    from src.utils import fast_core
+
+    print("Núcleo cargado:", "compilado" if fast_core.COMPILED else "Python puro")
+    return pytest.main(["-q", os.path.join(ROOT, "tests", "test_fast_core.py")])
+
+
+def clean():
+    '''
+        Removes the compiled extension so the pure-Python core is used again.
+    '''
+    utils = os.path.join(ROOT, "src", "utils")
+    for name in os.listdir(utils):
+        if name.startswith(("fast_core.", "fast_core__mypyc.")) and name.endswith((".so", ".pyd")):
+            os.remove(os.path.join(utils, name))
+            print("Eliminado", name)
+    shutil.rmtree(os.path.join(ROOT, "build"), ignore_errors=True)  # Temporales de setuptools
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Optional compiled build of the solver core")
+    parser.add_argument("--clean", action="store_true", help="remove the compiled extension")
+    parser.add_argument("--check", action="store_true", help="only run tests/test_fast_core.py on the current core")
+    args = parser.parse_args()
+
+    if args.clean:
+        clean()
+        sys.exit(0)
+    if not args.check:
+        try:
+            build()
+        except ImportError as e:
+            sys.exit(f"No se puede compilar con mypyc: {e}")
+    sys.exit(1 if check() else 0)
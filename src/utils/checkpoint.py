@@ -0,0 +1,171 @@
+import concurrent.futures
+import json
+import os
+import time
+
+from src.utils.concurrent_backtracking import generate_inputs, isSafe_backtracking, printSolution
+
+# Barridos reanudables: cada posicion inicial terminada se agrega como una
+# linea JSON al archivo de checkpoint. Las posiciones resueltas (o sin
+# solucion) se saltean al reanudar; las que vencieron por timeout guardan el
+# estado de la busqueda para continuar desde donde quedaron.
+
+MOVE_X = [2, 1, -1, -2, -2, -1, 1, 2]
+MOVE_Y = [1, 2, 2, 1, -1, -2, -2, -1]
+
+
+def solveKT_resumable_backtracking(n, x_pos, y_pos, timeout, state=None):
+    '''
+        Iterative version of solveKTUtil_backtracking that explores the moves in
+        the same order but keeps the search on an explicit stack, so it can be
+        saved on timeout and resumed later from `state`.
+    '''
+    board = [[-1 for i in range(n)] for j in range(n)]
+    total = n * n
+
+    if state is None:
+        path = [(x_pos, y_pos)]
+        cursors = [0]  # Proximo movimiento a probar en cada nivel
+        explored_nodes = 0
+        previous_time = 0.0
+    else:
+        path = [tuple(square) for square in state["path"]]
+        cursors = list(state["cursors"])
+        explored_nodes = state["explored_nodes"]
+        previous_time = state["elapsed"]
+    for pos, (x, y) in enumerate(path):
+        board[x][y] = pos
+
+    start_time = time.time()
+    timed_out = False
+    success = False
+
+    while path:
+        if len(path) == total:
+            success = True
+            break
+        if time.time() - start_time >= timeout:
+            timed_out = True
+            break
+
+        curr_x, curr_y = path[-1]
+        i = cursors[-1]
+        if i == 8:
+            # Backtracking
+            board[curr_x][curr_y] = -1
+            path.pop()
+            cursors.pop()
+            continue
+
+        cursors[-1] = i + 1
+        new_x = curr_x + MOVE_X[i]
+        new_y = curr_y + MOVE_Y[i]
+        explored_nodes += 1
+        if isSafe_backtracking(n, new_x, new_y, board):
+            board[new_x][new_y] = len(path)
+            path.append((new_x, new_y))
+            cursors.append(0)
+
+    if not path:  # Se agoto el arbol: no hay recorrido desde esta posicion
+        board[x_pos][y_pos] = 0
+
+    elapsed = time.time() - start_time
+    return {
+        "Start X": x_pos,
+        "Start Y": y_pos,
+        "Solution Found": success,
+        "Timed Out": timed_out,
+        "Execution Time": elapsed,
+        "Total Execution Time": previous_time + elapsed,
+        "Final Board": board,
+        "Tracking Board": None,
+        "Explored Nodes": explored_nodes,
+        "Search State": {
+            "path": path,
+            "cursors": cursors,
+            "explored_nodes": explored_nodes,
+            "elapsed": previous_time + elapsed,
+        } if timed_out else None,
+    }
+
+
+def load_checkpoint(checkpoint_path, n):
+    '''
+        Reads a checkpoint file and returns {(row, column): entry} with the
+        latest entry for each start position of an n x n sweep.
+    '''
+    entries = {}
+    if not os.path.exists(checkpoint_path):
+        return entries
+    with open(checkpoint_path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Linea truncada por una interrupcion: se ignora
+            if entry["size"] != n:
+                continue
+            entries[(entry["row"], entry["column"])] = entry
+    return entries
+
+
+def _terminate_last_line(checkpoint_path):
+    # Si una interrupcion dejo la ultima linea a medias, la siguiente entrada
+    # empieza en una linea nueva en lugar de pegarse a la truncada
+    if not os.path.exists(checkpoint_path) or os.path.getsize(checkpoint_path) == 0:
+        return
+    with open(checkpoint_path, "rb+") as f:
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != b"\n":
+            f.write(b"\n")
+
+
+def _append_checkpoint(f, n, result):
+    entry = {"size": n, "row": result["Start X"], "column": result["Start Y"], "result": result}
+    f.write(json.dumps(entry) + "\n")
+    f.flush()
+    os.fsync(f.fileno())
+
+
+def get_cases_knigth_tour_backtracking_by_size_board_checkpointed(n, checkpoint_path, timeout=60, row=None, resume_timed_out=True):
+    '''
+        Same sweep as get_cases_knigth_tour_backtracking_by_size_board, but every
+        finished start position is written to `checkpoint_path` as soon as it
+        completes. Running it again skips the finished positions and continues
+        the timed-out ones from their saved search state (or keeps their
+        timed-out result when `resume_timed_out` is False).
+    '''
+    done = load_checkpoint(checkpoint_path, n)
+    list_boards = []
+    pending = []
+    for pos in generate_inputs(n, row):
+        entry = done.get((pos["row"], pos["column"]))
+        if entry is None:
+            pending.append((pos["row"], pos["column"], None))
+        elif entry["result"]["Timed Out"] and resume_timed_out:
+            pending.append((pos["row"], pos["column"], entry["result"]["Search State"]))
+        else:
+            list_boards.append(entry["result"])
+
+    print(f"Reanudando barrido {n}x{n}: {len(list_boards)} posiciones completas, {len(pending)} pendientes")
+
+    _terminate_last_line(checkpoint_path)
+    with open(checkpoint_path, "a") as f, concurrent.futures.ProcessPoolExecutor() as pool:
+        tasks = [pool.submit(solveKT_resumable_backtracking, n, x, y, timeout, state) for x, y, state in pending]
+
+        for task in concurrent.futures.as_completed(tasks):
+            result = task.result()
+            _append_checkpoint(f, n, result)
+            print("Resultado para posición inicial (", result["Start X"], ",", result["Start Y"], "):")
+            print("  - Solución encontrada:", result["Solution Found"])
+            print("  - Tiempo de ejecución:", result["Total Execution Time"], "segundos")
+            print("  - Nodos explorados:", result["Explored Nodes"])
+            print("  - Tablero final:")
+            printSolution(n, result["Final Board"])
+            print()
+            list_boards.append(result)
+
+    return list_boards
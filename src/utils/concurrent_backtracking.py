@@ -1,5 +1,9 @@
 import concurrent.futures
 import time
+from src.utils.board_mask import knight_neighbours, move_order, new_board, playable_squares, target_allows, target_reachable, validate_mask
+from src.utils import fast_core
+from src.utils.shared_state import SharedSweepState
+from src.utils.transposition import TranspositionTable
 # Python3 program to solve Knight Tour problem using Branch and Bound with Warnsdorff’s heuristic
 def generate_inputs(size, row=None):
     total_inputs = []
@@ -33,28 +37,92 @@ def isSafe_backtracking(n, x, y, board):
         return True
     return False
 
-def solveKTUtil_backtracking(n, board, curr_x, curr_y, move_x, move_y, pos, start_time, timeout, tracking_board, omit_tracking, explored_nodes):
+def budget_exhausted(start_time, end_time, timeout, explored_nodes, node_budget):
+    '''
+        Cut-off shared by the solvers: the node budget when one is given
+        (deterministic runs), otherwise the wall-clock timeout.
+    '''
+    if node_budget is not None:
+        return explored_nodes[0] >= node_budget
+    return end_time - start_time >= timeout
+
+def solve_with_core(solver, n, board, x_pos, y_pos, total, move_x, move_y, start_time, timeout, explored_nodes, shared_state=None, node_budget=None, masked=False):
+    '''
+        Runs a fast_core solver on a flat copy of `board` and writes the final
+        state back. Returns True like the recursive solvers: tour found or
+        search cut short (budget, timeout or stop request). With `masked`
+        the blocked squares are left out of the core's neighbour table.
+    '''
+    flat = [value for row in board for value in row]
+    deadline = start_time + timeout if node_budget is None else float("inf")
+    poll = None
+    if shared_state is not None:
+        def poll(depth):
+            if depth > shared_state.local_best:
+                shared_state.publish_depth(depth)
+            return shared_state.stop_requested()
+
+    status, nodes, best = solver(n, flat, x_pos * n + y_pos, total, move_x, move_y, masked, -1 if node_budget is None else node_budget, deadline, poll)
+    explored_nodes[0] += nodes
+    for x in range(n):
+        board[x][:] = flat[x * n:(x + 1) * n]
+    if shared_state is not None and best > shared_state.local_best:
+        shared_state.publish_depth(best)
+    return status != fast_core.EXHAUSTED
+
+def solveKTUtil_backtracking(n, board, curr_x, curr_y, move_x, move_y, pos, start_time, timeout, tracking_board, omit_tracking, explored_nodes, transposition_table=None, visited_hash=0, total=None, target=None, neighbours=None, shared_state=None, node_budget=None):
     '''
         A recursive utility function to solve Knight Tour problem using
         Branch and Bound with Warnsdorff's heuristic.
+
+        When a transposition_table is given, `visited_hash` is the Zobrist hash
+        of the visited squares and states already proven dead are skipped.
+        With blocked squares or a target, candidates come from the `neighbours`
+        table (blocked squares are never considered) and `total` is the number
+        of playable squares; `target` forces the last square.
+        A `shared_state` lets the sweep stop this worker early and receives its best depth.
+        With a `node_budget` the search is cut after that many explored nodes
+        instead of after `timeout` seconds, so the result does not depend on timing.
     '''
 
     end_time = time.time()
 
-    if pos == n**2 or end_time - start_time >= timeout:
+    if total is None:
+        total = n**2
+
+    if shared_state is not None:
+        if shared_state.stop_requested():
+            return True
+        if pos > shared_state.local_best:
+            shared_state.publish_depth(pos)
+
+    if pos == total or budget_exhausted(start_time, end_time, timeout, explored_nodes, node_budget):
         return True
 
-    # Get the next move with the fewest onward moves
-    for i in range(8):
-        new_x = curr_x + move_x[i]
-        new_y = curr_y + move_y[i]
+    if target is not None and not target_reachable(board, neighbours, (curr_x, curr_y), pos, total, target):
+        return False
+
+    if transposition_table is not None:
+        state_key = transposition_table.key(visited_hash, curr_x, curr_y, n)
+        if transposition_table.probe(state_key):
+            return False
+
+    # Candidates: the masked neighbour table, or the raw offsets on a full board
+    if neighbours is not None:
+        moves = neighbours[(curr_x, curr_y)]
+    else:
+        moves = [(curr_x + move_x[i], curr_y + move_y[i]) for i in range(8)]
+    for new_x, new_y in moves:
         explored_nodes[0] += 1
         if(isSafe_backtracking(n, new_x, new_y, board)):
+            if target is not None and not target_allows((new_x, new_y), pos, total, target):
+                continue
             board[new_x][new_y] = pos
             if not omit_tracking:
                 tracking_board.append({"x": new_x, "y": new_y, "pos": pos, "board": board})
 
-            if(solveKTUtil_backtracking(n, board, new_x, new_y, move_x, move_y, pos+1, start_time, timeout, tracking_board, omit_tracking, explored_nodes)):
+            next_hash = visited_hash ^ transposition_table.square_keys[new_x * n + new_y] if transposition_table is not None else 0
+            if(solveKTUtil_backtracking(n, board, new_x, new_y, move_x, move_y, pos+1, start_time, timeout, tracking_board, omit_tracking, explored_nodes, transposition_table, next_hash, total, target, neighbours, shared_state, node_budget)):
                 return True
 
             # Backtracking
@@ -62,16 +130,30 @@ def solveKTUtil_backtracking(n, board, curr_x, curr_y, move_x, move_y, pos, star
                 tracking_board.append({"x": new_x, "y": new_y, "pos": pos, "board": board})
 
             board[new_x][new_y] = -1
+
+    if transposition_table is not None:
+        # Estado sin solucion: se registra para no volver a explorarlo
+        transposition_table.store(state_key, total - pos)
     return False
 
-def solveKT_parallel_backtracking(n, x_pos, y_pos, timeout, omit_tracking):
+def solveKT_parallel_backtracking(n, x_pos, y_pos, timeout, omit_tracking, use_transposition=False, transposition_memory_mb=64, transposition_policy="lru", blocked=(), target=None, shared_state_name=None, stop_on_solution=False, node_budget=None, seed=None, use_core=True):
     '''
         Esta función ejecuta solveKT para una posición inicial dada y devuelve
         el tiempo de inicio y fin para verificar la duración de la ejecución.
+        Con use_transposition se descartan los estados ya probados sin solución.
+        blocked son casillas prohibidas y target la casilla final obligatoria.
+        shared_state_name es el bloque de memoria compartida del barrido; con
+        stop_on_solution, el primer proceso que encuentra un recorrido detiene al resto.
+        Con node_budget el corte es por nodos explorados y no por tiempo (timeout
+        se ignora), y seed fija el orden de los movimientos: la corrida es reproducible.
+        Sin tracking, transposición ni casilla final se usa fast_core (mismo
+        recorrido y mismos nodos); use_core=False fuerza la versión recursiva.
     '''
-    board = [[-1 for i in range(n)] for j in range(n)]
-    move_x = [2, 1, -1, -2, -2, -1, 1, 2]
-    move_y = [1, 2, 2, 1, -1, -2, -2, -1]
+    validate_mask(n, (x_pos, y_pos), blocked, target)
+    board = new_board(n, blocked)
+    total = playable_squares(n, blocked)
+    move_x, move_y = move_order(seed)
+    neighbours = knight_neighbours(n, blocked=blocked, move_x=move_x, move_y=move_y) if blocked or target is not None else None
 
     # Marcar la posición inicial
     board[x_pos][y_pos] = 0
@@ -82,45 +164,85 @@ def solveKT_parallel_backtracking(n, x_pos, y_pos, timeout, omit_tracking):
 
     explored_nodes = [0]
 
+    transposition_table = None
+    visited_hash = 0
+    if use_transposition:
+        transposition_table = TranspositionTable(n, memory_mb=transposition_memory_mb, policy=transposition_policy)
+        visited_hash = transposition_table.square_keys[x_pos * n + y_pos]
+
+    shared_state = SharedSweepState.attach(shared_state_name, n) if shared_state_name is not None else None
+    stopped = shared_state is not None and shared_state.stop_requested()
+
     # Ejecutar el recorrido del caballo
-    success = solveKTUtil_backtracking(n, board, x_pos, y_pos, move_x, move_y, pos, start_time, timeout, tracking_board, omit_tracking, explored_nodes)
+    success = False
+    if not stopped and use_core and omit_tracking and transposition_table is None and target is None:
+        success = solve_with_core(fast_core.solve_backtracking, n, board, x_pos, y_pos, total, move_x, move_y, start_time, timeout, explored_nodes, shared_state, node_budget, bool(blocked))
+    elif not stopped:
+        success = solveKTUtil_backtracking(n, board, x_pos, y_pos, move_x, move_y, pos, start_time, timeout, tracking_board, omit_tracking, explored_nodes, transposition_table, visited_hash, total, target, neighbours, shared_state, node_budget)
 
     end_time = time.time()
+    # El recorrido puede completarse justo en el nodo que agota el presupuesto:
+    # solo es un corte si el tablero no quedó completo
+    solved = success and sum(value >= 0 for row in board for value in row) == total
+    cut_off = not solved and budget_exhausted(start_time, end_time, timeout, explored_nodes, node_budget)
+
+    if shared_state is not None:
+        # La recursión también devuelve True cuando otro proceso pidió parar
+        stopped = stopped or (success and not solved and not cut_off)
+        success = success and not stopped
+        if solved and stop_on_solution:
+            shared_state.request_stop()
+        shared_state.record_square(x_pos, y_pos, explored_nodes[0], shared_state.local_best, solved)
+        SharedSweepState.detach(shared_state_name)  # El bloque no se usa mas en esta tarea
 
     # Retornar el resultado con información adicional
-    return {
+    result = {
         "Start X": x_pos,
         "Start Y": y_pos,
-        "Solution Found": False if end_time - start_time >= timeout else success,
+        "Solution Found": False if cut_off else success,
         "Execution Time": end_time - start_time,
         "Final Board": board,
-        "Tracking Board": tracking_board if end_time - start_time >= timeout and not omit_tracking else None,
+        "Tracking Board": tracking_board if cut_off and not omit_tracking else None,
         "Explored Nodes": explored_nodes[0]
     }
+    if node_budget is not None:
+        result["Node Budget"] = node_budget
+        result["Seed"] = seed
+    if shared_state is not None:
+        result["Stopped Early"] = stopped
+    if transposition_table is not None:
+        result.update(transposition_table.stats())
+    return result
 
-def get_case_knigth_tour_backtracking_by_size_board_and_position(n, pos_x, pos_y, timeout=60):
-    result = solveKT_parallel_backtracking(n, pos_x, pos_y, timeout)
+def get_case_knigth_tour_backtracking_by_size_board_and_position(n, pos_x, pos_y, timeout=60, use_transposition=False):
+    result = solveKT_parallel_backtracking(n, pos_x, pos_y, timeout, True, use_transposition)
     print("Resultado para posición inicial (", result["Start X"], ",", result["Start Y"], "):")
     print("  - Solución encontrada:", result["Solution Found"])
     print("  - Tiempo de ejecución:", result["Execution Time"], "segundos")
     print("  - Nodos explorados:", result["Explored Nodes"])
+    if use_transposition:
+        print("  - Aciertos en tabla de transposición:", result["Transposition Hit Rate"])
     print("  - Tablero final:")
     printSolution(n, result["Final Board"])
     return result
 
 
-def get_cases_knigth_tour_backtracking_by_size_board(n, timeout=60, row=None, omit_tracking=False):
+def get_cases_knigth_tour_backtracking_by_size_board(n, timeout=60, row=None, omit_tracking=True, use_transposition=False, stop_on_first=False, analytics=None, difficulty=None):
     # Lista de posiciones iniciales para probar en paralelo
+    # Sin tracking corre sobre fast_core; omit_tracking=False guarda los pasos (camino recursivo, mas lento)
+    # Con stop_on_first, el primer recorrido encontrado detiene al resto de los procesos
 
     result = []
 
     list_boards = []
     start_positions = generate_inputs(n, row)  # Puedes modificar o ampliar esta lista
+    if difficulty is not None:
+        start_positions = difficulty.order("backtracking", n, start_positions)  # Las casillas mas costosas primero
 
     # Ejecutamos en paralelo usando ProcessPoolExecutor
-    with concurrent.futures.ProcessPoolExecutor() as pool:
+    with SharedSweepState(n) as shared_state, concurrent.futures.ProcessPoolExecutor() as pool:
         # Mapeamos las posiciones iniciales a solveKT_parallel_backtracking sin usar lambda
-        tasks = [pool.submit(solveKT_parallel_backtracking, n, pos["row"], pos["column"], timeout, omit_tracking) for pos in start_positions]
+        tasks = [pool.submit(solveKT_parallel_backtracking, n, pos["row"], pos["column"], timeout, omit_tracking, use_transposition, shared_state_name=shared_state.name, stop_on_solution=stop_on_first) for pos in start_positions]
 
         # Obtener los resultados a medida que se completan
         for task in concurrent.futures.as_completed(tasks):
@@ -130,9 +252,19 @@ def get_cases_knigth_tour_backtracking_by_size_board(n, timeout=60, row=None, om
                 print("  - Solución encontrada:", result["Solution Found"])
                 print("  - Tiempo de ejecución:", result["Execution Time"], "segundos")
                 print("  - Nodos explorados:", result["Explored Nodes"])
+                if use_transposition:
+                    print("  - Aciertos en tabla de transposición:", result["Transposition Hit Rate"])
                 print("  - Tablero final:")
                 printSolution(n, result["Final Board"])
                 print()
                 list_boards.append(result)
+                if analytics is not None:
+                    analytics.add(result, n)
+                if difficulty is not None:
+                    difficulty.observe("backtracking", n, result, timeout)
+
+        print("Profundidad máxima alcanzada:", shared_state.best_depth, "- posiciones resueltas:", shared_state.solved_count)
 
+    if difficulty is not None:
+        difficulty.save()
     return list_boards
\ No newline at end of file
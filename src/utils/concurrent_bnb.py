@@ -1,5 +1,9 @@
 import concurrent.futures
 import time
+from src.utils.board_mask import knight_neighbours, move_order, new_board, playable_squares, target_allows, target_reachable, validate_mask
+from src.utils import fast_core
+from src.utils.concurrent_backtracking import budget_exhausted, solve_with_core
+from src.utils.shared_state import SharedSweepState
 # Python3 program to solve Knight Tour problem using Branch and Bound with Warnsdorff’s heuristic
 
 def generate_inputs(size):
@@ -39,15 +43,20 @@ def bound(moves):
         moves=moves[:1]
     return moves
 
-def branch(curr_x, curr_y, n, board, move_x, move_y, explored_nodes):
+def branch(curr_x, curr_y, n, board, move_x, move_y, explored_nodes, pos=None, total=None, target=None, neighbours=None):
 
     priority_queue = []
 
-    for i in range(8):
-        new_x = curr_x + move_x[i]
-        new_y = curr_y + move_y[i]
+    # Con casillas bloqueadas la tabla de vecinos ya las excluye
+    if neighbours is not None:
+        moves = neighbours[(curr_x, curr_y)]
+    else:
+        moves = [(curr_x + move_x[i], curr_y + move_y[i]) for i in range(8)]
+    for new_x, new_y in moves:
         explored_nodes[0] += 1
         if isSafe(len(board),new_x, new_y, board):
+            if target is not None and not target_allows((new_x, new_y), pos, total, target):
+                continue
             # Prioriza movimientos más alejados del centro
             distance = distanceToWalls(new_x, new_y, n)
             priority_queue.append((distance, new_x, new_y))
@@ -57,18 +66,35 @@ def branch(curr_x, curr_y, n, board, move_x, move_y, explored_nodes):
 
     return bound(priority_queue)
 
-def solveKTUtil(n, board, curr_x, curr_y, move_x, move_y, pos, start_time, timeout, tracking_board, explored_nodes):
+def solveKTUtil(n, board, curr_x, curr_y, move_x, move_y, pos, start_time, timeout, tracking_board, explored_nodes, total=None, target=None, neighbours=None, shared_state=None, node_budget=None):
     '''
         A recursive utility function to solve Knight Tour problem using
         Branch and Bound with Warnsdorff's heuristic.
+        With blocked squares or a target, candidates come from the `neighbours`
+        table (blocked squares are never considered); `total` is the number of
+        playable squares and `target` the required last square.
+        A `shared_state` lets the sweep stop this worker early and receives its best depth.
+        A `node_budget` replaces the timeout with a cut after that many explored nodes.
     '''
 
     end_time = time.time()
 
-    if pos == n**2 or end_time - start_time >= timeout:
+    if total is None:
+        total = n**2
+
+    if shared_state is not None:
+        if shared_state.stop_requested():
+            return True
+        if pos > shared_state.local_best:
+            shared_state.publish_depth(pos)
+
+    if pos == total or budget_exhausted(start_time, end_time, timeout, explored_nodes, node_budget):
         return True
 
-    cola_prioridad = branch(curr_x, curr_y, n, board, move_x, move_y, explored_nodes)
+    if target is not None and not target_reachable(board, neighbours, (curr_x, curr_y), pos, total, target):
+        return False
+
+    cola_prioridad = branch(curr_x, curr_y, n, board, move_x, move_y, explored_nodes, pos, total, target, neighbours)
     # print(f"( {next_x} , {next_y} ) - {pos}")
     # print()
 
@@ -77,20 +103,29 @@ def solveKTUtil(n, board, curr_x, curr_y, move_x, move_y, pos, start_time, timeo
     for _, new_x, new_y in cola_prioridad:
         board[new_x][new_y] = pos
         tracking_board.append({"x": new_x, "y": new_y, "pos": pos, "board": board})
-        if(solveKTUtil(n, board, new_x, new_y, move_x, move_y, pos+1, start_time, timeout, tracking_board, explored_nodes)):
+        if(solveKTUtil(n, board, new_x, new_y, move_x, move_y, pos+1, start_time, timeout, tracking_board, explored_nodes, total, target, neighbours, shared_state, node_budget)):
             return True
         tracking_board.append({"x": new_x, "y": new_y, "pos": pos, "board": board})
         board[new_x][new_y] = -1
     return False
 
-def solveKT_parallel(n, x_pos, y_pos, timeout):
+def solveKT_parallel(n, x_pos, y_pos, timeout, blocked=(), target=None, shared_state_name=None, stop_on_solution=False, node_budget=None, seed=None, omit_tracking=False, use_core=True):
     '''
         Esta función ejecuta solveKT para una posición inicial dada y devuelve
         el tiempo de inicio y fin para verificar la duración de la ejecución.
+        blocked son casillas prohibidas y target la casilla final obligatoria.
+        shared_state_name es el bloque de memoria compartida del barrido; con
+        stop_on_solution, el primer proceso que encuentra un recorrido detiene al resto.
+        Con node_budget el corte es por nodos explorados (timeout se ignora) y
+        seed decide los empates de distancia al centro: la corrida es reproducible.
+        Con omit_tracking (y sin casilla final) se usa fast_core, que da el
+        mismo recorrido y los mismos nodos; use_core=False fuerza la versión recursiva.
     '''
-    board = [[-1 for i in range(n)] for j in range(n)]
-    move_x = [2, 1, -1, -2, -2, -1, 1, 2]
-    move_y = [1, 2, 2, 1, -1, -2, -2, -1]
+    validate_mask(n, (x_pos, y_pos), blocked, target)
+    board = new_board(n, blocked)
+    total = playable_squares(n, blocked)
+    move_x, move_y = move_order(seed)  # El orden es estable: solo cambia los empates
+    neighbours = knight_neighbours(n, blocked=blocked, move_x=move_x, move_y=move_y) if blocked or target is not None else None
 
     # Marcar la posición inicial
     board[x_pos][y_pos] = 0
@@ -101,24 +136,50 @@ def solveKT_parallel(n, x_pos, y_pos, timeout):
 
     explored_nodes = [0]
 
+    shared_state = SharedSweepState.attach(shared_state_name, n) if shared_state_name is not None else None
+    stopped = shared_state is not None and shared_state.stop_requested()
+
     # Ejecutar el recorrido del caballo
-    success = solveKTUtil(n, board, x_pos, y_pos, move_x, move_y, pos, start_time, timeout, tracking_board, explored_nodes)
+    success = False
+    if not stopped and use_core and omit_tracking and target is None:
+        success = solve_with_core(fast_core.solve_bnb, n, board, x_pos, y_pos, total, move_x, move_y, start_time, timeout, explored_nodes, shared_state, node_budget, bool(blocked))
+    elif not stopped:
+        success = solveKTUtil(n, board, x_pos, y_pos, move_x, move_y, pos, start_time, timeout, tracking_board, explored_nodes, total, target, neighbours, shared_state, node_budget)
 
     end_time = time.time()
+    # El recorrido puede completarse justo en el nodo que agota el presupuesto:
+    # solo es un corte si el tablero no quedó completo
+    solved = success and sum(value >= 0 for row in board for value in row) == total
+    cut_off = not solved and budget_exhausted(start_time, end_time, timeout, explored_nodes, node_budget)
+
+    if shared_state is not None:
+        # La recursión también devuelve True cuando otro proceso pidió parar
+        stopped = stopped or (success and not solved and not cut_off)
+        success = success and not stopped
+        if solved and stop_on_solution:
+            shared_state.request_stop()
+        shared_state.record_square(x_pos, y_pos, explored_nodes[0], shared_state.local_best, solved)
+        SharedSweepState.detach(shared_state_name)  # El bloque no se usa mas en esta tarea
 
     # Retornar el resultado con información adicional
-    return {
+    result = {
         "Start X": x_pos,
         "Start Y": y_pos,
-        "Solution Found": False if end_time - start_time >= timeout else success,
+        "Solution Found": False if cut_off else success,
         "Execution Time": end_time - start_time,
         "Final Board": board,
-        "Tracking Board": tracking_board if end_time - start_time >= timeout else None,
+        "Tracking Board": tracking_board if cut_off and not omit_tracking else None,
         "Explored Nodes": explored_nodes[0]
     }
+    if node_budget is not None:
+        result["Node Budget"] = node_budget
+        result["Seed"] = seed
+    if shared_state is not None:
+        result["Stopped Early"] = stopped
+    return result
 
 def get_case_knigth_tour_by_size_board_and_position(n, pos_x, pos_y, timeout=60):
-    result = solveKT_parallel(n, pos_x, pos_y, timeout)
+    result = solveKT_parallel(n, pos_x, pos_y, timeout, omit_tracking=True)
     print("Resultado para posición inicial (", result["Start X"], ",", result["Start Y"], "):")
     print("  - Solución encontrada:", result["Solution Found"])
     print("  - Tiempo de ejecución:", result["Execution Time"], "segundos")
@@ -128,19 +189,23 @@ def get_case_knigth_tour_by_size_board_and_position(n, pos_x, pos_y, timeout=60)
     return result
 
 
-def get_cases_knigth_tour_by_size_board(n, timeout=60):
+def get_cases_knigth_tour_by_size_board(n, timeout=60, stop_on_first=False, analytics=None, difficulty=None, omit_tracking=True):
     # Lista de posiciones iniciales para probar en paralelo
+    # Sin tracking corre sobre fast_core; omit_tracking=False guarda los pasos (camino recursivo, mas lento)
+    # Con stop_on_first, el primer recorrido encontrado detiene al resto de los procesos
 
     result = []
 
     list_boards = []
     start_positions = generate_inputs(n)  # Puedes modificar o ampliar esta lista
+    if difficulty is not None:
+        start_positions = difficulty.order("bnb", n, start_positions)  # Las casillas mas costosas primero
 
     
     # Ejecutamos en paralelo usando ProcessPoolExecutor
-    with concurrent.futures.ProcessPoolExecutor() as pool:
+    with SharedSweepState(n) as shared_state, concurrent.futures.ProcessPoolExecutor() as pool:
         # Mapeamos las posiciones iniciales a solveKT_parallel sin usar lambda
-        tasks = [pool.submit(solveKT_parallel, n, pos["row"], pos["column"], timeout) for pos in start_positions]
+        tasks = [pool.submit(solveKT_parallel, n, pos["row"], pos["column"], timeout, shared_state_name=shared_state.name, stop_on_solution=stop_on_first, omit_tracking=omit_tracking) for pos in start_positions]
 
         # Obtener los resultados a medida que se completan
         for task in concurrent.futures.as_completed(tasks):
@@ -153,5 +218,13 @@ def get_cases_knigth_tour_by_size_board(n, timeout=60):
             printSolution(n, result["Final Board"])
             print()
             list_boards.append(result)
+            if analytics is not None:
+                analytics.add(result, n)
+            if difficulty is not None:
+                difficulty.observe("bnb", n, result, timeout)
+
+        print("Profundidad máxima alcanzada:", shared_state.best_depth, "- posiciones resueltas:", shared_state.solved_count)
 
+    if difficulty is not None:
+        difficulty.save()
     return list_boards
\ No newline at end of file
@@ -0,0 +1,243 @@
+import concurrent.futures
+import time
+
+from src.utils.board_mask import knight_neighbours, new_board
+from src.utils.sat_solver import SAT, SATSolver, UNSAT
+# Python3 program to solve Knight Tour problem by reduction to SAT (Hamiltonian path)
+
+AMO_PAIRWISE_LIMIT = 5  # Hasta este tamaño se usa la codificacion por pares
+
+
+def generate_inputs(size, row=None):
+    total_inputs = []
+    rows = [row] if row is not None else range(size)
+    for i in rows:
+        for j in range(size):
+            total_inputs.append({"size": size, "row": i, "column": j})
+    return total_inputs
+
+
+def printSolution(n, board):
+    '''
+        A utility function to print Chessboard matrix
+    '''
+    for i in range(n):
+        for j in range(len(board[i])):
+            print(board[i][j], end=' ')
+        print()
+
+
+def quick_impossibility(neighbours, start=None, end=None):
+    '''
+        Cheap structural checks that prove no tour exists without any search.
+        Returns the reason as a string, or None if they are inconclusive.
+    '''
+    total = len(neighbours)
+    if total <= 1:
+        return None
+    isolated = [square for square, adjacent in neighbours.items() if not adjacent]
+    if isolated:
+        return f"Square {isolated[0]} has no knight moves"
+
+    # Las casillas de grado 1 solo pueden ser extremos del recorrido
+    dead_ends = {square for square, adjacent in neighbours.items() if len(adjacent) == 1}
+    endpoints = {square for square in (start, end) if square is not None}
+    if len(dead_ends | endpoints) > 2:
+        return f"{len(dead_ends | endpoints)} squares would need to be tour endpoints"
+
+    # El caballo alterna colores: los colores deben quedar balanceados
+    white = sum(1 for x, y in neighbours if (x + y) % 2 == 0)
+    black = total - white
+    if abs(white - black) > 1:
+        return f"Colour imbalance ({white} vs {black}) makes a tour impossible"
+    if start is not None:
+        start_colour = sum(start) % 2
+        first = white if start_colour == 0 else black
+        if first != (total + 1) // 2:
+            return "The start colour cannot begin a tour on this board"
+    if end is not None:
+        end_colour = sum(end) % 2
+        last_colour = (sum(start) + total - 1) % 2 if start is not None else None
+        if last_colour is not None and end_colour != last_colour:
+            return "The end square has the wrong colour for a tour from this start"
+    return None
+
+
+class HamiltonianEncoding:
+    '''
+        CNF encoding of a knight's tour as a Hamiltonian path.
+
+        Variable v(s, t) is true when square s is visited at step t. Every step
+        holds exactly one square, every square is visited exactly once and
+        consecutive steps are knight moves. With a fixed start the colour parity
+        removes half of the variables up front.
+    '''
+
+    def __init__(self, n, m=None, start=None, end=None, blocked=frozenset(), closed=False):
+        self.n = n
+        self.m = n if m is None else m
+        self.start = start
+        self.end = end
+        self.closed = closed
+        self.neighbours = knight_neighbours(n, self.m, frozenset(blocked))
+        self.squares = list(self.neighbours)
+        self.total = len(self.squares)
+        self.solver = SATSolver()
+        self.var = {}
+
+        for s in self.squares:
+            for t in range(self.total):
+                if self._allowed(s, t):
+                    self.var[(s, t)] = self.solver.new_var()
+        self._build()
+
+    def _allowed(self, s, t):
+        if self.start is not None:
+            if t == 0:
+                return s == self.start
+            if s == self.start:
+                return False
+            if (s[0] + s[1] + t) % 2 != sum(self.start) % 2:
+                return False
+        if self.end is not None:
+            if t == self.total - 1:
+                return s == self.end
+            if s == self.end:
+                return False
+        return True
+
+    def _exactly_one(self, lits):
+        solver = self.solver
+        if not lits:
+            solver.add_clause([])
+            return
+        solver.add_clause(lits)
+        if len(lits) <= AMO_PAIRWISE_LIMIT:
+            for i in range(len(lits)):
+                for j in range(i + 1, len(lits)):
+                    solver.add_clause([-lits[i], -lits[j]])
+            return
+        # Codificacion secuencial (Sinz): cantidad lineal de clausulas
+        prev = None
+        for i, lit in enumerate(lits[:-1]):
+            aux = solver.new_var()
+            solver.add_clause([-lit, aux])
+            if prev is not None:
+                solver.add_clause([-prev, aux])
+                solver.add_clause([-lit, -prev])
+            prev = aux
+        solver.add_clause([-lits[-1], -prev])
+
+    def _build(self):
+        var = self.var
+        for t in range(self.total):
+            self._exactly_one([var[(s, t)] for s in self.squares if (s, t) in var])
+        for s in self.squares:
+            self._exactly_one([var[(s, t)] for t in range(self.total) if (s, t) in var])
+
+        for (s, t), v in var.items():
+            # Si s esta en el paso t, algun vecino esta en el paso t + 1 (y en t - 1)
+            if t + 1 < self.total:
+                self.solver.add_clause([-v] + [var[(s2, t + 1)] for s2 in self.neighbours[s] if (s2, t + 1) in var])
+            if t > 0:
+                self.solver.add_clause([-v] + [var[(s2, t - 1)] for s2 in self.neighbours[s] if (s2, t - 1) in var])
+
+        if self.closed and self.start is not None:
+            self.solver.add_clause([var[(s, self.total - 1)] for s in self.neighbours[self.start] if (s, self.total - 1) in var])
+
+    def solve(self, deadline=None):
+        '''
+            Returns (status, path) where status is SAT, UNSAT or UNKNOWN.
+        '''
+        status, model = self.solver.solve(deadline=deadline)
+        if status != SAT:
+            return status, None
+        path = [None] * self.total
+        for (s, t), v in self.var.items():
+            if model[v]:
+                path[t] = s
+        return status, path
+
+
+def solveKT_parallel_sat(n, x_pos, y_pos, timeout, m=None, end=None, blocked=frozenset(), closed=False):
+    '''
+        Solves one start position with the SAT backend. Unlike the search
+        backends it can prove that no tour exists ("Proven Impossible").
+    '''
+    m = n if m is None else m
+    start_time = time.time()
+    start = (x_pos, y_pos)
+    board = new_board(n, blocked, m)
+    board[x_pos][y_pos] = 0
+
+    neighbours = knight_neighbours(n, m, frozenset(blocked))
+    reason = quick_impossibility(neighbours, start, end)
+    status, path, explored_nodes, conflicts = UNSAT, None, 0, 0
+    if reason is None:
+        encoding = HamiltonianEncoding(n, m, start=start, end=end, blocked=blocked, closed=closed)
+        status, path = encoding.solve(deadline=start_time + timeout)
+        explored_nodes = encoding.solver.decisions
+        conflicts = encoding.solver.conflicts
+        if status == UNSAT:
+            reason = "Exhaustive SAT search found no tour"
+
+    if path is not None:
+        for pos, (x, y) in enumerate(path):
+            board[x][y] = pos
+
+    end_time = time.time()
+    return {
+        "Start X": x_pos,
+        "Start Y": y_pos,
+        "Solution Found": status == SAT,
+        "Proven Impossible": status == UNSAT,
+        "Impossibility Reason": reason,
+        "Execution Time": end_time - start_time,
+        "Final Board": board,
+        "Tracking Board": None,
+        "Explored Nodes": explored_nodes,
+        "Conflicts": conflicts,
+    }
+
+
+def get_case_knigth_tour_sat_by_size_board_and_position(n, pos_x, pos_y, timeout=60):
+    result = solveKT_parallel_sat(n, pos_x, pos_y, timeout)
+    print("Resultado para posición inicial (", result["Start X"], ",", result["Start Y"], "):")
+    print("  - Solución encontrada:", result["Solution Found"])
+    print("  - Imposibilidad probada:", result["Proven Impossible"])
+    print("  - Tiempo de ejecución:", result["Execution Time"], "segundos")
+    print("  - Nodos explorados:", result["Explored Nodes"])
+    print("  - Tablero final:")
+    printSolution(n, result["Final Board"])
+    return result
+
+
+def get_cases_knigth_tour_sat_by_size_board(n, timeout=60, row=None, analytics=None, difficulty=None):
+    list_boards = []
+    start_positions = generate_inputs(n, row)
+    if difficulty is not None:
+        start_positions = difficulty.order("sat", n, start_positions)  # Las casillas mas costosas primero
+
+    # Ejecutamos en paralelo usando ProcessPoolExecutor
+    with concurrent.futures.ProcessPoolExecutor() as pool:
+        tasks = [pool.submit(solveKT_parallel_sat, n, pos["row"], pos["column"], timeout) for pos in start_positions]
+
+        for task in concurrent.futures.as_completed(tasks):
+            result = task.result()
+            print("Resultado para posición inicial (", result["Start X"], ",", result["Start Y"], "):")
+            print("  - Solución encontrada:", result["Solution Found"])
+            print("  - Imposibilidad probada:", result["Proven Impossible"])
+            print("  - Tiempo de ejecución:", result["Execution Time"], "segundos")
+            print("  - Nodos explorados:", result["Explored Nodes"])
+            print("  - Tablero final:")
+            printSolution(n, result["Final Board"])
+            print()
+            list_boards.append(result)
+            if analytics is not None:
+                analytics.add(result, n)
+            if difficulty is not None:
+                difficulty.observe("sat", n, result, timeout)
+
+    if difficulty is not None:
+        difficulty.save()
+    return list_boards
@@ -0,0 +1,133 @@
+import random
+import time
+
+from src.utils.board_mask import UNVISITED, knight_neighbours, new_board, playable_squares, target_allows, target_reachable, validate_mask
+from src.utils.shared_state import SharedSweepState
+# Python3 program to solve Knight Tour problem using Warnsdorff's rule with backtracking
+
+RESTART_GROWTH = 2  # Factor de crecimiento del presupuesto de nodos entre reinicios
+POLL_EVERY = 1024  # Nodos entre consultas al reloj y a la bandera de parada
+
+
+def _search(board, start, total, neighbours, target, rng, node_limit, deadline, shared_state, explored_nodes):
+    '''
+        Iterative depth-first search that always tries the square with the
+        fewest onward moves first (Warnsdorff). Ties are broken at random when
+        `rng` is given, otherwise by move order.
+
+        Returns True (tour found), False (no tour from this start), or None
+        when the node limit, the deadline or a stop request cut it short.
+    '''
+    def candidates(square, pos):
+        options = []
+        for i, (x, y) in enumerate(neighbours[square]):
+            if board[x][y] != UNVISITED or not target_allows((x, y), pos, total, target):
+                continue
+            degree = sum(1 for a, b in neighbours[(x, y)] if board[a][b] == UNVISITED)
+            options.append((degree, rng.random() if rng is not None else i, (x, y)))
+        options.sort()
+        return iter([square for _, _, square in options])
+
+    path = [start]
+    stack = [candidates(start, 1)]
+    nodes = 0
+    while stack:
+        if len(path) == total:
+            explored_nodes[0] += nodes
+            return True
+        nodes += 1
+        if nodes % POLL_EVERY == 0:
+            if time.time() >= deadline or (shared_state is not None and shared_state.stop_requested()):
+                explored_nodes[0] += nodes
+                return None
+        if node_limit is not None and nodes >= node_limit:
+            explored_nodes[0] += nodes
+            return None
+
+        square = next(stack[-1], None)
+        if square is None:
+            stack.pop()
+            x, y = path.pop()
+            if stack:
+                board[x][y] = UNVISITED
+            continue
+
+        pos = len(path)
+        board[square[0]][square[1]] = pos
+        path.append(square)
+        if shared_state is not None and pos > shared_state.local_best:
+            shared_state.publish_depth(pos)
+        if target_reachable(board, neighbours, square, pos + 1, total, target):
+            stack.append(candidates(square, pos + 1))
+        else:
+            stack.append(iter(()))
+    explored_nodes[0] += nodes
+    return False
+
+
+def solveKT_warnsdorff(n, x_pos, y_pos, timeout, blocked=(), target=None, seed=None, restart_nodes=None, shared_state_name=None, stop_on_solution=False, node_budget=None):
+    '''
+        Solves one start position with Warnsdorff's rule, backtracking when
+        the rule leads to a dead end.
+
+        With `seed`, ties are broken at random; with `restart_nodes` the search
+        restarts from scratch (new random ties) after that many nodes, doubling
+        the budget on every restart, so an unlucky early choice is abandoned.
+        A `node_budget` caps the nodes of all restarts together and replaces
+        the timeout, so a seeded run is reproducible.
+    '''
+    validate_mask(n, (x_pos, y_pos), blocked, target)
+    total = playable_squares(n, blocked)
+    neighbours = knight_neighbours(n, blocked=blocked)
+    rng = random.Random(seed) if seed is not None or restart_nodes is not None else None
+    start_time = time.time()
+    deadline = start_time + timeout if node_budget is None else float("inf")
+
+    shared_state = SharedSweepState.attach(shared_state_name, n) if shared_state_name is not None else None
+
+    explored_nodes = [0]
+    restarts = 0
+    node_limit = restart_nodes
+    success = None
+    while True:
+        board = new_board(n, blocked)
+        board[x_pos][y_pos] = 0
+        limit = node_limit
+        if node_budget is not None:
+            remaining = node_budget - explored_nodes[0]
+            limit = remaining if limit is None else min(limit, remaining)
+        success = _search(board, (x_pos, y_pos), total, neighbours, target, rng, limit, deadline, shared_state, explored_nodes)
+        if success is not None or node_limit is None:
+            break
+        if node_budget is not None and explored_nodes[0] >= node_budget:
+            break
+        if time.time() >= deadline or (shared_state is not None and shared_state.stop_requested()):
+            break
+        restarts += 1
+        node_limit = int(node_limit * RESTART_GROWTH)
+
+    end_time = time.time()
+    solved = success is True
+    stopped = success is None and shared_state is not None and shared_state.stop_requested()
+    if shared_state is not None:
+        if solved and stop_on_solution:
+            shared_state.request_stop()
+        shared_state.record_square(x_pos, y_pos, explored_nodes[0], shared_state.local_best, solved)
+        SharedSweepState.detach(shared_state_name)  # El bloque no se usa mas en esta tarea
+
+    result = {
+        "Start X": x_pos,
+        "Start Y": y_pos,
+        "Solution Found": solved,
+        "Execution Time": end_time - start_time,
+        "Final Board": board,
+        "Tracking Board": None,
+        "Explored Nodes": explored_nodes[0],
+        "Restarts": restarts,
+    }
+    if node_budget is not None:
+        result["Node Budget"] = node_budget
+        result["Seed"] = seed
+    if shared_state is not None:
+        result["Stopped Early"] = stopped
+    return result
@@ -0,0 +1,127 @@
+import json
+import math
+import os
+
+# Modelo persistente de dificultad por (algoritmo, n, casilla inicial).
+#
+# Cada corrida actualiza una media movil exponencial del log10 del tiempo y
+# de los nodos explorados. Las corridas cortadas por timeout son datos
+# censurados: el costo real es al menos el timeout, y se registran como tal.
+# Las casillas nunca medidas toman la estimacion de sus casillas simetricas
+# (el tablero cuadrado tiene 8 simetrias) y, si no hay ninguna, la del tamaño.
+
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".knight_tour_difficulty.json")
+ALPHA = 0.3  # Peso de la corrida nueva en la media movil
+MIN_TIME = 1e-6
+
+ALTERNATIVES = {"backtracking": "bnb", "sat": "bnb", "bnb": "warnsdorff"}  # Algoritmo sugerido cuando el elegido es demasiado lento
+
+
+def symmetric_squares(n, x, y):
+    '''
+        The (up to 8) squares equivalent to (x, y) under the symmetries of an n x n board.
+    '''
+    squares = set()
+    for a, b in ((x, y), (y, x)):
+        for sx in (a, n - 1 - a):
+            for sy in (b, n - 1 - b):
+                squares.add((sx, sy))
+    return squares
+
+
+class DifficultyModel:
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self.entries = {}
+        if path is not None and os.path.exists(path):
+            with open(path) as f:
+                try:
+                    self.entries = json.load(f)
+                except json.JSONDecodeError:
+                    self.entries = {}  # Archivo danado: se empieza de cero
+
+    @staticmethod
+    def _key(algorithm, n, x, y):
+        return f"{algorithm}:{n}:{x}:{y}"
+
+    def observe(self, algorithm, n, result, timeout=None):
+        '''
+            Updates the estimate of the result's start square from a sweep result.
+        '''
+        if result.get("Stopped Early"):
+            return  # Cortada por otro proceso: no dice nada del costo real
+        timed_out = not result["Solution Found"] and timeout is not None and result["Execution Time"] >= timeout
+        seconds = max(result["Execution Time"], timeout if timed_out else 0, MIN_TIME)
+        nodes = max(result["Explored Nodes"], 1)
+
+        key = self._key(algorithm, n, result["Start X"], result["Start Y"])
+        entry = self.entries.get(key)
+        if entry is None:
+            entry = self.entries[key] = {"Runs": 0, "Log Time": math.log10(seconds), "Log Nodes": math.log10(nodes), "Solved": 0, "Timeouts": 0}
+        else:
+            entry["Log Time"] += ALPHA * (math.log10(seconds) - entry["Log Time"])
+            entry["Log Nodes"] += ALPHA * (math.log10(nodes) - entry["Log Nodes"])
+            if timed_out:
+                # Censurado: la estimacion nunca queda por debajo del timeout
+                entry["Log Time"] = max(entry["Log Time"], math.log10(seconds))
+        entry["Runs"] += 1
+        entry["Solved"] += bool(result["Solution Found"])
+        entry["Timeouts"] += timed_out
+
+    def _log_time(self, algorithm, n, x, y):
+        entry = self.entries.get(self._key(algorithm, n, x, y))
+        if entry is not None:
+            return entry["Log Time"]
+        known = [self.entries[k]["Log Time"] for k in (self._key(algorithm, n, sx, sy) for sx, sy in symmetric_squares(n, x, y)) if k in self.entries]
+        if known:
+            return sum(known) / len(known)
+        prefix = f"{algorithm}:{n}:"
+        known = [entry["Log Time"] for key, entry in self.entries.items() if key.startswith(prefix)]
+        if known:
+            return max(known)  # Sin datos de la casilla: se asume el peor caso del tamaño
+        return None
+
+    def estimate(self, algorithm, n, x, y):
+        '''
+            Estimated seconds for this start square, or None if nothing is known.
+        '''
+        log_time = self._log_time(algorithm, n, x, y)
+        return None if log_time is None else 10 ** log_time
+
+    def order(self, algorithm, n, positions):
+        '''
+            Sorts sweep inputs ({"row", "column"} dicts) most expensive first,
+            so the long runs start early and do not become the straggler tail.
+            Unknown squares go first too, their cost is unknown.
+        '''
+        def cost(position):
+            estimate = self.estimate(algorithm, n, position["row"], position["column"])
+            return math.inf if estimate is None else estimate
+        return sorted(positions, key=cost, reverse=True)
+
+    def recommend(self, algorithm, n, x, y, budget, choices=None):
+        '''
+            Returns (alternative algorithm, estimated seconds) if the chosen
+            algorithm is expected to take longer than `budget` seconds for this
+            square, or None if it should be used as chosen. `choices` limits
+            the alternatives to the algorithms the caller can run.
+        '''
+        estimate = self.estimate(algorithm, n, x, y)
+        alternative = ALTERNATIVES.get(algorithm)
+        if choices is not None and alternative not in choices:
+            alternative = None
+        if estimate is None or estimate <= budget or alternative is None:
+            return None
+        other = self.estimate(alternative, n, x, y)
+        if other is not None and other >= estimate:
+            return None
+        return alternative, estimate
+
+    def save(self):
+        if self.path is None:
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.entries, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)  # Reemplazo atomico
@@ -0,0 +1,190 @@
+import time
+from typing import Callable, Final, List, Optional, Tuple
+
+# Nucleo tipado de los solvers de backtracking y Branch and Bound.
+#
+# Mismo recorrido y mismo conteo de nodos que solveKTUtil_backtracking y
+# solveKTUtil, pero sin recursion y sobre arreglos planos de enteros
+# indexados por casilla (x * n + y). Todo esta anotado para que mypyc pueda
+# compilarlo:
+#
+#     python -m src.utils.build_core
+#
+# deja un fast_core.*.so junto a este archivo, que Python importa antes que
+# el .py. Sin esa compilacion se usa este mismo codigo interpretado.
+# tests/test_fast_core.py (o `python -m src.utils.build_core --check`)
+# compara la version cargada contra los solvers recursivos.
+#
+# Solo cubre el caso comun (sin tabla de transposicion, sin casilla final
+# obligatoria y sin tracking); los solvers usan el camino recursivo para el resto.
+
+EXHAUSTED: Final = 0  # No hay recorrido desde la casilla inicial
+FOUND: Final = 1  # Recorrido completo en el tablero
+CUT: Final = 2  # Cortado por presupuesto de nodos, tiempo o pedido de parada
+FREE: Final = -1  # Casilla sin visitar (UNVISITED)
+NO_SQUARE: Final = -1  # Movimiento fuera del tablero en la tabla de vecinos
+END: Final = -2  # Fin de la lista de vecinos de una casilla (tabla con mascara)
+POLL_EVERY: Final = 1024  # Nodos entre consultas al reloj y al callback
+
+COMPILED: Final = not __file__.endswith(".py")  # True si se cargo la extension compilada
+
+
+def neighbour_table(n: int, move_x: List[int], move_y: List[int], board: List[int], masked: bool) -> List[int]:
+    '''
+        Flat table of 8 entries per square, in the given move order. Without a
+        mask every move has its slot (NO_SQUARE when it leaves the board), like
+        the raw offsets; with `masked`, the squares on the board that are not
+        blocked come first and the rest of the slots are END, like knight_neighbours.
+    '''
+    table: List[int] = [END if masked else NO_SQUARE] * (n * n * 8)
+    for x in range(n):
+        for y in range(n):
+            base = (x * n + y) * 8
+            k = 0
+            for i in range(8):
+                a = x + move_x[i]
+                b = y + move_y[i]
+                if 0 <= a < n and 0 <= b < n and not (masked and board[a * n + b] < FREE):
+                    table[base + (k if masked else i)] = a * n + b
+                    k += 1
+    return table
+
+
+def distance_table(n: int) -> List[int]:
+    '''
+        Squared distance to the centre, times 4 so it stays an integer; it
+        orders squares exactly like distanceToWalls.
+    '''
+    table: List[int] = [0] * (n * n)
+    for x in range(n):
+        for y in range(n):
+            dx = 2 * x - n + 1
+            dy = 2 * y - n + 1
+            table[x * n + y] = dx * dx + dy * dy
+    return table
+
+
+def solve_backtracking(n: int, board: List[int], start: int, total: int, move_x: List[int], move_y: List[int], masked: bool,
+                       node_budget: int, deadline: float, poll: Optional[Callable[[int], bool]]) -> Tuple[int, int, int]:
+    '''
+        Plain backtracking over `board` (flat, FREE or a move number; blocked
+        squares hold a value below FREE, skipped from the table when `masked`).
+        `node_budget` < 0 means no budget.
+        `poll(best_depth)` is called every POLL_EVERY nodes and stops the
+        search when it returns True. Returns (status, explored nodes, deepest
+        path length reached).
+    '''
+    table = neighbour_table(n, move_x, move_y, board, masked)
+    path: List[int] = [0] * (total + 1)
+    cursor: List[int] = [0] * (total + 1)
+    path[0] = start
+    depth = 1  # Numero del proximo movimiento (largo del camino)
+    best = 1
+    nodes = 0
+    entries = 0
+    while True:
+        # Entrada a un nodo: mismas condiciones de corte que solveKTUtil_backtracking
+        if depth == total:
+            return FOUND, nodes, best
+        if node_budget >= 0 and nodes >= node_budget:
+            return CUT, nodes, best
+        entries += 1
+        if entries % POLL_EVERY == 0:
+            if time.time() >= deadline:
+                return CUT, nodes, best
+            if poll is not None and poll(best):
+                return CUT, nodes, best
+
+        while True:
+            level = depth - 1
+            square = path[level]
+            i = cursor[level]
+            if i == 8 or table[square * 8 + i] == END:
+                if level == 0:
+                    return EXHAUSTED, nodes, best
+                board[square] = FREE  # Backtracking
+                depth = level
+                continue
+            cursor[level] = i + 1
+            nodes += 1
+            nxt = table[square * 8 + i]
+            if nxt != NO_SQUARE and board[nxt] == FREE:
+                board[nxt] = depth
+                path[depth] = nxt
+                cursor[depth] = 0
+                depth += 1
+                if depth > best:
+                    best = depth
+                break
+
+
+def solve_bnb(n: int, board: List[int], start: int, total: int, move_x: List[int], move_y: List[int], masked: bool,
+              node_budget: int, deadline: float, poll: Optional[Callable[[int], bool]]) -> Tuple[int, int, int]:
+    '''
+        Branch and Bound of concurrent_bnb (moves furthest from the centre
+        first, only the first one when 4 or more are open) on the same flat
+        board. Same arguments and return value as solve_backtracking.
+    '''
+    table = neighbour_table(n, move_x, move_y, board, masked)
+    distance = distance_table(n)
+    path: List[int] = [0] * (total + 1)
+    choices: List[int] = [0] * ((total + 1) * 8)  # Candidatos ordenados de cada nivel
+    count: List[int] = [0] * (total + 1)
+    cursor: List[int] = [0] * (total + 1)
+    path[0] = start
+    depth = 1
+    best = 1
+    nodes = 0
+    entries = 0
+    while True:
+        if depth == total:
+            return FOUND, nodes, best
+        if node_budget >= 0 and nodes >= node_budget:
+            return CUT, nodes, best
+        entries += 1
+        if entries % POLL_EVERY == 0:
+            if time.time() >= deadline:
+                return CUT, nodes, best
+            if poll is not None and poll(best):
+                return CUT, nodes, best
+
+        # branch(): insercion estable de mayor a menor distancia, igual que sort(reverse=True)
+        level = depth - 1
+        square = path[level]
+        base = level * 8
+        k = 0
+        for i in range(8):
+            nxt = table[square * 8 + i]
+            if nxt == END:
+                break
+            nodes += 1
+            if nxt != NO_SQUARE and board[nxt] == FREE:
+                key = distance[nxt]
+                j = k
+                while j > 0 and distance[choices[base + j - 1]] < key:
+                    choices[base + j] = choices[base + j - 1]
+                    j -= 1
+                choices[base + j] = nxt
+                k += 1
+        if k >= 4:  # bound()
+            k = 1
+        count[level] = k
+        cursor[level] = 0
+
+        while True:
+            level = depth - 1
+            if cursor[level] == count[level]:
+                if level == 0:
+                    return EXHAUSTED, nodes, best
+                board[path[level]] = FREE  # Backtracking
+                depth = level
+                continue
+            nxt = choices[level * 8 + cursor[level]]
+            cursor[level] += 1
+            board[nxt] = depth
+            path[depth] = nxt
+            depth += 1
+            if depth > best:
+                best = depth
+            break
+
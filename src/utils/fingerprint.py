@@ -0,0 +1,149 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+from src.utils.orchestrator import DETERMINISTIC_ALGORITHMS, _parse_sizes, run_sweeps
+
+# Huellas de resultados para detectar regresiones de comportamiento.
+#
+# Con node_budget y seed cada corrida (algoritmo, n, casilla) es reproducible:
+# no depende del reloj ni del orden en que terminan los procesos. La huella es
+# un hash estable del resultado sin los campos de tiempo, asi una optimizacion
+# de solveKTUtil se puede comparar contra un archivo de referencia: si la
+# huella cambia, cambio la busqueda y no solo la velocidad.
+
+FINGERPRINT_VERSION = 1  # Se incrementa si cambia el contenido hasheado
+DEFAULT_NODE_BUDGET = 200_000
+
+
+def _digest(payload):
+    text = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+def _tour(result):
+    if result.get("Final Path") is not None:
+        return list(result["Final Path"])
+    board = result.get("Final Board")
+    return [value for row in board for value in row] if board is not None else None
+
+
+def tour_fingerprint(result):
+    '''
+        Hash of the final board (or path) only: equal for two runs that end
+        in the same tour or partial tour, however they got there.
+    '''
+    return _digest({"v": FINGERPRINT_VERSION, "tour": _tour(result)})
+
+
+def result_fingerprint(algorithm, n, result):
+    '''
+        Stable hash of everything a deterministic run decides: the start, the
+        outcome, the explored node count and the final board. Execution time
+        and other timing fields are left out.
+    '''
+    return _digest({
+        "v": FINGERPRINT_VERSION,
+        "algorithm": algorithm,
+        "n": n,
+        "start": [result["Start X"], result["Start Y"]],
+        "found": bool(result["Solution Found"]),
+        "nodes": result["Explored Nodes"],
+        "budget": result.get("Node Budget"),
+        "seed": result.get("Seed"),
+        "tour": _tour(result),
+    })
+
+
+def result_key(algorithm, n, result):
+    return f"{algorithm}:{n}:{result['Start X']}:{result['Start Y']}"
+
+
+def fingerprint_entry(algorithm, n, result):
+    return {
+        "fingerprint": result_fingerprint(algorithm, n, result),
+        "tour": tour_fingerprint(result),
+        "found": bool(result["Solution Found"]),
+        "nodes": result["Explored Nodes"],
+    }
+
+
+def fingerprint_sweep(sizes, algorithms=DETERMINISTIC_ALGORITHMS, node_budget=DEFAULT_NODE_BUDGET, seed=None, workers=None):
+    '''
+        Runs a deterministic sweep and returns {key: entry} sorted by key, so
+        the output does not depend on the order the workers finish in.
+    '''
+    if node_budget is None:
+        raise ValueError("A fingerprint sweep needs a node budget")
+    results, _ = run_sweeps(sizes, algorithms, None, workers, node_budget=node_budget, seed=seed)
+    entries = {}
+    for (algorithm, n), group in results.items():
+        for result in group:
+            if "Error" in result:  # Una huella incompleta no sirve para comparar
+                raise RuntimeError(f"{result_key(algorithm, n, result)} failed: {result['Error']}")
+            entries[result_key(algorithm, n, result)] = fingerprint_entry(algorithm, n, result)
+    return dict(sorted(entries.items()))
+
+
+def compare_fingerprints(expected, actual):
+    '''
+        Differences between two fingerprint maps as (key, kind) pairs. kind is
+        "missing", "new", "tour" (different final board) or "search" (same
+        board but a different node count or outcome).
+    '''
+    differences = []
+    for key in sorted(set(expected) | set(actual)):
+        if key not in actual:
+            differences.append((key, "missing"))
+        elif key not in expected:
+            differences.append((key, "new"))
+        elif expected[key]["fingerprint"] != actual[key]["fingerprint"]:
+            differences.append((key, "tour" if expected[key]["tour"] != actual[key]["tour"] else "search"))
+    return differences
+
+
+def save_fingerprints(path, entries, node_budget, seed):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"version": FINGERPRINT_VERSION, "node_budget": node_budget, "seed": seed, "results": entries}, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)  # Reemplazo atomico
+
+
+def load_fingerprints(path):
+    with open(path) as f:
+        data = json.load(f)
+    if data.get("version") != FINGERPRINT_VERSION:
+        raise ValueError(f"Fingerprint file version {data.get('version')} != {FINGERPRINT_VERSION}")
+    return data
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Deterministic sweep fingerprints for regression checks")
+    parser.add_argument("--sizes", default="5-6", help="e.g. 5-8 or 5,6,10")
+    parser.add_argument("--algorithms", default=",".join(DETERMINISTIC_ALGORITHMS))
+    parser.add_argument("--node-budget", type=int, default=DEFAULT_NODE_BUDGET)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--write", metavar="FILE", help="save the fingerprints as the reference")
+    group.add_argument("--check", metavar="FILE", help="compare against a saved reference (same budget and seed)")
+    args = parser.parse_args()
+
+    node_budget, seed = args.node_budget, args.seed
+    if args.check:
+        reference = load_fingerprints(args.check)
+        node_budget, seed = reference["node_budget"], reference["seed"]  # La referencia fija las condiciones
+    entries = fingerprint_sweep(_parse_sizes(args.sizes), args.algorithms.split(","), node_budget, seed, args.workers)
+
+    if args.write:
+        save_fingerprints(args.write, entries, node_budget, seed)
+        print(f"{len(entries)} huellas guardadas en {args.write} (presupuesto {node_budget} nodos, semilla {seed})")
+    else:
+        expected = {key: entry for key, entry in reference["results"].items() if key in entries}  # Solo lo que se volvio a correr
+        differences = compare_fingerprints(expected, entries)
+        for key, kind in differences:
+            print(f"  - {key}: {kind}")
+        print(f"{len(entries)} huellas comparadas, {len(differences)} diferencias")
+        sys.exit(1 if differences else 0)
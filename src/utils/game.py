@@ -132,4 +132,8 @@ class GameInput:
         opt1_label = FONT.render("1- Backtracking Básico", True, BLACK)
         self.screen.blit(opt1_label, (60, 240))
         opt2_label = FONT.render("2- Branch & Bound", True, BLACK)
-        self.screen.blit(opt2_label, (60, 260))
\ No newline at end of file
+        self.screen.blit(opt2_label, (60, 260))
+        opt3_label = FONT.render("3- SAT", True, BLACK)
+        self.screen.blit(opt3_label, (250, 240))
+        opt4_label = FONT.render("4- Portafolio (carrera)", True, BLACK)
+        self.screen.blit(opt4_label, (250, 260))
\ No newline at end of file
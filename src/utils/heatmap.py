@@ -0,0 +1,221 @@
+import json
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+# Analitica de barridos sin pandas. Los resultados se consumen de a uno (por
+# ejemplo directamente desde as_completed o desde un checkpoint) y se
+# acumulan en arreglos fijos por tamaño de tablero, asi la memoria no crece
+# con la cantidad de resultados. Los percentiles salen de histogramas con
+# intervalos logaritmicos en lugar de guardar cada muestra.
+
+HISTOGRAM_BINS = 512  # ~5% de ancho relativo por intervalo
+TIME_RANGE = (1e-6, 1e5)  # segundos
+NODE_RANGE = (1.0, 1e12)
+
+METRICS = ("Execution Time", "Explored Nodes")
+
+
+class LogHistogram:
+    '''
+        Fixed-size histogram over log10-spaced bins; values outside the range
+        are clamped into the first/last bin.
+    '''
+
+    def __init__(self, low, high, bins=HISTOGRAM_BINS):
+        self.edges = np.logspace(np.log10(low), np.log10(high), bins + 1)
+        self.counts = np.zeros(bins, dtype=np.int64)
+
+    def add(self, value):
+        index = np.searchsorted(self.edges, value, side="right") - 1
+        self.counts[min(max(index, 0), len(self.counts) - 1)] += 1
+
+    def percentile(self, q):
+        total = self.counts.sum()
+        if total == 0:
+            return float("nan")
+        cumulative = np.cumsum(self.counts)
+        index = int(np.searchsorted(cumulative, q / 100 * total))
+        index = min(index, len(self.counts) - 1)
+        # Punto medio geometrico del intervalo
+        return float(np.sqrt(self.edges[index] * self.edges[index + 1]))
+
+
+class SizeAccumulator:
+    '''
+        Per-square running sums for one board size.
+    '''
+
+    def __init__(self, n):
+        self.n = n
+        self.runs = np.zeros((n, n), dtype=np.int64)
+        self.solved = np.zeros((n, n), dtype=np.int64)
+        self.time_sum = np.zeros((n, n), dtype=np.float64)
+        self.node_sum = np.zeros((n, n), dtype=np.float64)
+        self.histograms = {
+            "Execution Time": LogHistogram(*TIME_RANGE),
+            "Explored Nodes": LogHistogram(*NODE_RANGE),
+        }
+
+    def add(self, result):
+        if result.get("Stopped Early"):
+            return  # Cortada por otro proceso: no es una corrida completa ni un fracaso
+        x, y = result["Start X"], result["Start Y"]
+        self.runs[x, y] += 1
+        self.solved[x, y] += bool(result["Solution Found"])
+        self.time_sum[x, y] += result["Execution Time"]
+        self.node_sum[x, y] += result["Explored Nodes"]
+        for metric, histogram in self.histograms.items():
+            histogram.add(result[metric])
+
+    def _mean(self, sums):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.runs > 0, sums / self.runs, np.nan)
+
+    @property
+    def time_map(self):
+        return self._mean(self.time_sum)
+
+    @property
+    def node_map(self):
+        return self._mean(self.node_sum)
+
+    @property
+    def success_rate(self):
+        return self._mean(self.solved.astype(np.float64))
+
+
+class SweepAnalytics:
+    '''
+        Streaming analytics stage for sweep results. Feed it result dicts with
+        `add` or `consume` and read heatmaps, success matrices and percentile
+        tables per board size at any time.
+    '''
+
+    def __init__(self):
+        self.sizes = {}
+
+    def add(self, result, n=None):
+        if result.get("Stopped Early"):
+            return  # Igual que DifficultyModel.observe: no dice nada del costo real
+        if n is None:
+            n = result.get("size") or len(result["Final Board"])
+        accumulator = self.sizes.get(n)
+        if accumulator is None:
+            accumulator = self.sizes[n] = SizeAccumulator(n)
+        accumulator.add(result)
+
+    def consume(self, results, n=None):
+        '''
+            Adds every result of an iterable and yields it on, so the stage can
+            sit between a sweep and whatever else consumes its results.
+        '''
+        for result in results:
+            self.add(result, n)
+            yield result
+
+    def percentile_table(self, percentiles=(50, 90, 99)):
+        '''
+            One row per board size and metric with run/solve counts and the
+            requested percentiles (approximate, from the log histograms).
+        '''
+        rows = []
+        for n in sorted(self.sizes):
+            accumulator = self.sizes[n]
+            for metric in METRICS:
+                row = {
+                    "Size": n,
+                    "Metric": metric,
+                    "Runs": int(accumulator.runs.sum()),
+                    "Solved": int(accumulator.solved.sum()),
+                }
+                histogram = accumulator.histograms[metric]
+                for q in percentiles:
+                    row[f"P{q}"] = histogram.percentile(q)
+                rows.append(row)
+        return rows
+
+    def render(self, n, path, dpi=100):
+        '''
+            Writes time, explored nodes and success-rate heatmaps for size n to
+            a PNG file. Uses the Agg canvas directly, no interactive backend.
+        '''
+        accumulator = self.sizes[n]
+        panels = (
+            ("Tiempo medio (s)", accumulator.time_map, "viridis", True),
+            ("Nodos explorados", accumulator.node_map, "magma", True),
+            ("Tasa de éxito", accumulator.success_rate, "RdYlGn", False),
+        )
+        figure = Figure(figsize=(5 * len(panels), 4.5))
+        FigureCanvasAgg(figure)
+        for i, (title, values, cmap, logarithmic) in enumerate(panels):
+            axes = figure.add_subplot(1, len(panels), i + 1)
+            shown = np.log10(np.where(values > 0, values, np.nan)) if logarithmic else values
+            image = axes.imshow(shown, cmap=cmap, vmin=None if logarithmic else 0, vmax=None if logarithmic else 1)
+            axes.set_title(f"{title} - {n}x{n}" + (" [log10]" if logarithmic else ""))
+            axes.set_xlabel("Columna")
+            axes.set_ylabel("Fila")
+            figure.colorbar(image, ax=axes, fraction=0.046)
+            if n <= 10:
+                for x in range(n):
+                    for y in range(n):
+                        if not np.isnan(values[x, y]):
+                            axes.text(y, x, f"{values[x, y]:.2g}", ha="center", va="center", fontsize=7, color="white")
+        figure.tight_layout()
+        figure.savefig(path, dpi=dpi)
+        return path
+
+    def render_all(self, path_pattern="heatmap_{n}x{n}.png", dpi=100):
+        return [self.render(n, path_pattern.format(n=n), dpi) for n in sorted(self.sizes)]
+
+
+def iter_checkpoint_results(checkpoint_path):
+    '''
+        Streams (size, result) pairs from a sweep checkpoint file line by line,
+        so checkpoints of any length (and any mix of sizes) can be analysed.
+    '''
+    with open(checkpoint_path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Linea truncada por una interrupcion
+            yield entry["size"], entry["result"]
+
+
+def merge_checkpoint_slices(results):
+    '''
+        One result per (size, start square) from a stream of checkpoint
+        results: a square resumed over several runs is one run. The resumable
+        solver carries the node count over in its saved state and records the
+        time of all slices in "Total Execution Time", so the last slice holds
+        the totals. Only the fields used by the analytics are kept.
+    '''
+    merged = {}
+    for n, result in results:
+        merged[(n, result["Start X"], result["Start Y"])] = {
+            "Start X": result["Start X"],
+            "Start Y": result["Start Y"],
+            "Solution Found": result["Solution Found"],
+            "Execution Time": result.get("Total Execution Time", result["Execution Time"]),
+            "Explored Nodes": result["Explored Nodes"],
+        }
+    for (n, _, _), result in merged.items():
+        yield n, result
+
+
+def analyze_checkpoint(checkpoint_path, analytics=None):
+    analytics = SweepAnalytics() if analytics is None else analytics
+    for n, result in merge_checkpoint_slices(iter_checkpoint_results(checkpoint_path)):
+        analytics.add(result, n)
+    return analytics
+
+
+def print_percentile_table(rows):
+    for row in rows:
+        values = "  ".join(f"{key}: {value:.4g}" for key, value in row.items() if key.startswith("P"))
+        print(f"{row['Size']}x{row['Size']} {row['Metric']:<15} ejecuciones: {row['Runs']} resueltas: {row['Solved']}  {values}")
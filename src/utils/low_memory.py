@@ -0,0 +1,160 @@
+import argparse
+import resource
+import sys
+import time
+from array import array
+
+from src.utils.board_mask import MOVE_X, MOVE_Y, playable_squares, validate_mask
+
+# Modo de memoria acotada para tableros enormes (n en los cientos).
+#
+# Todo el estado vive en arreglos planos indexados por casilla (x * n + y):
+#   board   array('I')  numero de movimiento + 1 (0 = libre, FREE_BLOCKED = bloqueada)
+#   degree  bytearray   movimientos libres desde cada casilla (regla de Warnsdorff)
+#   path    array('I')  casillas del camino actual
+#   tried   bytearray   por nivel, mascara de 8 bits de movimientos ya probados
+#
+# No hay recursion: el nivel es el largo del camino y el cursor de cada nivel
+# es un byte. El orden de los candidatos se recalcula al volver atras, por eso
+# basta con la mascara (el tablero se restaura exactamente).
+
+BLOCKED_SQUARE = 0xFFFFFFFF
+POLL_EVERY = 4096  # Nodos entre consultas al reloj
+HEURISTICS = ("warnsdorff", "none")
+
+
+def peak_rss_mb():
+    '''
+        Peak resident set size of this process in MB (ru_maxrss is KB on Linux, bytes on macOS).
+    '''
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def solveKT_low_memory(n, x_pos, y_pos, timeout, blocked=(), heuristic="warnsdorff"):
+    '''
+        Solves one start position keeping O(n^2) bytes of flat state.
+
+        heuristic="warnsdorff" tries the move with the fewest onward moves
+        first (ties: furthest from the centre), which finds tours on very large
+        boards with little or no backtracking; "none" keeps the usual move order.
+        Returns the sweep result dict with "Final Path" (array of square
+        indices) instead of a "Final Board" matrix, plus "Peak RSS MB".
+    '''
+    if heuristic not in HEURISTICS:
+        raise ValueError(f"Unknown heuristic: {heuristic}")
+    validate_mask(n, (x_pos, y_pos), blocked)
+    start_time = time.time()
+    deadline = start_time + timeout
+    total = playable_squares(n, blocked)
+    warnsdorff = heuristic == "warnsdorff"
+
+    board = array("I", bytes(4 * n * n))
+    for x, y in blocked:
+        board[x * n + y] = BLOCKED_SQUARE
+
+    def free(x, y):
+        return 0 <= x < n and 0 <= y < n and board[x * n + y] == 0
+
+    degree = bytearray(n * n)
+    for x in range(n):
+        for y in range(n):
+            degree[x * n + y] = sum(1 for i in range(8) if free(x + MOVE_X[i], y + MOVE_Y[i]))
+
+    # Distancia al centro (al cuadrado, x4 para quedar en enteros) para desempatar
+    def centre(x, y):
+        return (2 * x - n + 1) ** 2 + (2 * y - n + 1) ** 2
+
+    def visit(x, y, pos):
+        board[x * n + y] = pos + 1
+        for i in range(8):
+            a, b = x + MOVE_X[i], y + MOVE_Y[i]
+            if 0 <= a < n and 0 <= b < n:
+                degree[a * n + b] -= 1
+
+    def leave(x, y):
+        board[x * n + y] = 0
+        for i in range(8):
+            a, b = x + MOVE_X[i], y + MOVE_Y[i]
+            if 0 <= a < n and 0 <= b < n:
+                degree[a * n + b] += 1
+
+    path = array("I", [x_pos * n + y_pos])
+    tried = bytearray(1)
+    visit(x_pos, y_pos, 0)
+    explored_nodes = 0
+    success = False
+
+    while path:
+        if len(path) == total:
+            success = True
+            break
+        explored_nodes += 1
+        if explored_nodes % POLL_EVERY == 0 and time.time() >= deadline:
+            break
+
+        x, y = divmod(path[-1], n)
+        mask = tried[-1]
+        best, best_key = -1, None
+        for i in range(8):
+            if mask & (1 << i):
+                continue
+            a, b = x + MOVE_X[i], y + MOVE_Y[i]
+            if not free(a, b):
+                continue
+            if not warnsdorff:
+                best = i
+                break
+            key = (degree[a * n + b], -centre(a, b))
+            if best_key is None or key < best_key:
+                best, best_key = i, key
+
+        if best < 0:
+            # Sin movimientos: se vuelve al nivel anterior
+            path.pop()
+            tried.pop()
+            if path:
+                leave(x, y)
+            continue
+
+        tried[-1] = mask | (1 << best)
+        a, b = x + MOVE_X[best], y + MOVE_Y[best]
+        visit(a, b, len(path))
+        path.append(a * n + b)
+        tried.append(0)
+
+    end_time = time.time()
+    return {
+        "Start X": x_pos,
+        "Start Y": y_pos,
+        "Solution Found": success,
+        "Execution Time": end_time - start_time,
+        "Final Board": None,
+        "Final Path": path if success else array("I"),
+        "Tracking Board": None,
+        "Explored Nodes": explored_nodes,
+        "State Bytes": board.itemsize * len(board) + len(degree) + path.itemsize * len(path) + len(tried),
+        "Peak RSS MB": peak_rss_mb(),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Low-memory knight's tour for very large boards")
+    parser.add_argument("n", type=int)
+    parser.add_argument("x", type=int, nargs="?", default=0)
+    parser.add_argument("y", type=int, nargs="?", default=0)
+    parser.add_argument("--timeout", type=float, default=600)
+    parser.add_argument("--heuristic", choices=HEURISTICS, default="warnsdorff")
+    parser.add_argument("--validate", action="store_true", help="check the tour with the vectorised validator")
+    args = parser.parse_args()
+
+    result = solveKT_low_memory(args.n, args.x, args.y, args.timeout, heuristic=args.heuristic)
+    print("Resultado para posición inicial (", result["Start X"], ",", result["Start Y"], "):")
+    print("  - Solución encontrada:", result["Solution Found"])
+    print("  - Tiempo de ejecución:", result["Execution Time"], "segundos")
+    print("  - Nodos explorados:", result["Explored Nodes"])
+    print("  - Memoria del estado:", round(result["State Bytes"] / (1024 * 1024), 2), "MB")
+    print("  - Pico de memoria (RSS):", round(result["Peak RSS MB"], 1), "MB")
+    if args.validate and result["Solution Found"]:
+        from src.utils.validator import validate_path
+        print("  - Recorrido válido:", validate_path(result["Final Path"], args.n).valid)
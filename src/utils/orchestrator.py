@@ -0,0 +1,208 @@
+import argparse
+import concurrent.futures
+import os
+import time
+from collections import deque
+
+from src.utils.concurrent_backtracking import generate_inputs, solveKT_parallel_backtracking
+from src.utils.concurrent_bnb import solveKT_parallel
+from src.utils.concurrent_sat import solveKT_parallel_sat
+from src.utils.concurrent_warnsdorff import solveKT_warnsdorff
+from src.utils.heatmap import SweepAnalytics, print_percentile_table
+
+# Orquestador de barridos de varios tamaños y algoritmos sobre un unico pool
+# de procesos. Las tareas (algoritmo, n, casilla) de todos los grupos se
+# intercalan en ronda, y se mantienen solo unas pocas en vuelo por proceso:
+# ningun grupo acapara el pool y no quedan nucleos ociosos entre un tamaño y
+# el siguiente.
+
+ALGORITHMS = ("backtracking", "bnb", "sat", "warnsdorff")
+DETERMINISTIC_ALGORITHMS = ("backtracking", "bnb", "warnsdorff")  # Aceptan node_budget y seed
+IN_FLIGHT_PER_WORKER = 2  # Tareas enviadas por proceso antes de esperar resultados
+
+
+def run_task(algorithm, n, x_pos, y_pos, timeout, node_budget=None, seed=None):
+    '''
+        Runs inside a pool worker. Drops the tracking data before pickling.
+        With a node_budget the run is deterministic (see DETERMINISTIC_ALGORITHMS).
+    '''
+    if node_budget is not None and algorithm not in DETERMINISTIC_ALGORITHMS:
+        raise ValueError(f"{algorithm} has no node budget mode")
+    if algorithm == "backtracking":
+        result = solveKT_parallel_backtracking(n, x_pos, y_pos, timeout, True, node_budget=node_budget, seed=seed)
+    elif algorithm == "bnb":
+        result = solveKT_parallel(n, x_pos, y_pos, timeout, node_budget=node_budget, seed=seed, omit_tracking=True)
+    elif algorithm == "sat":
+        result = solveKT_parallel_sat(n, x_pos, y_pos, timeout)
+    elif algorithm == "warnsdorff":
+        result = solveKT_warnsdorff(n, x_pos, y_pos, timeout, seed=seed, node_budget=node_budget)
+    else:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    result["Tracking Board"] = None
+    return result
+
+
+class SweepGroup:
+    '''
+        Pending and finished tasks of one (algorithm, n) sweep.
+    '''
+
+    def __init__(self, algorithm, n, timeout, positions):
+        self.algorithm = algorithm
+        self.n = n
+        self.timeout = timeout
+        self.pending = deque(positions)
+        self.total = len(self.pending)
+        self.results = []
+        self.solved = 0
+        self.started = None
+        self.finished = None
+
+    @property
+    def done(self):
+        return len(self.results) == self.total
+
+
+def interleave(groups):
+    '''
+        Round-robin over the groups: one task of each group in turn until all are empty.
+    '''
+    active = deque(group for group in groups if group.pending)
+    while active:
+        group = active.popleft()
+        yield group, group.pending.popleft()
+        if group.pending:
+            active.append(group)
+
+
+def _timeout_for(timeouts, n):
+    return timeouts.get(n) if isinstance(timeouts, dict) else timeouts  # Sin timeout solo con node_budget (validado en run_sweeps)
+
+
+def error_result(position, error):
+    '''
+        Result recorded for a square whose task raised, so the rest of the
+        sweep keeps going. It is not counted in the analytics.
+    '''
+    return {
+        "Start X": position["row"],
+        "Start Y": position["column"],
+        "Solution Found": False,
+        "Execution Time": 0.0,
+        "Final Board": None,
+        "Tracking Board": None,
+        "Explored Nodes": 0,
+        "Error": f"{type(error).__name__}: {error}",
+    }
+
+
+def run_sweeps(sizes, algorithms=("bnb",), timeouts=60, workers=None, difficulty=None, on_result=None, node_budget=None, seed=None):
+    '''
+        Sweeps every start square of every size with every algorithm through
+        one ProcessPoolExecutor. A task that raises is recorded as a result
+        with an "Error" entry instead of stopping the other groups.
+
+        `timeouts` is one value for all sizes or {n: seconds} covering every size. A DifficultyModel
+        orders the squares of each group most expensive first. `on_result`
+        is called as on_result(group, result) as results arrive.
+        `node_budget` and `seed` make every run reproducible (timeouts are then ignored).
+
+        Returns ({(algorithm, n): [results]}, {algorithm: SweepAnalytics}).
+    '''
+    for algorithm in algorithms:
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        if node_budget is not None and algorithm not in DETERMINISTIC_ALGORITHMS:
+            raise ValueError(f"{algorithm} has no node budget mode")
+    if isinstance(timeouts, dict) and node_budget is None:
+        missing = [n for n in sizes if n not in timeouts]
+        if missing:
+            raise ValueError(f"No timeout for sizes: {missing}")
+    workers = workers or os.cpu_count() or 1
+
+    groups = []
+    for n in sizes:
+        for algorithm in algorithms:
+            positions = generate_inputs(n)
+            if difficulty is not None:
+                positions = difficulty.order(algorithm, n, positions)
+            groups.append(SweepGroup(algorithm, n, _timeout_for(timeouts, n), positions))
+    analytics = {algorithm: SweepAnalytics() for algorithm in algorithms}
+    tasks = interleave(groups)
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = {}
+
+        def submit_next():
+            for group, position in tasks:
+                if group.started is None:
+                    group.started = time.time()
+                future = pool.submit(run_task, group.algorithm, group.n, position["row"], position["column"], group.timeout, node_budget, seed)
+                in_flight[future] = group, position
+                return True
+            return False
+
+        while len(in_flight) < workers * IN_FLIGHT_PER_WORKER and submit_next():
+            pass
+
+        while in_flight:
+            finished, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in finished:
+                group, position = in_flight.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = error_result(position, e)
+                group.results.append(result)
+                group.solved += bool(result["Solution Found"])
+                if "Error" not in result:
+                    analytics[group.algorithm].add(result, group.n)
+                    if difficulty is not None:
+                        difficulty.observe(group.algorithm, group.n, result, group.timeout)
+                if group.done:
+                    group.finished = time.time()
+                if on_result is not None:
+                    on_result(group, result)
+                submit_next()
+
+    if difficulty is not None:
+        difficulty.save()
+    return {(group.algorithm, group.n): group.results for group in groups}, analytics
+
+
+def print_progress(group, result):
+    outcome = f"error: {result['Error']}" if "Error" in result else f"en {result['Execution Time']:.3f} s"
+    print(f"{group.algorithm} {group.n}x{group.n}: {len(group.results)}/{group.total} - resueltas: {group.solved}"
+          f" - ({result['Start X']}, {result['Start Y']}) {outcome}"
+          + (" - terminado" if group.done else ""))
+
+
+def _parse_sizes(text):
+    sizes = []
+    for part in text.split(","):
+        if "-" in part:
+            low, high = part.split("-")
+            sizes.extend(range(int(low), int(high) + 1))
+        else:
+            sizes.append(int(part))
+    return sizes
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sweep several board sizes and algorithms on one process pool")
+    parser.add_argument("--sizes", default="5-8", help="e.g. 5-8 or 5,6,10")
+    parser.add_argument("--algorithms", default="bnb", help=f"comma separated: {', '.join(ALGORITHMS)}")
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--heatmaps", default=None, help="write PNG heatmaps with this pattern, e.g. heatmap_{n}x{n}.png")
+    args = parser.parse_args()
+
+    start_time = time.time()
+    results, analytics = run_sweeps(_parse_sizes(args.sizes), args.algorithms.split(","), args.timeout, args.workers, on_result=print_progress)
+    print(f"Tiempo total: {time.time() - start_time:.2f} segundos - ejecuciones: {sum(len(r) for r in results.values())}")
+    for algorithm, stage in analytics.items():
+        print(algorithm)
+        print_percentile_table(stage.percentile_table())
+        if args.heatmaps:
+            folder, name = os.path.split(args.heatmaps)
+            stage.render_all(os.path.join(folder, f"{algorithm}_{name}"))  # Prefijo en el nombre, no en la carpeta
@@ -0,0 +1,187 @@
+import functools
+import json
+import multiprocessing
+import os
+import queue
+import time
+
+from src.utils.concurrent_backtracking import solveKT_parallel_backtracking
+from src.utils.concurrent_bnb import solveKT_parallel
+from src.utils.concurrent_warnsdorff import solveKT_warnsdorff
+from src.utils.shared_state import SharedSweepState
+from src.utils.validator import validate_board
+
+# Portafolio de estrategias: todas corren en paralelo sobre la misma instancia,
+# gana el primer recorrido valido y el resto se detiene (bandera compartida y,
+# si no responde a tiempo, terminate()). El ganador se registra por instancia
+# para poder ajustar el algoritmo por defecto.
+
+DEFAULT_STATS_PATH = os.path.join(os.path.expanduser("~"), ".knight_tour_portfolio.json")
+STOP_GRACE = 0.5  # Segundos que se espera a que los perdedores paren solos
+RESTART_NODES = 2000  # Presupuesto inicial de nodos de los reinicios aleatorios
+RESTART_SEEDS = (1, 2)  # Una estrategia de reinicios aleatorios por semilla
+
+
+def _backtracking(n, x_pos, y_pos, timeout, blocked, target, shared_state_name):
+    return solveKT_parallel_backtracking(n, x_pos, y_pos, timeout, True, blocked=blocked, target=target, shared_state_name=shared_state_name, stop_on_solution=True)
+
+
+def _bnb(n, x_pos, y_pos, timeout, blocked, target, shared_state_name):
+    return solveKT_parallel(n, x_pos, y_pos, timeout, blocked=blocked, target=target, shared_state_name=shared_state_name, stop_on_solution=True, omit_tracking=True)
+
+
+def _warnsdorff(n, x_pos, y_pos, timeout, blocked, target, shared_state_name):
+    return solveKT_warnsdorff(n, x_pos, y_pos, timeout, blocked, target, shared_state_name=shared_state_name, stop_on_solution=True)
+
+
+def _random_restarts(seed, n, x_pos, y_pos, timeout, blocked, target, shared_state_name):
+    return solveKT_warnsdorff(n, x_pos, y_pos, timeout, blocked, target, seed=seed, restart_nodes=RESTART_NODES, shared_state_name=shared_state_name, stop_on_solution=True)
+
+
+STRATEGIES = {
+    "backtracking": _backtracking,
+    "bnb": _bnb,
+    "warnsdorff": _warnsdorff,
+}
+for _seed in RESTART_SEEDS:
+    STRATEGIES[f"random_restarts_{_seed}"] = functools.partial(_random_restarts, _seed)
+
+
+def _run_strategy(name, results, args):
+    # Corre dentro del proceso hijo (solo se envian el nombre y los argumentos)
+    try:
+        result = STRATEGIES[name](*args)
+    except Exception as e:
+        results.put((name, None, repr(e)))
+        return
+    result["Tracking Board"] = None  # No se envia por la cola
+    results.put((name, result, None))
+
+
+def _valid_tour(board, target):
+    if not validate_board(board).valid:
+        return False
+    if target is None:
+        return True
+    last = max(value for row in board for value in row)
+    return board[target[0]][target[1]] == last
+
+
+class PortfolioStats:
+    '''
+        Persisted count of wins per strategy for each (n, start square).
+    '''
+
+    def __init__(self, path=DEFAULT_STATS_PATH):
+        self.path = path
+        self.wins = {}
+        if path is not None and os.path.exists(path):
+            with open(path) as f:
+                try:
+                    self.wins = json.load(f)
+                except json.JSONDecodeError:
+                    self.wins = {}
+
+    def record(self, n, x_pos, y_pos, strategy):
+        counts = self.wins.setdefault(f"{n}:{x_pos}:{y_pos}", {})
+        counts[strategy] = counts.get(strategy, 0) + 1
+
+    def best(self, n, x_pos=None, y_pos=None):
+        '''
+            Strategy that won most often for this square (or for the whole size
+            when no square is given), or None if nothing was recorded.
+        '''
+        totals = {}
+        for key, counts in self.wins.items():
+            size, x, y = (int(v) for v in key.split(":"))
+            if size != n or (x_pos is not None and (x, y) != (x_pos, y_pos)):
+                continue
+            for strategy, wins in counts.items():
+                totals[strategy] = totals.get(strategy, 0) + wins
+        return max(totals, key=totals.get) if totals else None
+
+    def save(self):
+        if self.path is None:
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.wins, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)  # Reemplazo atomico
+
+
+def solveKT_portfolio(n, x_pos, y_pos, timeout, blocked=(), target=None, strategies=None, stats=None):
+    '''
+        Races several strategies on one instance and returns the first valid
+        tour (with "Strategy" set to the winner). The losers are stopped
+        through the shared stop flag and terminated if they do not exit in
+        STOP_GRACE seconds. Without a tour before `timeout`, returns the
+        result of the deepest search with "Strategy" set to None.
+    '''
+    names = list(strategies or STRATEGIES)
+    start_time = time.time()
+    results = multiprocessing.Queue()
+    winner, fallback = None, None
+    found_time = None
+    errors = {}
+
+    with SharedSweepState(n) as shared_state:
+        args = (n, x_pos, y_pos, timeout, tuple(blocked), target, shared_state.name)
+        processes = {name: multiprocessing.Process(target=_run_strategy, args=(name, results, args), daemon=True) for name in names}
+        for process in processes.values():
+            process.start()
+
+        pending = set(names)
+        while pending and winner is None:
+            remaining = start_time + timeout + STOP_GRACE - time.time()
+            try:
+                name, result, error = results.get(timeout=max(remaining, 0.01))
+            except queue.Empty:
+                break
+            pending.discard(name)
+            if error is not None:
+                errors[name] = error
+                continue
+            if result["Solution Found"] and _valid_tour(result["Final Board"], target):
+                winner = (name, result)
+                found_time = time.time()
+            elif fallback is None or result["Explored Nodes"] > fallback[1]["Explored Nodes"]:
+                fallback = (name, result)
+
+        shared_state.request_stop()
+        for process in processes.values():
+            process.join(STOP_GRACE)
+        for process in processes.values():
+            if process.is_alive():
+                process.terminate()  # Perdedor que no respondio a la bandera de parada
+                process.join()
+
+    if winner is not None:
+        name, result = winner
+        if stats is not None:
+            stats.record(n, x_pos, y_pos, name)
+            stats.save()
+    else:
+        name, result = None, (fallback[1] if fallback is not None else {
+            "Start X": x_pos,
+            "Start Y": y_pos,
+            "Solution Found": False,
+            "Final Board": None,
+            "Tracking Board": None,
+            "Explored Nodes": 0,
+        })
+    result = dict(result)
+    result["Strategy"] = name
+    result["Execution Time"] = (found_time or time.time()) - start_time  # Tiempo hasta el primer recorrido, no el del ganador solo
+    result["Strategy Errors"] = errors
+    result.pop("Stopped Early", None)
+    return result
+
+
+def get_case_knigth_tour_portfolio_by_size_board_and_position(n, pos_x, pos_y, timeout=60):
+    result = solveKT_portfolio(n, pos_x, pos_y, timeout, stats=PortfolioStats())
+    print("Resultado para posición inicial (", result["Start X"], ",", result["Start Y"], "):")
+    print("  - Solución encontrada:", result["Solution Found"])
+    print("  - Estrategia ganadora:", result["Strategy"])
+    print("  - Tiempo de ejecución:", result["Execution Time"], "segundos")
+    print("  - Nodos explorados:", result["Explored Nodes"])
+    return result
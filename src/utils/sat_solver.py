@@ -0,0 +1,308 @@
+import heapq
+import time
+
+# Motor SAT CDCL minimo en Python puro (sin dependencias externas).
+#
+# Literales: enteros distintos de cero en formato DIMACS (v verdadera, -v falsa).
+# Tecnicas: dos literales vigilados, aprendizaje de clausulas por primer UIP,
+# heuristica VSIDS, guardado de fase, reinicios de Luby y limpieza periodica
+# de clausulas aprendidas.
+
+SAT = "SAT"
+UNSAT = "UNSAT"
+UNKNOWN = "UNKNOWN"
+
+RESTART_BASE = 100
+VAR_DECAY = 0.95
+
+
+def luby(i):
+    '''Returns the i-th element (1-based) of the Luby restart sequence.'''
+    k = 1
+    while (1 << k) - 1 < i:
+        k += 1
+    while (1 << k) - 1 != i:
+        i -= (1 << (k - 1)) - 1
+        k = 1
+        while (1 << k) - 1 < i:
+            k += 1
+    return 1 << (k - 1)
+
+
+class SATSolver:
+
+    def __init__(self, num_vars=0):
+        self.num_vars = 0
+        self.clauses = []
+        self.learnt = []
+        self.deleted = []
+        self.watches = {}
+        self.value = [0]  # 1 verdadera, -1 falsa, 0 sin asignar (indexado por variable)
+        self.level = [0]
+        self.reason = [None]
+        self.activity = [0.0]
+        self.phase = [False]
+        self.seen = [False]
+        self.trail = []
+        self.trail_lim = []
+        self.qhead = 0
+        self.var_inc = 1.0
+        self.heap = []
+        self.ok = True
+        self.num_learnts = 0
+        self.max_learnts = 0
+        self.decisions = 0
+        self.conflicts = 0
+        self.propagations = 0
+        for _ in range(num_vars):
+            self.new_var()
+
+    def new_var(self):
+        self.num_vars += 1
+        v = self.num_vars
+        self.value.append(0)
+        self.level.append(0)
+        self.reason.append(None)
+        self.activity.append(0.0)
+        self.phase.append(False)
+        self.seen.append(False)
+        self.watches[v] = []
+        self.watches[-v] = []
+        heapq.heappush(self.heap, (0.0, v))
+        return v
+
+    def _lit_value(self, lit):
+        value = self.value[lit if lit > 0 else -lit]
+        return value if lit > 0 else -value
+
+    def add_clause(self, lits):
+        '''
+            Adds a problem clause. Must be called before `solve` (at level 0).
+            Returns False if the formula became trivially unsatisfiable.
+        '''
+        if not self.ok:
+            return False
+        clause = []
+        for lit in sorted(set(lits), key=abs):
+            if -lit in clause:
+                return True  # Tautologia
+            value = self._lit_value(lit)
+            if value == 1:
+                return True  # Ya satisfecha
+            if value == 0:
+                clause.append(lit)
+        if not clause:
+            self.ok = False
+            return False
+        if len(clause) == 1:
+            self._enqueue(clause[0], None)
+            if self._propagate() is not None:
+                self.ok = False
+            return self.ok
+        self._attach(clause, learnt=False)
+        return True
+
+    def _attach(self, clause, learnt):
+        index = len(self.clauses)
+        self.clauses.append(clause)
+        self.learnt.append(learnt)
+        self.deleted.append(False)
+        self.watches[clause[0]].append(index)
+        self.watches[clause[1]].append(index)
+        if learnt:
+            self.num_learnts += 1
+        return index
+
+    def _enqueue(self, lit, reason):
+        v = lit if lit > 0 else -lit
+        self.value[v] = 1 if lit > 0 else -1
+        self.level[v] = len(self.trail_lim)
+        self.reason[v] = reason
+        self.trail.append(lit)
+
+    def _propagate(self):
+        '''Unit propagation. Returns the index of a conflicting clause or None.'''
+        value = self.value
+        clauses = self.clauses
+        deleted = self.deleted
+        watches = self.watches
+        trail = self.trail
+        while self.qhead < len(trail):
+            p = trail[self.qhead]
+            self.qhead += 1
+            self.propagations += 1
+            false_lit = -p
+            watchers = watches[false_lit]
+            kept = []
+            for k, ci in enumerate(watchers):
+                if deleted[ci]:
+                    continue
+                c = clauses[ci]
+                if c[0] == false_lit:
+                    c[0], c[1] = c[1], c[0]
+                first = c[0]
+                first_value = value[first] if first > 0 else -value[-first]
+                if first_value == 1:
+                    kept.append(ci)
+                    continue
+                for t in range(2, len(c)):
+                    lit = c[t]
+                    if (value[lit] if lit > 0 else -value[-lit]) != -1:
+                        c[1], c[t] = lit, false_lit
+                        watches[lit].append(ci)
+                        break
+                else:
+                    kept.append(ci)
+                    if first_value == -1:
+                        kept.extend(watchers[k + 1:])
+                        watches[false_lit] = kept
+                        self.qhead = len(trail)
+                        return ci
+                    self._enqueue(first, ci)
+            watches[false_lit] = kept
+        return None
+
+    def _bump(self, v):
+        self.activity[v] += self.var_inc
+        if self.activity[v] > 1e100:
+            for i in range(1, self.num_vars + 1):
+                self.activity[i] *= 1e-100
+            self.var_inc *= 1e-100
+            self.heap = [(-self.activity[i], i) for i in range(1, self.num_vars + 1) if self.value[i] == 0]
+            heapq.heapify(self.heap)
+        elif self.value[v] == 0:
+            heapq.heappush(self.heap, (-self.activity[v], v))
+
+    def _analyze(self, conflict):
+        '''First-UIP conflict analysis. Returns (learnt clause, backtrack level).'''
+        seen = self.seen
+        current_level = len(self.trail_lim)
+        learnt = [0]
+        counter = 0
+        p = None
+        index = len(self.trail) - 1
+        clause_index = conflict
+        while True:
+            clause = self.clauses[clause_index]
+            for q in (clause if p is None else clause[1:]):
+                v = q if q > 0 else -q
+                if not seen[v] and self.level[v] > 0:
+                    seen[v] = True
+                    self._bump(v)
+                    if self.level[v] >= current_level:
+                        counter += 1
+                    else:
+                        learnt.append(q)
+            while not seen[abs(self.trail[index])]:
+                index -= 1
+            p = self.trail[index]
+            index -= 1
+            v = abs(p)
+            clause_index = self.reason[v]
+            seen[v] = False
+            counter -= 1
+            if counter == 0:
+                break
+        learnt[0] = -p
+        for q in learnt[1:]:
+            seen[abs(q)] = False
+
+        if len(learnt) == 1:
+            return learnt, 0
+        # El segundo literal vigilado debe ser el del nivel mas alto restante
+        best = max(range(1, len(learnt)), key=lambda i: self.level[abs(learnt[i])])
+        learnt[1], learnt[best] = learnt[best], learnt[1]
+        return learnt, self.level[abs(learnt[1])]
+
+    def _cancel_until(self, level):
+        if len(self.trail_lim) <= level:
+            return
+        limit = self.trail_lim[level]
+        for i in range(len(self.trail) - 1, limit - 1, -1):
+            lit = self.trail[i]
+            v = lit if lit > 0 else -lit
+            self.phase[v] = lit > 0
+            self.value[v] = 0
+            self.reason[v] = None
+            heapq.heappush(self.heap, (-self.activity[v], v))
+        del self.trail[limit:]
+        del self.trail_lim[level:]
+        self.qhead = len(self.trail)
+
+    def _pick_branch_var(self):
+        while self.heap:
+            activity, v = heapq.heappop(self.heap)
+            if self.value[v] == 0 and -activity == self.activity[v]:
+                return v
+        for v in range(1, self.num_vars + 1):  # Entradas obsoletas: busqueda lineal
+            if self.value[v] == 0:
+                return v
+        return None
+
+    def _reduce_db(self):
+        # Elimina la mitad mas larga de las clausulas aprendidas no bloqueadas
+        candidates = []
+        for ci, clause in enumerate(self.clauses):
+            if not self.learnt[ci] or self.deleted[ci]:
+                continue
+            v = abs(clause[0])
+            locked = self.reason[v] == ci and self._lit_value(clause[0]) == 1
+            if not locked and len(clause) > 2:
+                candidates.append((len(clause), ci))
+        candidates.sort(reverse=True)
+        for _, ci in candidates[:len(candidates) // 2]:
+            self.deleted[ci] = True
+            self.num_learnts -= 1
+
+    def solve(self, deadline=None, initial_phase=None):
+        '''
+            Runs the CDCL search.
+
+            Returns (SAT, model), (UNSAT, None) or (UNKNOWN, None) if the
+            `deadline` (absolute time.time() value) passes first. The model is a
+            list indexed by variable with True/False values.
+        '''
+        if initial_phase is not None:
+            for v, phase in initial_phase.items():
+                self.phase[v] = phase
+        if not self.ok or self._propagate() is not None:
+            self.ok = False
+            return UNSAT, None
+
+        self.max_learnts = max(1000, len(self.clauses) // 3)
+        restarts = 1
+        conflicts_until_restart = RESTART_BASE * luby(restarts)
+
+        while True:
+            conflict = self._propagate()
+            if conflict is not None:
+                self.conflicts += 1
+                conflicts_until_restart -= 1
+                if not self.trail_lim:
+                    self.ok = False
+                    return UNSAT, None
+                learnt, backtrack_level = self._analyze(conflict)
+                self._cancel_until(backtrack_level)
+                if len(learnt) == 1:
+                    self._enqueue(learnt[0], None)
+                else:
+                    self._enqueue(learnt[0], self._attach(learnt, learnt=True))
+                self.var_inc /= VAR_DECAY
+                continue
+
+            if deadline is not None and (self.decisions & 255) == 0 and time.time() >= deadline:
+                return UNKNOWN, None
+            if conflicts_until_restart <= 0:
+                restarts += 1
+                conflicts_until_restart = RESTART_BASE * luby(restarts)
+                self._cancel_until(0)
+            if self.num_learnts - len(self.trail) >= self.max_learnts:
+                self._reduce_db()
+                self.max_learnts = int(self.max_learnts * 1.1)
+
+            v = self._pick_branch_var()
+            if v is None:
+                return SAT, [False] + [self.value[i] == 1 for i in range(1, self.num_vars + 1)]
+            self.decisions += 1
+            self.trail_lim.append(len(self.trail))
+            self._enqueue(v if self.phase[v] else -v, None)
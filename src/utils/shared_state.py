@@ -0,0 +1,122 @@
+import atexit
+from multiprocessing import shared_memory
+
+# Estado compartido entre los procesos de un barrido, en un bloque de
+# multiprocessing.shared_memory (sin ida y vuelta por IPC):
+#
+#   [STOP]        bandera global de parada
+#   [BEST_DEPTH]  mayor profundidad alcanzada por cualquier proceso
+#   [RESERVED x2] sin uso por ahora
+#   por casilla inicial: nodos explorados, profundidad maxima, resuelta (0/1)
+#
+# No se comparten hechos de poda. Los estados sin salida de la tabla de
+# transposicion valdrian para cualquier casilla inicial, pero compartirlos
+# exige una tabla hash concurrente dentro del bloque; cada proceso mantiene
+# la suya.
+#
+# Cada proceso escribe solo las celdas de su propia casilla inicial; la
+# profundidad global se actualiza con un maximo optimista (sin lock), que
+# puede perder una mejora en una carrera pero nunca se queda por debajo del
+# valor por casilla, que es exacto.
+
+STOP = 0
+BEST_DEPTH = 1
+HEADER_SLOTS = 4
+SQUARE_FIELDS = ("Explored Nodes", "Best Depth", "Solved")
+
+_attached = {}  # Bloques ya abiertos por este proceso, por nombre
+
+
+def _close_attached():
+    # Con spawn los hijos terminan normalmente: se sueltan las vistas antes
+    # de que SharedMemory.__del__ intente cerrar un buffer todavia exportado
+    for state in _attached.values():
+        state.close()
+    _attached.clear()
+
+
+class SharedSweepState:
+
+    def __init__(self, n, name=None):
+        self.n = n
+        size = 8 * (HEADER_SLOTS + len(SQUARE_FIELDS) * n * n)
+        if name is None:
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+            self._owner = True
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+            self._owner = False  # Solo el proceso que crea el bloque lo libera
+        self._values = self._shm.buf.cast("q")
+        if self._owner:
+            for i in range(len(self._values)):
+                self._values[i] = 0
+        self.local_best = 0
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    @classmethod
+    def attach(cls, name, n):
+        '''
+            Opens the block created by the sweep coordinator. The mapping is
+            reused by this process until `detach(name)`.
+        '''
+        state = _attached.get(name)
+        if state is None:
+            if not _attached:
+                atexit.register(_close_attached)
+            state = _attached[name] = cls(n, name=name)
+        state.local_best = 0
+        return state
+
+    @staticmethod
+    def detach(name):
+        '''
+            Closes this process's mapping of a block once its task is done, so
+            long-lived pool workers do not keep one mapping per past sweep.
+        '''
+        state = _attached.pop(name, None)
+        if state is not None:
+            state.close()
+
+    def request_stop(self):
+        self._values[STOP] = 1
+
+    def stop_requested(self):
+        return self._values[STOP] != 0
+
+    def publish_depth(self, depth):
+        self.local_best = depth
+        if depth > self._values[BEST_DEPTH]:
+            self._values[BEST_DEPTH] = depth
+
+    @property
+    def best_depth(self):
+        return self._values[BEST_DEPTH]
+
+    @property
+    def solved_count(self):
+        return sum(self._values[HEADER_SLOTS + 2::len(SQUARE_FIELDS)])
+
+    def record_square(self, x, y, explored_nodes, best_depth, solved):
+        base = HEADER_SLOTS + len(SQUARE_FIELDS) * (x * self.n + y)
+        self._values[base] = explored_nodes
+        self._values[base + 1] = best_depth
+        self._values[base + 2] = int(solved)
+
+    def square_stats(self, x, y):
+        base = HEADER_SLOTS + len(SQUARE_FIELDS) * (x * self.n + y)
+        return {field: self._values[base + i] for i, field in enumerate(SQUARE_FIELDS)}
+
+    def close(self):
+        self._values.release()
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
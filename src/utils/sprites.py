@@ -0,0 +1,87 @@
+from __future__ import annotations  # Ensures compatibility with type hints for future versions of Python
+import pygame  # Imports Pygame for surfaces and fonts
+from pathlib import Path  # Imports Path for the piece image
+from src.utils.game import SQ_SIZE  # Imports the largest tile size
+
+MIN_TILE = 2  # Smallest tile size in pixels
+MIN_TEXT_TILE = 28  # Below this tile size move numbers are unreadable: path-line mode
+SCREEN_FILL = 0.85  # Fraction of the desktop the board may use (title bar, taskbar)
+FALLBACK_SCREEN = (800, 800)  # Used when the desktop size is unknown (e.g. dummy video driver)
+
+DARK = (209, 139, 71)  # Dark tile color
+LIGHT = (255, 206, 158)  # Light tile color
+VISITED = (0, 130, 0)  # Color for a tile with a recorded move
+HOLE = (60, 60, 60)  # Blocked square color
+ERROR = (130, 0, 0)  # Repeated visit color
+TARGET = (0, 70, 200)  # Required end square outline
+LEGEND = (64, 64, 64)  # Row and column legend color
+PATH_LINE = (0, 110, 0)  # Tour line in path-line mode
+
+_images: dict[Path, pygame.Surface] = {}  # Piece images loaded from disk, once per file
+_atlases: dict[int, SpriteAtlas] = {}  # One atlas per tile size
+
+def tile_size_for(n: int, reserved: tuple[int, int] = (0, 0)) -> int:
+    """Largest tile size (at most SQ_SIZE) that fits an n x n board on the desktop.
+
+    Args:
+        n (int): Board size.
+        reserved (tuple[int, int]): Pixels (width, height) needed next to the board.
+    """
+    sizes = pygame.display.get_desktop_sizes() if pygame.display.get_init() else []
+    width, height = sizes[0] if sizes and min(sizes[0]) > 0 else FALLBACK_SCREEN
+    available = min(width * SCREEN_FILL - reserved[0], height * SCREEN_FILL - reserved[1])
+    return max(MIN_TILE, min(SQ_SIZE, int(available // n)))
+
+def uses_path_lines(tile_size: int) -> bool:
+    """Whether a board drawn with this tile size should use path-line mode."""
+    return tile_size < MIN_TEXT_TILE
+
+def load_image(image_path: Path) -> pygame.Surface:
+    """Loads an image from disk only the first time it is requested."""
+    image = _images.get(image_path)
+    if image is None:
+        assert image_path.exists()  # Verifies that the image file exists
+        image = _images[image_path] = pygame.image.load(image_path)
+    return image
+
+def get_atlas(tile_size: int) -> SpriteAtlas:
+    """Returns the atlas for a tile size, building it the first time."""
+    atlas = _atlases.get(tile_size)
+    if atlas is None:
+        atlas = _atlases[tile_size] = SpriteAtlas(tile_size)
+    return atlas
+
+class SpriteAtlas:
+    """Pre-rendered tiles, text and piece sprites for one tile size."""
+
+    def __init__(self, tile_size: int) -> None:
+        self.tile_size = tile_size  # Size in pixels of every sprite
+        self.font = pygame.font.Font(None, max(8, int(tile_size * 0.3)))  # 24 at the default tile size
+        self.tiles = {name: self._filled(color) for name, color in (("dark", DARK), ("light", LIGHT), ("visited", VISITED), ("hole", HOLE), ("error", ERROR))}  # Plain tiles
+        self.target = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)  # Transparent overlay with the target outline
+        pygame.draw.rect(self.target, TARGET, self.target.get_rect(), max(1, tile_size // 20))
+        self._text: dict[tuple[str, object], pygame.Surface] = {}  # Rendered strings, cached on first use
+        self._pieces: dict[Path, pygame.Surface] = {}  # Piece sprites scaled to this tile size
+
+    def _filled(self, color: tuple[int, int, int]) -> pygame.Surface:
+        tile_surface = pygame.Surface((self.tile_size, self.tile_size), pygame.SRCALPHA)  # Creates a surface for the tile
+        tile_surface.fill(color=color)  # Fills the tile with the selected color
+        return tile_surface
+
+    def text(self, value: str, color: object = "white") -> pygame.Surface:
+        """Rendered text (move numbers, legends), rendered once per string and color."""
+        key = (value, color)
+        surface = self._text.get(key)
+        if surface is None:
+            surface = self._text[key] = self.font.render(value, True, color)
+        return surface
+
+    def piece(self, image_path: Path) -> pygame.Surface:
+        """The piece image scaled to 80% of a tile and centred, scaled once per tile size."""
+        sprite = self._pieces.get(image_path)
+        if sprite is None:
+            size = self.tile_size
+            sprite = self._pieces[image_path] = pygame.Surface((size, size), pygame.SRCALPHA)  # Creates a Pygame surface for the piece
+            image = pygame.transform.scale(load_image(image_path), (size * 0.8, size * 0.8))  # Scales the image to fit the tile
+            sprite.blit(image, image.get_rect(center=(size // 2, size // 2)))  # Centers the image on the piece surface
+        return sprite
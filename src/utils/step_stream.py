@@ -0,0 +1,112 @@
+from collections import namedtuple
+
+from src.utils.board_mask import MOVE_X, MOVE_Y, knight_neighbours, new_board, playable_squares, target_allows, target_reachable, validate_mask
+from src.utils.concurrent_bnb import branch
+
+# Flujo perezoso de pasos de las busquedas de la interfaz. En lugar de armar
+# todo el camino y reproducirlo despues, los generadores emiten cada colocacion
+# y cada vuelta atras en el momento en que ocurren; el visualizador y el
+# grabador de trazas consumen el mismo flujo. Las estadisticas de los barridos
+# no lo usan: salen de los resultados de los solvers rapidos.
+
+PLACE = "place"
+BACKTRACK = "backtrack"
+DONE = "done"
+
+# kind: PLACE / BACKTRACK / DONE
+# pos: numero de movimiento de la casilla (en DONE, el largo del recorrido o -1 si no hay solucion)
+StepEvent = namedtuple("StepEvent", ["kind", "x", "y", "pos"])
+
+
+def _neighbours(n, blocked, target):
+    # Tabla de vecinos sin las casillas bloqueadas; sin mascara bastan los desplazamientos
+    return knight_neighbours(n, blocked=blocked) if blocked or target is not None else None
+
+
+def _search(n, start, blocked, target, candidates, neighbours=None):
+    '''
+        Shared iterative depth-first search. `candidates(x, y, pos, board)`
+        returns an iterator over the squares to try from (x, y) for move `pos`.
+    '''
+    validate_mask(n, start, blocked, target)
+    board = new_board(n, blocked)
+    total = playable_squares(n, blocked)
+
+    x, y = start
+    board[x][y] = 0
+    path = [(x, y)]
+    yield StepEvent(PLACE, x, y, 0)
+    stack = [candidates(x, y, 1, board)]
+
+    while stack:
+        if len(path) == total:
+            yield StepEvent(DONE, path[-1][0], path[-1][1], total)
+            return
+        try:
+            new_x, new_y = next(stack[-1])
+        except StopIteration:
+            stack.pop()
+            old_x, old_y = path.pop()
+            if path:
+                board[old_x][old_y] = -1
+                yield StepEvent(BACKTRACK, old_x, old_y, len(path))
+            continue
+
+        pos = len(path)
+        board[new_x][new_y] = pos
+        path.append((new_x, new_y))
+        yield StepEvent(PLACE, new_x, new_y, pos)
+        if target_reachable(board, neighbours, (new_x, new_y), pos + 1, total, target):
+            stack.append(candidates(new_x, new_y, pos + 1, board))
+        else:
+            stack.append(iter(()))
+
+    yield StepEvent(DONE, start[0], start[1], -1)
+
+
+def iter_backtracking_steps(n, start, blocked=(), target=None):
+    '''
+        Plain backtracking (same move order as solveKTUtil) as a lazy stream of StepEvent.
+    '''
+    total = playable_squares(n, blocked)
+    neighbours = _neighbours(n, blocked, target)
+
+    def candidates(x, y, pos, board):
+        if neighbours is not None:
+            moves = neighbours[(x, y)]
+        else:
+            moves = [(x + MOVE_X[i], y + MOVE_Y[i]) for i in range(8)]
+        for new_x, new_y in moves:
+            if 0 <= new_x < n and 0 <= new_y < n and board[new_x][new_y] == -1 and target_allows((new_x, new_y), pos, total, target):
+                yield new_x, new_y
+
+    return _search(n, tuple(start), tuple(blocked), target, candidates, neighbours)
+
+
+def iter_bnb_steps(n, start, blocked=(), target=None):
+    '''
+        Branch and Bound (moves furthest from the centre first) as a lazy stream of StepEvent.
+    '''
+    total = playable_squares(n, blocked)
+    neighbours = _neighbours(n, blocked, target)
+    explored_nodes = [0]
+
+    def candidates(x, y, pos, board):
+        for _, new_x, new_y in branch(x, y, n, board, MOVE_X, MOVE_Y, explored_nodes, pos, total, target, neighbours):
+            if board[new_x][new_y] == -1:
+                yield new_x, new_y
+
+    return _search(n, tuple(start), tuple(blocked), target, candidates, neighbours)
+
+
+def iter_path_steps(path):
+    '''
+        Turns an already known path into a stream (for solvers that do not search move by move).
+    '''
+    for pos, (x, y) in enumerate(path):
+        yield StepEvent(PLACE, x, y, pos)
+    if path:
+        yield StepEvent(DONE, path[-1][0], path[-1][1], len(path))
+    else:
+        yield StepEvent(DONE, -1, -1, -1)
+
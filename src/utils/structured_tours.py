@@ -0,0 +1,267 @@
+import concurrent.futures
+import time
+
+from src.utils.concurrent_backtracking import isSafe_backtracking, printSolution
+from src.utils.board_mask import MOVE_X, MOVE_Y
+from src.utils.shared_state import SharedSweepState
+# Python3 program to search structured Knight Tours (semi-magic, symmetric) with constraint pruning
+
+MODES = ("magic", "symmetric")
+POLL_EVERY = 1024  # Nodos entre consultas al reloj y a la bandera de parada
+
+
+class SemiMagicConstraint:
+    '''
+        Every row and column must add up to the magic constant. Numbers are the
+        0-based move numbers, so the constant is n * (n^2 - 1) / 2 (252 on 8x8;
+        260 with the usual 1-based numbering).
+
+        The knight alternates colours, so the parity of the number each empty
+        square will get is known from its colour. After each placement, every
+        row and column must still be able to reach the constant with the
+        smallest and with the largest unplaced numbers of the right parities.
+    '''
+
+    def __init__(self, n, closed=False):
+        self.n = n
+        self.total = n * n
+        self.closed = closed
+        self.magic = n * (self.total - 1) // 2
+        self.start_colour = None
+        self.row_sum = [0] * n
+        self.col_sum = [0] * n
+        # Casillas vacias por fila/columna y paridad del numero que recibiran
+        self.row_empty = [[0, 0] for _ in range(n)]
+        self.col_empty = [[0, 0] for _ in range(n)]
+
+    def depth(self):
+        return self.total
+
+    def _parity(self, x, y):
+        return (x + y + self.start_colour) % 2
+
+    def _bounds(self, empty, pos):
+        low = high = 0
+        for parity, count in enumerate(empty):
+            if count:
+                first = pos + 1 if (pos + 1) % 2 == parity else pos + 2
+                last = self.total - 1 if (self.total - 1) % 2 == parity else self.total - 2
+                low += count * first + count * (count - 1)
+                high += count * last - count * (count - 1)
+        return low, high
+
+    def _feasible(self, current, empty, pos):
+        low, high = self._bounds(empty, pos)
+        return current + low <= self.magic <= current + high
+
+    def allows(self, board, x, y, pos):
+        if self.start_colour is None:
+            self._set_start(x, y)
+        self.place(board, x, y, pos)
+        ok = all(self._feasible(self.row_sum[i], self.row_empty[i], pos) and self._feasible(self.col_sum[i], self.col_empty[i], pos) for i in range(self.n))
+        self.remove(board, x, y, pos)
+        return ok
+
+    def _set_start(self, x, y):
+        # La casilla inicial recibe el 0: fija la paridad de cada color
+        self.start_colour = (x + y) % 2
+        for i in range(self.n):
+            for j in range(self.n):
+                parity = self._parity(i, j)
+                self.row_empty[i][parity] += 1
+                self.col_empty[j][parity] += 1
+
+    def place(self, board, x, y, pos):
+        parity = pos % 2
+        self.row_sum[x] += pos
+        self.col_sum[y] += pos
+        self.row_empty[x][parity] -= 1
+        self.col_empty[y][parity] -= 1
+
+    def remove(self, board, x, y, pos):
+        parity = pos % 2
+        self.row_sum[x] -= pos
+        self.col_sum[y] -= pos
+        self.row_empty[x][parity] += 1
+        self.col_empty[y][parity] += 1
+
+    def complete(self, board, start, last):
+        return not self.closed or _knight_move(start, last)
+
+
+class RotationalSymmetryConstraint:
+    '''
+        Closed tours symmetric under a 180 degree rotation: the square
+        opposite to the one at move p holds move p + N/2. Only the first half
+        is searched; placing a square reserves its opposite, and the half path
+        must end one knight move away from the opposite of the start.
+        (Open tours cannot be symmetric on even boards and odd boards have a
+        fixed centre square, so only even n is accepted.)
+    '''
+
+    def __init__(self, n, closed=True):
+        if n % 2:
+            raise ValueError("Symmetric tours need an even board size")
+        self.n = n
+        self.half = n * n // 2
+
+    def depth(self):
+        return self.half
+
+    def _opposite(self, x, y):
+        return self.n - 1 - x, self.n - 1 - y
+
+    def allows(self, board, x, y, pos):
+        ox, oy = self._opposite(x, y)
+        return board[ox][oy] == -1
+
+    def place(self, board, x, y, pos):
+        ox, oy = self._opposite(x, y)
+        board[ox][oy] = pos + self.half
+
+    def remove(self, board, x, y, pos):
+        ox, oy = self._opposite(x, y)
+        board[ox][oy] = -1
+
+    def complete(self, board, start, last):
+        return _knight_move(last, self._opposite(*start))
+
+
+def _knight_move(a, b):
+    return (abs(a[0] - b[0]), abs(a[1] - b[1])) in ((1, 2), (2, 1))
+
+
+def make_constraint(mode, n, closed=False):
+    if mode == "magic":
+        return SemiMagicConstraint(n, closed)
+    if mode == "symmetric":
+        return RotationalSymmetryConstraint(n)
+    raise ValueError(f"Unknown mode: {mode}")
+
+
+def _ordered_moves(n, board, x, y):
+    # Warnsdorff: primero las casillas con menos salidas libres
+    moves = []
+    for i in range(8):
+        new_x, new_y = x + MOVE_X[i], y + MOVE_Y[i]
+        if isSafe_backtracking(n, new_x, new_y, board):
+            degree = sum(1 for j in range(8) if isSafe_backtracking(n, new_x + MOVE_X[j], new_y + MOVE_Y[j], board))
+            moves.append((degree, i, new_x, new_y))
+    moves.sort()
+    return [(new_x, new_y) for _, _, new_x, new_y in moves]
+
+
+def solveKTUtil_constrained(n, board, start, curr_x, curr_y, pos, constraint, deadline, explored_nodes, shared_state=None):
+    '''
+        Backtracking search (same board convention as solveKTUtil_backtracking)
+        that asks `constraint` before every placement, so partial tours that
+        already break the structure are pruned at once.
+        Returns True (found), False (subtree exhausted) or None (cut short).
+    '''
+    if pos == constraint.depth():
+        return constraint.complete(board, start, (curr_x, curr_y)) or False
+
+    explored_nodes[0] += 1
+    if explored_nodes[0] % POLL_EVERY == 0:
+        if time.time() >= deadline or (shared_state is not None and shared_state.stop_requested()):
+            return None
+
+    for new_x, new_y in _ordered_moves(n, board, curr_x, curr_y):
+        if not constraint.allows(board, new_x, new_y, pos):
+            continue
+        board[new_x][new_y] = pos
+        constraint.place(board, new_x, new_y, pos)
+        found = solveKTUtil_constrained(n, board, start, new_x, new_y, pos + 1, constraint, deadline, explored_nodes, shared_state)
+        if found is None or found:
+            return found
+        constraint.remove(board, new_x, new_y, pos)
+        board[new_x][new_y] = -1
+    return False
+
+
+def solveKT_structured(n, prefix, mode, timeout, closed=False, shared_state_name=None):
+    '''
+        Searches the subtree of structured tours that start with `prefix`
+        (list of squares, the start first). Used as one parallel task.
+    '''
+    start_time = time.time()
+    constraint = make_constraint(mode, n, closed)
+    board = [[-1 for _ in range(n)] for _ in range(n)]
+    start = tuple(prefix[0])
+
+    shared_state = SharedSweepState.attach(shared_state_name, n) if shared_state_name is not None else None
+    explored_nodes = [0]
+    found = True
+    for pos, (x, y) in enumerate(prefix):
+        if board[x][y] != -1 or (pos > 0 and not _knight_move(prefix[pos - 1], (x, y))) or not constraint.allows(board, x, y, pos):
+            found = False
+            break
+        board[x][y] = pos
+        constraint.place(board, x, y, pos)
+    if found:
+        found = solveKTUtil_constrained(n, board, start, prefix[-1][0], prefix[-1][1], len(prefix), constraint, start_time + timeout, explored_nodes, shared_state)
+
+    if shared_state is not None:
+        if found:
+            shared_state.request_stop()
+        SharedSweepState.detach(shared_state_name)  # El bloque no se usa mas en esta tarea
+    return {
+        "Start X": start[0],
+        "Start Y": start[1],
+        "Prefix": [tuple(square) for square in prefix],
+        "Mode": mode,
+        "Solution Found": bool(found),
+        "Subtree Exhausted": found is False,
+        "Execution Time": time.time() - start_time,
+        "Final Board": board,
+        "Tracking Board": None,
+        "Explored Nodes": explored_nodes[0],
+    }
+
+
+def first_move_prefixes(n, start, split_depth=1):
+    '''
+        All extensions by split_depth moves of `start` (a square, or a list of
+        squares already fixed); each one is the root of an independent subtree
+        for a worker.
+    '''
+    prefixes = [[tuple(square) for square in start] if isinstance(start, list) else [tuple(start)]]
+    for _ in range(split_depth):
+        extended = []
+        for prefix in prefixes:
+            x, y = prefix[-1]
+            for i in range(8):
+                square = (x + MOVE_X[i], y + MOVE_Y[i])
+                if 0 <= square[0] < n and 0 <= square[1] < n and square not in prefix:
+                    extended.append(prefix + [square])
+        prefixes = extended
+    return prefixes
+
+
+def get_structured_tour(n, start=(0, 0), mode="magic", timeout=60, closed=False, split_depth=1):
+    '''
+        Runs the first-move subtrees in parallel and returns the first
+        structured tour found (the other workers are stopped through the
+        shared stop flag), or None.
+
+        `start` may also be a list of squares (a partial tour to complete):
+        semi-magic 8x8 tours are rare enough that a search from a bare start
+        square can still take very long, while seeded searches finish fast.
+    '''
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode: {mode}")
+    make_constraint(mode, n, closed)  # Valida el tamaño antes de lanzar los procesos
+    found = None
+    with SharedSweepState(n) as shared_state, concurrent.futures.ProcessPoolExecutor() as pool:
+        tasks = [pool.submit(solveKT_structured, n, prefix, mode, timeout, closed, shared_state.name) for prefix in first_move_prefixes(n, start, split_depth)]
+        for task in concurrent.futures.as_completed(tasks):
+            result = task.result()
+            print("Subárbol", result["Prefix"], "- encontrado:", result["Solution Found"], "- agotado:", result["Subtree Exhausted"], "- nodos:", result["Explored Nodes"])
+            if result["Solution Found"] and found is None:
+                found = result
+                shared_state.request_stop()
+
+    if found is not None:
+        print("Recorrido", found["Mode"], "desde", found["Start X"], found["Start Y"])
+        printSolution(n, found["Final Board"])
+    return found
@@ -1,20 +1,33 @@
 from __future__ import annotations  # Ensures compatibility with type hints for future versions of Python
 import pygame  # Imports the Pygame library for graphics and event handling
 from pathlib import Path  # Imports Path for handling file paths
+from typing import Iterable  # Imports Iterable for the type hints
 from src.utils.game import SQ_SIZE  # Imports SQ_SIZE constant for square size
+from src.utils.board_mask import BLOCKED, new_board  # Imports the blocked square marker and board factory
+from src.utils.sprites import PATH_LINE, LEGEND, get_atlas, load_image, tile_size_for, uses_path_lines  # Imports the sprite atlas and tile sizing
 
 BoardPosition = tuple[int, int]  # Defines a type alias for a position on the board
+MAX_LEGEND_SIZE = 26  # Column letters go from A to Z
 
 class Board:
 
     def __init__(
-        self, size, parent: pygame.Surface, piece: Piece, with_legend: bool = False
+        self, size, parent: pygame.Surface, piece: Piece, with_legend: bool = False,
+        blocked: tuple[BoardPosition, ...] = (), target: BoardPosition | None = None,
+        tile_size: int | None = None
     ) -> None:
         self._size = size  # Sets the board size
-        self._board = [[-1 for _ in range(size)] for _ in range(size)]  # Initializes the board matrix with -1 (unvisited cells)
+        self.blocked = tuple(blocked)  # Squares the piece can never visit
+        self.target = target  # Square where the tour must end, if any
+        self._board = new_board(size, self.blocked)  # Initializes the board matrix with -1 (unvisited) and BLOCKED cells
         self._parent = parent  # Sets the parent Pygame surface where the board will be drawn
-        self._with_legend = with_legend  # Determines if row and column legends are displayed
-        self.surface  # Accesses the surface property to initialize the board display
+        self.tile_size = tile_size or SQ_SIZE  # Size in pixels of each square
+        self._atlas = get_atlas(self.tile_size)  # Pre-rendered tiles, text and piece for this tile size
+        self._path_mode = uses_path_lines(self.tile_size)  # Tiles too small for numbers: the tour is drawn as a line
+        self._with_legend = with_legend and not self._path_mode and size <= MAX_LEGEND_SIZE  # Determines if row and column legends are displayed
+        self._order: list[BoardPosition] = []  # Placed squares in move order (for the path line)
+        self._canvas: pygame.Surface | None = None  # Board without the piece, kept between frames
+        self._dirty: set[BoardPosition] = set()  # Squares changed since the canvas was last drawn
         self.piece = piece  # Sets the piece to be displayed on the board
 
     @property
@@ -24,64 +37,129 @@ class Board:
         Returns:
             pygame.Surface: A Pygame surface representing the chessboard
         """
-        surface = pygame.Surface((self._size * SQ_SIZE, self._size * SQ_SIZE))  # Creates a new Pygame surface for the board
-        font = pygame.font.Font(None, 24)  # Loads a default font for text rendering
-        font_color = (64, 64, 64)  # Sets color for text (legends)
-        
+        tile = self.tile_size
+        surface = pygame.Surface((self._size * tile, self._size * tile))  # Creates a new Pygame surface for the board
+
         # Loops through each cell to create the checkerboard pattern
         for i in range(len(self._board)):
             for j in range(len(self._board)):
-                if (i + j) % 2 == 0:  # Alternates color for each cell based on position
-                    color = (209, 139, 71)  # Dark tile color
-                else:
-                    color = (255, 206, 158)  # Light tile color
-                tile_surface = pygame.Surface((SQ_SIZE, SQ_SIZE), pygame.SRCALPHA)  # Creates a surface for each tile
-                tile_surface.fill(color=color)  # Fills the tile with the selected color
-                
-                if self._board[i][j] >= 0:  # If a move number is recorded in the tile, displays it
-                    color = (0, 130, 0)  # Color for a tile with a recorded move
-                    tile_surface.fill(color=color)  # Fills the tile with the recorded move color
-                    text = font.render(str(self._board[i][j]), True, "white")  # Renders the move number as text
-                    text_rect = text.get_rect(center=(SQ_SIZE // 2, SQ_SIZE // 2))  # Centers the text on the tile
-                    tile_surface.blit(text, text_rect)  # Draws the text on the tile
-                
-                if self._board[i][j] < -1:  # Indicates an error if the board has invalid data
-                    color = (130, 0, 0)  # Color for error indication
-                    tile_surface.fill(color=color)  # Fills the tile with the error color
-                    text = font.render("ERR", True, "white")  # Renders "ERR" as error text
-                    text_rect = text.get_rect(center=(SQ_SIZE // 2, SQ_SIZE // 2))  # Centers the error text
-                    tile_surface.blit(text, text_rect)  # Draws the error text on the tile
-
-                surface.blit(tile_surface, (j * SQ_SIZE, i * SQ_SIZE))  # Places each tile on the main surface
+                self._draw_tile(surface, i, j)  # Places each tile on the main surface
+        return surface
+
+    def _draw_tile(self, surface: pygame.Surface, i: int, j: int) -> pygame.Rect:
+        """Draws a single square from the atlas: colour, move number, markers and its part of the legend."""
+        tile, atlas = self.tile_size, self._atlas
+        value = self._board[i][j]
+        if value == BLOCKED:  # Blocked squares are drawn as holes
+            name = "hole"
+        elif value < -1:  # Indicates an error if the board has invalid data
+            name = "error"
+        elif value >= 0 and not self._path_mode:  # A recorded move (the path line shows it in path mode)
+            name = "visited"
+        else:
+            name = "dark" if (i + j) % 2 == 0 else "light"  # Alternates color for each cell based on position
+        rect = surface.blit(atlas.tiles[name], (j * tile, i * tile))
+
+        if not self._path_mode:
+            text = None
+            if value >= 0:  # If a move number is recorded in the tile, displays it
+                text = atlas.text(str(value))
+            elif name == "error":
+                text = atlas.text("ERR")  # Renders "ERR" as error text
+            if text is not None:
+                surface.blit(text, text.get_rect(center=rect.center))  # Centers the text on the tile
+
+        if self.target == (i, j):  # Outlines the required end square
+            surface.blit(atlas.target, rect)
 
         if self._with_legend:  # Adds row and column legends if enabled
-            for i in range(self._size):
-                text = font.render(str(i + 1), True, font_color)  # Renders row number
-                text_rect = text.get_rect(center=(20, i * SQ_SIZE + 20))  # Positions row legend on the left
-                surface.blit(text, text_rect)  # Draws row legend on the board surface
-
-                text = font.render(chr(65 + i),True, font_color)
-                text_rect = text.get_rect(center=(i * SQ_SIZE + 65, (self._size*SQ_SIZE)-20))
-                surface.blit(text, text_rect)
-        return surface
+            if j == 0:
+                text = atlas.text(str(i + 1), LEGEND)  # Renders row number
+                surface.blit(text, text.get_rect(center=(rect.x + tile // 4, rect.y + tile // 4)))  # Positions row legend on the left
+            if i == self._size - 1:
+                text = atlas.text(chr(65 + j), LEGEND)  # Renders column letter
+                surface.blit(text, text.get_rect(center=(rect.x + tile * 13 // 16, rect.bottom - tile // 4)))  # Positions column legend at the bottom
+        return rect
+
+    def _ensure_canvas(self) -> pygame.Surface:
+        """Full render the first time, then only the squares that changed since the last frame."""
+        if self._canvas is None:
+            self._canvas = self.surface
+        else:
+            for i, j in self._dirty:
+                self._draw_tile(self._canvas, i, j)
+        self._dirty.clear()
+        return self._canvas
+
+    def _draw_path(self, surface: pygame.Surface) -> None:
+        """Path-line mode: one line through the centres of the placed squares."""
+        if len(self._order) > 1:
+            half = self.tile_size // 2
+            points = [(j * self.tile_size + half, i * self.tile_size + half) for i, j in self._order]
+            pygame.draw.lines(surface, PATH_LINE, False, points, max(1, self.tile_size // 6))
+
+    def draw_tiles(self, squares: Iterable[BoardPosition]) -> None:
+        """Redraws only the given squares (and the piece if it stands on one of them)."""
+        self._dirty.update(squares)
+        if self._path_mode or self._canvas is None:  # The path line crosses the whole board; the first frame is a full render
+            self.draw()
+            return
+        rects = []
+        for i, j in self._dirty:
+            rect = self._draw_tile(self._canvas, i, j)
+            rects.append(self._parent.blit(self._canvas, rect, rect))
+            if self.piece.position == (i, j):
+                self.piece.draw(board_surface=self._parent, tile_size=self.tile_size)
+        self._dirty.clear()
+        pygame.display.update(rects)  # Flips only the changed rectangles
+
+    def set_matrix(self, values: Iterable[int]) -> None:
+        """Replaces the whole board state with a flat sequence of n * n values."""
+        values = list(values)
+        n = self._size
+        rows = [values[i * n:(i + 1) * n] for i in range(n)]
+        self._dirty.update((i, j) for i in range(n) for j in range(n) if rows[i][j] != self._board[i][j])
+        self._board = rows
+        self._order = sorted(((i, j) for i in range(n) for j in range(n) if rows[i][j] >= 0), key=lambda square: rows[square[0]][square[1]])
 
     def update(self, pos: int) -> None:
         position = self.piece.position
         self._set_checked(position, pos=pos)
-        board = self.surface
-        self.piece.draw(board_surface=board)
-        self._parent.blit(board, (0, 0))
+        self.draw()
+
+    def place(self, position: BoardPosition, pos: int) -> None:
+        """Moves the piece and marks the square without redrawing (see draw)."""
+        self.piece.move(position)
+        self._set_checked(position, pos=pos)
+
+    def draw(self) -> None:
+        self._parent.blit(self._ensure_canvas(), (0, 0))
+        if self._path_mode:
+            self._draw_path(self._parent)
+        self.piece.draw(board_surface=self._parent, tile_size=self.tile_size)
         pygame.display.flip()
 
     @property
     def matrix(self) -> list[list[int]]:
         return self._board
 
+    def clear(self, position: BoardPosition) -> None:
+        """Marks a square as unvisited again (a backtracking step)."""
+        self._board[position[0]][position[1]] = -1
+        self._dirty.add(position)
+        if self._order and self._order[-1] == position:
+            self._order.pop()
+        elif position in self._order:
+            self._order.remove(position)
+
     def _set_checked(self, position: BoardPosition, pos: int) -> None:
         if self._board[position[0]][position[1]] == -1:
             self._board[position[0]][position[1]] = pos
-        else:
+            del self._order[pos:]  # Squares numbered after pos were abandoned
+            self._order.append(position)
+        elif self._board[position[0]][position[1]] != pos:  # Returning to the current square is not a repeated visit
             self._board[position[0]][position[1]] = -2
+        self._dirty.add(position)
 
 
 class Piece:
@@ -89,16 +167,13 @@ class Piece:
     def __init__(self, image_path: Path, start_pos: BoardPosition = (0, 0)) -> None:
         self._position = start_pos  # Sets the initial position of the piece
         self._start_pos = start_pos  # Stores the start position for reset
-        assert image_path.exists()  # Verifies that the image file exists
-        image = pygame.image.load(image_path)  # Loads the image from the specified path
-        self._image = pygame.Surface((SQ_SIZE, SQ_SIZE), pygame.SRCALPHA)  # Creates a Pygame surface for the piece
-        image = pygame.transform.scale(image, (SQ_SIZE * 0.8, SQ_SIZE * 0.8))  # Scales the image to fit the tile
-        self._image.blit(image, image.get_rect(center=(SQ_SIZE // 2, SQ_SIZE // 2)))  # Centers the image on the piece surface
-
-    def draw(self, board_surface: pygame.Surface):
-        pixel_x = self._position[1] * SQ_SIZE  # Calculates x position in pixels based on column index
-        pixel_y = self._position[0] * SQ_SIZE  # Calculates y position in pixels based on row index
-        board_surface.blit(self._image, (pixel_x, pixel_y))  # Draws the piece on the board surface at calculated position
+        self._image_path = image_path  # Sprite scaled once per tile size by the atlas
+        load_image(image_path)  # Loads the image once, verifying that the file exists
+
+    def draw(self, board_surface: pygame.Surface, origin: BoardPosition = (0, 0), tile_size: int = SQ_SIZE):
+        pixel_x = (self._position[1] - origin[1]) * tile_size  # Calculates x position in pixels based on column index
+        pixel_y = (self._position[0] - origin[0]) * tile_size  # Calculates y position in pixels based on row index
+        board_surface.blit(get_atlas(tile_size).piece(self._image_path), (pixel_x, pixel_y))  # Draws the piece on the board surface at calculated position
 
     def move(self, position: BoardPosition) -> None:
         """Moves the piece to a specified position on the board
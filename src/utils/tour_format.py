@@ -0,0 +1,261 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import namedtuple
+
+# Formato binario compacto para recorridos.
+#
+# Registro:  cabecera RECORD_HEADER + camino como indices de casilla (x * m + y)
+#            en uint16, o uint32 si el tablero tiene mas de 65535 casillas.
+# Contenedor: archivo de registros concatenados + indice "<archivo>.idx" con
+#             el offset uint64 de cada registro, ambos leidos con mmap.
+
+RECORD_MAGIC = b"KT"
+STORE_MAGIC = b"KTS1"
+VERSION = 1
+
+RECORD_HEADER = struct.Struct("<2sBBBxHHII")  # magic, version, flags, piece, n, m, start, length
+STORE_HEADER = struct.Struct("<4sI")  # magic, version
+INDEX_ITEM = struct.Struct("<Q")
+
+FLAG_SOLVED = 1
+FLAG_CLOSED = 2
+FLAG_WIDE = 4
+
+PIECES = {"knight": 0}
+PIECE_NAMES = {code: name for name, code in PIECES.items()}
+
+TourRecord = namedtuple("TourRecord", ["n", "m", "piece", "start", "flags", "path"])
+
+
+def board_to_path(board):
+    '''
+        Converts a "Final Board" matrix (move number per square, -1 if unvisited)
+        into the ordered list of visited squares.
+    '''
+    visited = [(value, x, y) for x, row in enumerate(board) for y, value in enumerate(row) if value >= 0]
+    visited.sort()
+    return [(x, y) for _, x, y in visited]
+
+
+def path_to_board(path, n, m=None):
+    m = n if m is None else m
+    board = [[-1 for _ in range(m)] for _ in range(n)]
+    for pos, (x, y) in enumerate(path):
+        board[x][y] = pos
+    return board
+
+
+def is_closed(path):
+    if len(path) < 2:
+        return False
+    dx = abs(path[0][0] - path[-1][0])
+    dy = abs(path[0][1] - path[-1][1])
+    return (dx, dy) in ((1, 2), (2, 1))
+
+
+def _typecode(n, m):
+    return "I" if n * m > 0xFFFF else "H"
+
+
+def pack_tour(path, n, m=None, piece="knight", solved=True):
+    '''
+        Encodes a path of (x, y) squares as a binary record.
+    '''
+    m = n if m is None else m
+    typecode = _typecode(n, m)
+    squares = array(typecode, (x * m + y for x, y in path))
+    if sys.byteorder == "big":
+        squares.byteswap()
+
+    flags = FLAG_WIDE if typecode == "I" else 0
+    if solved:
+        flags |= FLAG_SOLVED
+    if is_closed(path):
+        flags |= FLAG_CLOSED
+    start = path[0][0] * m + path[0][1] if path else 0
+
+    header = RECORD_HEADER.pack(RECORD_MAGIC, VERSION, flags, PIECES[piece], n, m, start, len(path))
+    return header + squares.tobytes()
+
+
+def pack_result(result, n, piece="knight"):
+    '''
+        Encodes one sweep result dict (as returned by solveKT_parallel*) as a binary record.
+    '''
+    path = board_to_path(result["Final Board"])
+    return pack_tour(path, n, piece=piece, solved=bool(result["Solution Found"]))
+
+
+def unpack_tour(data, offset=0):
+    '''
+        Decodes the record stored at `offset` in `data` (bytes, memoryview or mmap).
+        The path is returned as an array of square indices; use `squares_to_path`
+        to get (x, y) tuples.
+    '''
+    magic, version, flags, piece, n, m, start, length = RECORD_HEADER.unpack_from(data, offset)
+    if magic != RECORD_MAGIC or version != VERSION:
+        raise ValueError(f"Invalid tour record at offset {offset}")
+    typecode = "I" if flags & FLAG_WIDE else "H"
+    squares = array(typecode)
+    begin = offset + RECORD_HEADER.size
+    squares.frombytes(data[begin:begin + length * squares.itemsize])
+    if sys.byteorder == "big":
+        squares.byteswap()
+    return TourRecord(n, m, PIECE_NAMES.get(piece, "knight"), divmod(start, m), flags, squares)
+
+
+def record_size(data, offset=0):
+    _, _, flags, _, _, _, _, length = RECORD_HEADER.unpack_from(data, offset)
+    return RECORD_HEADER.size + length * (4 if flags & FLAG_WIDE else 2)
+
+
+def squares_to_path(record):
+    return [divmod(square, record.m) for square in record.path]
+
+
+def record_to_board(record):
+    '''
+        Rebuilds the nested-list board (move number per square) used by `Board`
+        and the validators.
+    '''
+    return path_to_board(squares_to_path(record), record.n, record.m)
+
+
+def index_is_current(path):
+    '''
+        True if "<path>.idx" covers the whole container: its last offset points
+        at a record that ends exactly at the end of the data file.
+    '''
+    index_path = f"{path}.idx"
+    if not os.path.exists(index_path):
+        return False
+    index_size = os.path.getsize(index_path)
+    data_size = os.path.getsize(path)
+    if index_size % INDEX_ITEM.size:
+        return False
+    if index_size == 0:
+        return data_size <= STORE_HEADER.size
+    with open(index_path, "rb") as index:
+        index.seek(-INDEX_ITEM.size, os.SEEK_END)
+        last = INDEX_ITEM.unpack(index.read(INDEX_ITEM.size))[0]
+    with open(path, "rb") as data:
+        data.seek(last)
+        header = data.read(RECORD_HEADER.size)
+    if len(header) < RECORD_HEADER.size or header[:2] != RECORD_MAGIC:
+        return False
+    return last + record_size(header) == data_size
+
+
+def rebuild_index(path):
+    '''
+        Rewrites "<path>.idx" by walking the record headers of the container.
+        A truncated last record (interrupted write) is left out of the index.
+        Returns the offset where the last complete record ends.
+    '''
+    with open(path, "rb") as data_file, mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ) as data, open(f"{path}.idx", "wb") as index:
+        offset = STORE_HEADER.size
+        while offset + RECORD_HEADER.size <= len(data):
+            size = record_size(data, offset)
+            if offset + size > len(data):
+                break
+            index.write(INDEX_ITEM.pack(offset))
+            offset += size
+    return offset
+
+
+class TourStoreWriter:
+    '''
+        Appends binary tour records to a container file and its offset index.
+        A missing or stale index is rebuilt before appending, so the records
+        already in the file stay reachable.
+    '''
+
+    def __init__(self, path):
+        self._path = path
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        if not new_file and not index_is_current(path):
+            end = rebuild_index(path)
+            os.truncate(path, end)  # Descarta un registro incompleto al final
+        self._data = open(path, "ab")
+        self._index = open(f"{path}.idx", "wb" if new_file else "ab")  # Un indice viejo sin datos no vale
+        if new_file:
+            self._data.write(STORE_HEADER.pack(STORE_MAGIC, VERSION))
+        self._offset = self._data.tell()
+
+    def append(self, record):
+        self._index.write(INDEX_ITEM.pack(self._offset))
+        self._data.write(record)
+        self._offset += len(record)
+
+    def append_path(self, path, n, m=None, piece="knight", solved=True):
+        self.append(pack_tour(path, n, m, piece, solved))
+
+    def append_result(self, result, n, piece="knight"):
+        self.append(pack_result(result, n, piece))
+
+    def close(self):
+        self._data.close()
+        self._index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class TourStore:
+    '''
+        Read-only, memory-mapped view of a tour container. Records are decoded
+        on demand, so random access does not read the whole file.
+    '''
+
+    def __init__(self, path):
+        self._path = path
+        self._data_file = open(path, "rb")
+        self._data = mmap.mmap(self._data_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version = STORE_HEADER.unpack_from(self._data, 0)
+        if magic != STORE_MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a tour store")
+
+        index_path = f"{path}.idx"
+        if not index_is_current(path):
+            rebuild_index(path)  # Indice perdido o desactualizado
+        self._index_file = open(index_path, "rb")
+        if os.path.getsize(index_path) == 0:
+            self._index = b""  # mmap no admite archivos vacios
+        else:
+            self._index = mmap.mmap(self._index_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self):
+        return len(self._index) // INDEX_ITEM.size
+
+    def offset(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return INDEX_ITEM.unpack_from(self._index, i * INDEX_ITEM.size)[0]
+
+    def __getitem__(self, i):
+        return unpack_tour(self._data, self.offset(i))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def close(self):
+        if isinstance(self._index, mmap.mmap):
+            self._index.close()
+        self._index_file.close()
+        self._data.close()
+        self._data_file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,235 @@
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import os
+import time
+from multiprocessing import resource_tracker
+
+from src.utils.concurrent_backtracking import solveKT_parallel_backtracking
+from src.utils.concurrent_bnb import solveKT_parallel
+from src.utils.concurrent_sat import solveKT_parallel_sat
+from src.utils.shared_state import SharedSweepState
+
+# Servidor local de recorridos: protocolo de lineas JSON sobre asyncio streams.
+#
+# Pedido (una linea):   {"n": 8, "start": [0, 0], "algorithm": "bnb", "deadline": 30}
+# Respuestas (lineas):  {"status": "queued", ...}
+#                       {"status": "running", "elapsed": 1.0, ...}   (cada progress_interval)
+#                       {"status": "done", "result": {...}} | {"status": "error", "error": "..."}
+
+ALGORITHMS = ("backtracking", "bnb", "sat")
+DEFAULT_DEADLINE = 60
+PROGRESS_INTERVAL = 1.0
+COALESCE_SLACK = 1.0  # Segundos de tolerancia para unir pedidos con plazos casi iguales
+RESULT_GRACE = 2.0  # Espera extra del cliente: el solver devuelve su resultado parcial justo al vencer el plazo
+MAX_N = 100  # Tamaño maximo de tablero que se acepta
+
+
+def solve_request(algorithm, n, x_pos, y_pos, timeout, shared_state_name=None):
+    '''
+        Runs inside a pool worker. Dispatches to the same solver functions
+        used by the sweeps and drops the tracking data before pickling.
+        The stop flag of `shared_state_name` cuts the search when every
+        client has left (SAT does not poll it and runs to its timeout).
+    '''
+    if algorithm == "backtracking":
+        result = solveKT_parallel_backtracking(n, x_pos, y_pos, timeout, True, shared_state_name=shared_state_name)
+    elif algorithm == "bnb":
+        result = solveKT_parallel(n, x_pos, y_pos, timeout, shared_state_name=shared_state_name, omit_tracking=True)
+    elif algorithm == "sat":
+        result = solveKT_parallel_sat(n, x_pos, y_pos, timeout)
+    else:
+        raise ValueError(f"Unknown algorithm: {algorithm}")
+    result["Tracking Board"] = None
+    result["Algorithm"] = algorithm
+    return result
+
+
+def _warm_up():
+    # Fuerza el arranque del proceso y la importacion de los solvers
+    return os.getpid()
+
+
+class TourServer:
+    '''
+        Serves knight tours to local clients from a warm process pool.
+
+        Identical in-flight requests (same size, start and algorithm) share a
+        single computation as long as its deadline covers the new request.
+        When every client waiting on a computation has gone, it is cancelled
+        if still queued, or stopped through its shared stop flag.
+    '''
+
+    def __init__(self, host="127.0.0.1", port=8765, workers=None, progress_interval=PROGRESS_INTERVAL):
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1
+        self.progress_interval = progress_interval
+        self._pool = None
+        self._server = None
+        self._in_flight = {}
+
+    async def start(self):
+        loop = asyncio.get_running_loop()
+        # Los procesos heredan el registro de memoria compartida del servidor: un
+        # registro propio daria por perdidos los bloques que el servidor ya libero
+        resource_tracker.ensure_running()
+        self._pool = concurrent.futures.ProcessPoolExecutor(max_workers=self.workers)
+        # Precalentamos todos los procesos antes de aceptar pedidos
+        await asyncio.gather(*[loop.run_in_executor(self._pool, _warm_up) for _ in range(self.workers)])
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+
+    def submit(self, algorithm, n, x_pos, y_pos, deadline):
+        '''
+            Returns the in-flight entry for the request, joining a computation
+            when one with the same key and a late enough deadline exists, and
+            whether it was joined. Every call must be paired with `release`.
+            `deadline` is an absolute time.time() value.
+        '''
+        key = (algorithm, n, x_pos, y_pos)
+        entry = self._in_flight.get(key)
+        if entry is not None and not entry["future"].done() and entry["deadline"] + COALESCE_SLACK >= deadline:
+            entry["waiters"] += 1
+            return entry, True
+
+        timeout = max(0.0, deadline - time.time())
+        shared_state = SharedSweepState(n)  # Solo se usa su bandera de parada
+        task = self._pool.submit(solve_request, algorithm, n, x_pos, y_pos, timeout, shared_state.name)
+        future = asyncio.wrap_future(task)
+        entry = {"key": key, "future": future, "task": task, "shared_state": shared_state, "deadline": deadline, "waiters": 1}
+        self._in_flight[key] = entry
+
+        def _forget(_, entry=entry):
+            self._forget(entry)
+            entry["shared_state"].close()
+
+        future.add_done_callback(_forget)
+        return entry, False
+
+    def _forget(self, entry):
+        if self._in_flight.get(entry["key"]) is entry:
+            del self._in_flight[entry["key"]]
+
+    def release(self, entry):
+        '''
+            A client stops waiting on `entry`. The last one to leave cancels the
+            computation: a queued task is dropped, a running one is asked to stop.
+        '''
+        entry["waiters"] -= 1
+        if entry["waiters"] > 0 or entry["future"].done():
+            return
+        self._forget(entry)  # Nadie nuevo se une a un calculo que se esta cancelando
+        if not entry["task"].cancel():
+            entry["shared_state"].request_stop()
+
+    async def _handle_client(self, reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                await self._handle_request(line, writer)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_request(self, line, writer):
+        async def send(message):
+            writer.write(json.dumps(message).encode() + b"\n")
+            await writer.drain()
+
+        try:
+            request = json.loads(line)
+            n = int(request["n"])
+            x_pos, y_pos = (int(v) for v in request.get("start", (0, 0)))
+            algorithm = request.get("algorithm", "backtracking")
+            deadline = time.time() + float(request.get("deadline", DEFAULT_DEADLINE))
+            if algorithm not in ALGORITHMS:
+                raise ValueError(f"Unknown algorithm: {algorithm}")
+            if not 1 <= n <= MAX_N:
+                raise ValueError(f"Board size must be between 1 and {MAX_N}")
+            if not (0 <= x_pos < n and 0 <= y_pos < n):
+                raise ValueError("Start position outside the board")
+        except (ValueError, KeyError, TypeError) as e:
+            await send({"status": "error", "error": str(e)})
+            return
+
+        start_time = time.time()
+        entry, coalesced = self.submit(algorithm, n, x_pos, y_pos, deadline)
+        try:
+            await send({"status": "queued", "n": n, "start": [x_pos, y_pos], "algorithm": algorithm, "coalesced": coalesced})
+            await self._wait_result(entry["future"], deadline + RESULT_GRACE, start_time, send)
+        finally:
+            self.release(entry)  # Tambien si el cliente se desconecto
+
+    async def _wait_result(self, future, limit, start_time, send):
+        # Reporta progreso hasta que el resultado este listo o venza el plazo (mas la gracia)
+        while True:
+            remaining = limit - time.time()
+            try:
+                result = await asyncio.wait_for(asyncio.shield(future), timeout=max(0.0, min(self.progress_interval, remaining)))
+            except asyncio.TimeoutError:
+                if time.time() >= limit:
+                    await send({"status": "error", "error": "Deadline exceeded"})
+                    return
+                await send({"status": "running", "elapsed": time.time() - start_time})
+                continue
+            except Exception as e:
+                await send({"status": "error", "error": str(e)})
+                return
+            await send({"status": "done", "result": result})
+            return
+
+
+async def request_tour(n, start=(0, 0), algorithm="backtracking", deadline=DEFAULT_DEADLINE, host="127.0.0.1", port=8765):
+    '''
+        Client helper: yields every message the server streams for one request.
+    '''
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        payload = {"n": n, "start": list(start), "algorithm": algorithm, "deadline": deadline}
+        writer.write(json.dumps(payload).encode() + b"\n")
+        await writer.drain()
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            message = json.loads(line)
+            yield message
+            if message["status"] in ("done", "error"):
+                break
+    finally:
+        writer.close()
+
+
+async def _main(host, port, workers):
+    server = await TourServer(host=host, port=port, workers=workers).start()
+    print(f"Sirviendo recorridos en {server.host}:{server.port} con {server.workers} procesos")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local knight's tour server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    asyncio.run(_main(args.host, args.port, args.workers))
@@ -0,0 +1,174 @@
+import os
+import struct
+from array import array
+
+import numpy as np
+
+from src.utils.board_mask import UNVISITED, new_board
+from src.utils.step_stream import BACKTRACK, DONE, PLACE
+
+# Trazas de busqueda grabadas (todas las colocaciones y vueltas atras).
+#
+# "<archivo>":      cabecera TRACE_HEADER + un int32 por paso: el indice de la
+#                   casilla (x * n + y) si es una colocacion, o ~indice si es
+#                   una vuelta atras. El numero de movimiento se deduce de la
+#                   profundidad, no se guarda.
+# "<archivo>.keys": un tablero completo (int32, n * n) cada `interval` pasos;
+#                   el fotograma k es el estado despues de k * interval pasos.
+#
+# Para ir al paso s se toma el fotograma s // interval (O(1)) y se aplican a lo
+# sumo `interval` pasos, vectorizados con NumPy.
+
+TRACE_MAGIC = b"KR"
+VERSION = 1
+TRACE_HEADER = struct.Struct("<2sBBHHI")  # magic, version, flags, n, reserved, interval
+
+FLAG_FINISHED = 1
+FLAG_SOLVED = 2
+
+KEYFRAME_INTERVAL = 4096
+FLUSH_EVERY = 65536  # Pasos acumulados en memoria antes de escribir
+
+
+class TraceRecorder:
+    '''
+        Step stream consumer (called once per StepEvent) that writes a search
+        trace with periodic keyframes. Use as a context manager.
+    '''
+
+    def __init__(self, path, n, blocked=(), interval=KEYFRAME_INTERVAL):
+        self.path = path
+        self.n = n
+        self.interval = interval
+        self.steps = 0
+        self.flags = 0
+        self._board = [value for row in new_board(n, blocked) for value in row]
+        self._depth = 0
+        self._pending = array("i")
+        self._data = open(path, "wb")
+        self._keys = open(f"{path}.keys", "wb")
+        self._data.write(TRACE_HEADER.pack(TRACE_MAGIC, VERSION, 0, n, 0, interval))
+        self._write_keyframe()
+
+    def _write_keyframe(self):
+        self._keys.write(array("i", self._board).tobytes())
+
+    def __call__(self, event):
+        if event.kind == DONE:
+            self.flags = FLAG_FINISHED | (FLAG_SOLVED if event.pos >= 0 else 0)
+            return
+        square = event.x * self.n + event.y
+        if event.kind == PLACE:
+            self._board[square] = self._depth
+            self._depth += 1
+            self._pending.append(square)
+        elif event.kind == BACKTRACK:
+            self._board[square] = UNVISITED
+            self._depth -= 1
+            self._pending.append(~square)
+        self.steps += 1
+        if self.steps % self.interval == 0:
+            self._write_keyframe()
+        if len(self._pending) >= FLUSH_EVERY:
+            self._flush()
+
+    def _flush(self):
+        self._data.write(self._pending.tobytes())
+        self._pending = array("i")
+
+    def close(self):
+        self._flush()
+        self._data.seek(0)
+        self._data.write(TRACE_HEADER.pack(TRACE_MAGIC, VERSION, self.flags, self.n, 0, self.interval))
+        self._data.close()
+        self._keys.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def record_trace(steps, path, n, blocked=(), interval=KEYFRAME_INTERVAL):
+    '''
+        Consumes a whole step stream into a trace file. Returns the number of steps.
+    '''
+    with TraceRecorder(path, n, blocked, interval) as recorder:
+        for event in steps:
+            recorder(event)
+    return recorder.steps
+
+
+class Trace:
+    '''
+        Read-only, memory-mapped search trace. `board_at(step)` returns the
+        board after `step` steps without replaying the trace from the start.
+    '''
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            magic, version, self.flags, self.n, _, self.interval = TRACE_HEADER.unpack(f.read(TRACE_HEADER.size))
+        if magic != TRACE_MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a search trace")
+        cells = self.n * self.n
+        count = (os.path.getsize(path) - TRACE_HEADER.size) // 4
+        self.steps = np.memmap(path, dtype="<i4", mode="r", offset=TRACE_HEADER.size, shape=(count,)) if count else np.zeros(0, dtype="<i4")
+        keyframes = os.path.getsize(f"{path}.keys") // (4 * cells)
+        self.keyframes = np.memmap(f"{path}.keys", dtype="<i4", mode="r", shape=(keyframes, cells))
+
+    def __len__(self):
+        return len(self.steps)
+
+    @property
+    def finished(self):
+        return bool(self.flags & FLAG_FINISHED)
+
+    @property
+    def solved(self):
+        return bool(self.flags & FLAG_SOLVED)
+
+    def board_at(self, step):
+        '''
+            Flat board (int32, n * n) after the first `step` steps.
+        '''
+        step = min(max(step, 0), len(self))
+        keyframe = min(step // self.interval, len(self.keyframes) - 1)
+        board = np.array(self.keyframes[keyframe])
+        start = keyframe * self.interval
+        if step == start:
+            return board
+
+        codes = np.asarray(self.steps[start:step])
+        placing = codes >= 0
+        squares = np.where(placing, codes, ~codes)
+        # Profundidad despues de cada paso; una colocacion recibe profundidad - 1
+        depth = int(np.count_nonzero(board >= 0)) + np.cumsum(np.where(placing, 1, -1))
+        values = np.where(placing, depth - 1, UNVISITED)
+        # Solo cuenta el ultimo paso de cada casilla
+        last = len(squares) - 1 - np.unique(squares[::-1], return_index=True)[1]
+        board[squares[last]] = values[last]
+        return board
+
+    def depth_at(self, step):
+        return int(np.count_nonzero(self.board_at(step) >= 0))
+
+    def piece_at(self, board):
+        '''
+            Square of the deepest placed move on a board from board_at, or None.
+        '''
+        if not np.any(board >= 0):
+            return None
+        return divmod(int(np.argmax(board)), self.n)
+
+    def close(self):
+        # Los memmap se liberan al soltar las referencias
+        self.steps = None
+        self.keyframes = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
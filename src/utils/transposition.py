@@ -0,0 +1,96 @@
+import random
+from array import array
+from collections import OrderedDict
+
+# Tabla de transposicion para el backtracking: guarda estados (casilla actual,
+# conjunto de casillas visitadas) que ya se probaron sin solucion, para no
+# volver a explorarlos cuando se llega a ellos por otro orden de movimientos.
+#
+# La clave es un hash de Zobrist: XOR de una clave aleatoria de 64 bits por
+# casilla visitada, mas la clave de la casilla actual. Se actualiza en O(1)
+# al marcar o desmarcar una casilla.
+
+LRU_ENTRY_BYTES = 100  # Costo aproximado de una entrada en un OrderedDict
+DEPTH_ENTRY_BYTES = 12  # uint64 de clave + uint32 de profundidad
+
+
+class TranspositionTable:
+    '''
+        Bounded set of proven dead states.
+
+        policy="lru" evicts the least recently used entry when full.
+        policy="depth" uses a fixed slot array and keeps, on collision, the
+        entry with the larger remaining depth (the one that saves more work).
+    '''
+
+    def __init__(self, n, max_entries=None, memory_mb=64, policy="lru", seed=0):
+        if policy not in ("lru", "depth"):
+            raise ValueError(f"Unknown replacement policy: {policy}")
+        rng = random.Random(seed)
+        self.square_keys = [rng.getrandbits(64) for _ in range(n * n)]
+        self.current_keys = [rng.getrandbits(64) for _ in range(n * n)]
+        self.policy = policy
+        if max_entries is None:
+            entry_bytes = LRU_ENTRY_BYTES if policy == "lru" else DEPTH_ENTRY_BYTES
+            max_entries = max(1, int(memory_mb * 1024 * 1024) // entry_bytes)
+        self.max_entries = max_entries
+
+        if policy == "lru":
+            self._entries = OrderedDict()
+        else:
+            self._keys = array("Q", [0]) * max_entries
+            self._depths = array("I", [0]) * max_entries  # 0 = casilla libre
+
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    def key(self, visited_hash, x, y, n):
+        return visited_hash ^ self.current_keys[x * n + y]
+
+    def probe(self, key):
+        self.probes += 1
+        if self.policy == "lru":
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True
+            return False
+        slot = key % self.max_entries
+        if self._depths[slot] and self._keys[slot] == key:
+            self.hits += 1
+            return True
+        return False
+
+    def store(self, key, depth):
+        '''
+            Records `key` as a dead state; `depth` is the number of squares
+            still unvisited in that state.
+        '''
+        self.stores += 1
+        if self.policy == "lru":
+            self._entries[key] = depth
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return
+        slot = key % self.max_entries
+        if depth >= self._depths[slot]:
+            self._keys[slot] = key
+            self._depths[slot] = depth
+
+    def __len__(self):
+        if self.policy == "lru":
+            return len(self._entries)
+        return sum(1 for depth in self._depths if depth)
+
+    @property
+    def hit_rate(self):
+        return self.hits / self.probes if self.probes else 0.0
+
+    def stats(self):
+        return {
+            "Transposition Probes": self.probes,
+            "Transposition Hits": self.hits,
+            "Transposition Stores": self.stores,
+            "Transposition Hit Rate": self.hit_rate,
+        }
@@ -0,0 +1,193 @@
+from collections import namedtuple
+
+import numpy as np
+
+from src.utils.board_mask import BLOCKED
+from src.utils.tour_format import TourStore
+
+# Validador vectorizado de recorridos. Trabaja sobre indices de casilla
+# (x * m + y) para poder verificar miles de recorridos de una sola vez.
+
+ValidationResult = namedtuple("ValidationResult", ["valid", "closed", "errors"])
+
+
+def _as_coordinates(path, m):
+    '''
+        (x, y) arrays of a path given as (x, y) pairs or as square indices.
+        Pairs are kept as given, so an off-board pair is not folded onto a real
+        square by x * m + y.
+    '''
+    path = np.asarray(path, dtype=np.int64)
+    if path.ndim == 2:  # Lista de tuplas (x, y)
+        return path, path[:, 0], path[:, 1]
+    x, y = np.divmod(path, m)
+    return path, x, y
+
+
+def _is_knight_move(dx, dy):
+    dx = np.abs(dx)
+    dy = np.abs(dy)
+    return ((dx == 1) & (dy == 2)) | ((dx == 2) & (dy == 1))
+
+
+def _knight_steps(squares, m):
+    '''
+        Boolean mask of legal knight moves between consecutive squares (last axis).
+    '''
+    x, y = np.divmod(squares, m)
+    return _is_knight_move(np.diff(x, axis=-1), np.diff(y, axis=-1))
+
+
+def _is_closed(squares, m):
+    x, y = np.divmod(squares, m)
+    return _is_knight_move(x[..., 0] - x[..., -1], y[..., 0] - y[..., -1])
+
+
+def _path_errors(path, x, y, n, m):
+    errors = []
+    out = (x < 0) | (x >= n) | (y < 0) | (y >= m)
+    for step in np.flatnonzero(out):
+        square = path[step].tolist()  # El valor recibido, no la casilla a la que se doblaria
+        errors.append({"type": "out_of_bounds", "step": int(step), "square": tuple(square) if isinstance(square, list) else square})
+    inside = (x * m + y)[~out]
+
+    counts = np.bincount(inside, minlength=n * m)
+    for square in np.flatnonzero(counts > 1):
+        errors.append({"type": "duplicate", "square": divmod(int(square), m), "count": int(counts[square])})
+    for square in np.flatnonzero(counts == 0):
+        errors.append({"type": "missing", "square": divmod(int(square), m)})
+
+    if len(x) > 1:
+        for step in np.flatnonzero(~_is_knight_move(np.diff(x), np.diff(y))):
+            errors.append({
+                "type": "illegal_move",
+                "step": int(step) + 1,
+                "from": (int(x[step]), int(y[step])),
+                "to": (int(x[step + 1]), int(y[step + 1])),
+            })
+    return errors
+
+
+def validate_path(path, n, m=None, require_closed=False):
+    '''
+        Checks that `path` (list of (x, y) or square indices) visits every square
+        of an n x m board exactly once using only knight moves.
+    '''
+    m = n if m is None else m
+    path, x, y = _as_coordinates(path, m)
+    errors = _path_errors(path, x, y, n, m)
+    closed = bool(len(x) > 1 and _is_knight_move(x[0] - x[-1], y[0] - y[-1]))
+    if require_closed and not closed:
+        errors.append({"type": "not_closed"})
+    return ValidationResult(not errors, closed, errors)
+
+
+def validate_board(board, require_closed=False):
+    '''
+        Validates a board matrix holding the move number of each square
+        ("Final Board" of the sweeps, or `Board.matrix`). Blocked squares
+        (BLOCKED) are holes in the board and are not expected in the tour.
+    '''
+    values = np.asarray(board, dtype=np.int64)
+    n, m = values.shape
+    flat = values.ravel()
+    errors = []
+
+    for square in np.flatnonzero((flat < -1) & (flat != BLOCKED)):  # Marcas de visita repetida (-2) de Board
+        errors.append({"type": "duplicate", "square": divmod(int(square), m), "count": 2})
+    for square in np.flatnonzero(flat == -1):
+        errors.append({"type": "missing", "square": divmod(int(square), m)})
+
+    numbered = np.flatnonzero(flat >= 0)
+    order = numbered[np.argsort(flat[numbered], kind="stable")]
+    numbers = flat[order]
+    expected = np.arange(len(numbers))
+    for step in np.flatnonzero(numbers != expected)[:1]:
+        errors.append({"type": "bad_numbering", "step": int(step), "value": int(numbers[step])})
+
+    if len(order) > 1:
+        for step in np.flatnonzero(~_knight_steps(order, m)):
+            errors.append({
+                "type": "illegal_move",
+                "step": int(step) + 1,
+                "from": divmod(int(order[step]), m),
+                "to": divmod(int(order[step + 1]), m),
+            })
+
+    closed = bool(len(order) == n * m - np.count_nonzero(flat == BLOCKED) and len(order) > 1 and _is_closed(order, m))
+    if require_closed and not closed:
+        errors.append({"type": "not_closed"})
+    return ValidationResult(not errors, closed, errors)
+
+
+def validate_many(tours, n, m=None):
+    '''
+        Validates a batch of full-length tours at once.
+
+        `tours` is a 2D array (tours x squares) of square indices. Returns the
+        boolean arrays (valid, closed); use `validate_path` on the failing rows
+        to get the detailed errors.
+    '''
+    m = n if m is None else m
+    tours = np.asarray(tours, dtype=np.int64)
+    total = n * m
+    if tours.ndim != 2 or tours.shape[1] != total:
+        raise ValueError(f"Expected an array of shape (k, {total})")
+    is_permutation = (np.sort(tours, axis=1) == np.arange(total)).all(axis=1)
+    legal = _knight_steps(tours, m).all(axis=1)
+    closed = _is_closed(tours, m)
+    valid = is_permutation & legal
+    return valid, closed & valid
+
+
+def validate_store(path, chunk_size=4096):
+    '''
+        Re-verifies every tour of a TourStore file. Records are grouped by board
+        size and validated in chunks; returns a list of (index, ValidationResult)
+        for the invalid ones plus the number of closed tours.
+    '''
+    failures = []
+    closed_count = 0
+    with TourStore(path) as store:
+        pending = {}
+
+        def flush(key):
+            nonlocal closed_count
+            indices, rows = pending.pop(key)
+            n, m = key
+            valid, closed = validate_many(np.stack(rows), n, m)
+            closed_count += int(closed.sum())
+            for k in np.flatnonzero(~valid):
+                failures.append((indices[k], validate_path(rows[k], n, m)))
+
+        for i, record in enumerate(store):
+            total = record.n * record.m
+            if len(record.path) != total:
+                failures.append((i, validate_path(np.frombuffer(record.path, dtype=record.path.typecode), record.n, record.m)))
+                continue
+            key = (record.n, record.m)
+            indices, rows = pending.setdefault(key, ([], []))
+            indices.append(i)
+            rows.append(np.frombuffer(record.path, dtype=record.path.typecode))
+            if len(indices) >= chunk_size:
+                flush(key)
+        for key in list(pending):
+            flush(key)
+
+    failures.sort(key=lambda failure: failure[0])
+    return failures, closed_count
+
+
+def validate_results(results):
+    '''
+        Validates the "Final Board" of every successful sweep result.
+        Returns the list of (start, ValidationResult) that failed.
+    '''
+    failures = []
+    for result in results:
+        if not result["Solution Found"]:
+            continue
+        validation = validate_board(result["Final Board"])
+        if not validation.valid:
+            failures.append(((result["Start X"], result["Start Y"]), validation))
+    return failures
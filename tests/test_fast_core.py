@@ -0,0 +1,43 @@
+import pytest
+
+from src.utils import fast_core
+from src.utils.concurrent_backtracking import solveKT_parallel_backtracking
+from src.utils.concurrent_bnb import solveKT_parallel
+
+# fast_core (interpretado o compilado, el que este cargado) contra los solvers
+# recursivos: mismo tablero final y misma cantidad de nodos en todas las
+# casillas iniciales, con y sin semilla. Con presupuesto de nodos la
+# comparacion no depende del tiempo.
+#
+#     python -m pytest tests/test_fast_core.py
+#     python -m src.utils.build_core --check    (lo mismo, despues de compilar)
+
+COMPARED = ("Solution Found", "Explored Nodes", "Final Board")
+SEEDS = (None, 7)
+
+
+def core_differences(solve, n, budget, seed, **options):
+    '''
+        Start squares where the core and the recursive version of `solve`
+        disagree on any of the COMPARED fields.
+    '''
+    differences = []
+    for x in range(n):
+        for y in range(n):
+            slow = solve(n, x, y, None, node_budget=budget, seed=seed, use_core=False, **options)
+            fast = solve(n, x, y, None, node_budget=budget, seed=seed, **options)
+            if any(slow[key] != fast[key] for key in COMPARED):
+                differences.append((x, y))
+    return differences
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("n, budget", [(5, 200_000), (6, 20_000)])
+def test_backtracking_core_matches_recursive(n, budget, seed):
+    assert core_differences(solveKT_parallel_backtracking, n, budget, seed, omit_tracking=True) == [], f"compiled={fast_core.COMPILED}"
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("n", [5, 6, 8, 12])
+def test_bnb_core_matches_recursive(n, seed):
+    assert core_differences(solveKT_parallel, n, 100_000, seed, omit_tracking=True) == [], f"compiled={fast_core.COMPILED}"
@@ -0,0 +1,56 @@
+import os
+
+from src.utils.tour_format import TourStore, TourStoreWriter, squares_to_path
+
+# Caminos cortos distintos entre si; el contenedor no exige recorridos completos.
+PATHS = [[(0, i % 5), (2, (i + 1) % 5), (4, (i + 2) % 5)] for i in range(10)]
+
+
+def write(path, paths):
+    with TourStoreWriter(path) as writer:
+        for tour in paths:
+            writer.append_path(tour, 5, solved=False)
+
+
+def read_all(path):
+    with TourStore(path) as store:
+        return [squares_to_path(record) for record in store]
+
+
+def test_append_reopen_append_random_access(tmp_path):
+    path = str(tmp_path / "tours.kts")
+    write(path, PATHS[:4])
+    write(path, PATHS[4:])
+    with TourStore(path) as store:
+        assert len(store) == len(PATHS)
+        for i in (7, 0, 9, 3, -1):
+            assert squares_to_path(store[i]) == PATHS[i]
+
+
+def test_missing_index_is_rebuilt_before_appending(tmp_path):
+    path = str(tmp_path / "tours.kts")
+    write(path, PATHS[:4])
+    os.remove(f"{path}.idx")
+    write(path, PATHS[4:])
+    assert read_all(path) == PATHS
+
+
+def test_stale_index_is_rebuilt(tmp_path):
+    path = str(tmp_path / "tours.kts")
+    write(path, PATHS[:4])
+    with open(f"{path}.idx", "r+b") as index:
+        index.truncate(8)  # Solo el primer registro
+    write(path, PATHS[4:])
+    assert read_all(path) == PATHS
+
+    with open(f"{path}.idx", "r+b") as index:
+        index.truncate(16)
+    assert read_all(path) == PATHS  # El lector tambien reconcilia
+
+
+def test_truncated_last_record_is_dropped(tmp_path):
+    path = str(tmp_path / "tours.kts")
+    write(path, PATHS[:4])
+    os.truncate(path, os.path.getsize(path) - 2)  # Escritura interrumpida
+    write(path, PATHS[4:])
+    assert read_all(path) == PATHS[:3] + PATHS[4:]
@@ -0,0 +1,54 @@
+from src.utils.validator import validate_path
+
+# Recorrido abierto de 5x5 (Branch and Bound desde (0, 0)) y recorrido cerrado
+# de 6x6 en indices de casilla (x * 6 + y).
+OPEN_5 = [(0, 0), (2, 1), (4, 0), (3, 2), (4, 4), (2, 3), (0, 4), (1, 2), (2, 4), (0, 3), (1, 1), (3, 0), (4, 2),
+          (3, 4), (1, 3), (0, 1), (2, 0), (4, 1), (3, 3), (1, 4), (0, 2), (1, 0), (3, 1), (4, 3), (2, 2)]
+CLOSED_6 = [10, 2, 6, 19, 30, 26, 34, 23, 27, 35, 22, 11, 3, 7, 18, 31, 20, 24,
+            32, 28, 15, 4, 17, 9, 5, 16, 29, 33, 25, 14, 1, 12, 8, 0, 13, 21]
+
+
+def error_types(result):
+    return [error["type"] for error in result.errors]
+
+
+def test_valid_open_tour():
+    assert validate_path(OPEN_5, 5) == (True, False, [])
+
+
+def test_closed_tour():
+    result = validate_path(CLOSED_6, 6, require_closed=True)
+    assert result.valid and result.closed
+
+
+def test_duplicate_square():
+    path = OPEN_5[:-1] + [OPEN_5[0]]
+    result = validate_path(path, 5)
+    assert not result.valid
+    assert {"type": "duplicate", "square": (0, 0), "count": 2} in result.errors
+    assert {"type": "missing", "square": (2, 2)} in result.errors
+
+
+def test_illegal_move():
+    path = OPEN_5[:]
+    path[3], path[4] = path[4], path[3]
+    result = validate_path(path, 5)
+    assert not result.valid
+    assert "illegal_move" in error_types(result)
+
+
+def test_out_of_range_pair_is_not_wrapped():
+    # (0, 5) se doblaria sobre (1, 0) y (1, -1) sobre (0, 4) si se aplanaran antes de verificar
+    for bad, replaced in (((0, 5), (1, 0)), ((1, -1), (0, 4))):
+        path = OPEN_5[:]
+        step = path.index(replaced)
+        path[step] = bad
+        result = validate_path(path, 5)
+        assert not result.valid
+        assert {"type": "out_of_bounds", "step": step, "square": bad} in result.errors
+        assert {"type": "missing", "square": replaced} in result.errors
+
+
+def test_out_of_range_index():
+    result = validate_path(CLOSED_6[:-1] + [36], 6)
+    assert {"type": "out_of_bounds", "step": 35, "square": 36} in result.errors